@@ -0,0 +1,3 @@
+# copyright: (c) 2020 by Jesse Johnson.
+# license: Apache 2.0, see LICENSE for more details.
+"""Provide offline benchmarks for argufy parsers."""
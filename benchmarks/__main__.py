@@ -0,0 +1,57 @@
+# copyright: (c) 2020 by Jesse Johnson.
+# license: Apache 2.0, see LICENSE for more details.
+"""Run argufy benchmarks and report results as JSON."""
+
+import argparse
+import json
+import sys
+import tempfile
+from typing import List, Optional
+
+from benchmarks import core, package, pipe, server  # noqa: F401
+from benchmarks.suite import BENCHMARKS, Config, run
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    """Run benchmarks from the command line."""
+    # NOTE: plain argparse avoids measuring the code under test here
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks', description=__doc__
+    )
+    parser.add_argument(
+        'names', nargs='*', help=f"benchmarks: {', '.join(BENCHMARKS)}"
+    )
+    parser.add_argument('--functions', type=int, default=50)
+    parser.add_argument('--params', type=int, default=5)
+    parser.add_argument(
+        '--style', choices=('numpy', 'google', 'rest'), default='numpy'
+    )
+    parser.add_argument('--untyped', action='store_true')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help='write results to file')
+    ns = parser.parse_args(args)
+
+    with tempfile.TemporaryDirectory(prefix='argufy-bench-') as path:
+        config = Config(
+            functions=ns.functions,
+            params=ns.params,
+            style=ns.style,
+            typed=not ns.untyped,
+            repeat=ns.repeat,
+            path=path,
+        )
+        try:
+            results = run(config, ns.names)
+        except KeyError as err:
+            parser.error(str(err))
+
+    if ns.output:
+        with open(ns.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,312 @@
+# copyright: (c) 2020 by Jesse Johnson.
+# license: Apache 2.0, see LICENSE for more details.
+"""Benchmark parser build, parse, dispatch and help rendering."""
+
+import subprocess  # nosec
+import sys
+from argparse import ArgumentParser
+from argparse import _SubParsersAction as SubParsersAction
+from types import ModuleType
+from typing import Any, Dict, List, Tuple
+
+from argufy import Parser
+from argufy.inspection import get_inspection
+
+from benchmarks.suite import (
+    Config,
+    measure,
+    measure_memory,
+    register,
+    summarize,
+)
+from benchmarks.synth import create_module
+
+IMPORT_SCRIPT = (
+    'import time; start = time.perf_counter(); import argufy; '
+    'print(time.perf_counter() - start)'
+)
+
+BATCH_SIZE = 1000
+CHAIN_LENGTHS = (1, 10, 100)
+ARGV_SIZES = (10000, 100000, 1000000)
+OPTION_COUNTS = (10, 100, 1000)
+
+_modules: Dict[Tuple[Any, ...], ModuleType] = {}
+
+
+def get_module(
+    config: Config, variadic: bool = False, declared: bool = False
+) -> ModuleType:
+    """Get synthesized command module matching benchmark settings."""
+    key = (
+        config.functions,
+        config.params,
+        config.style,
+        config.typed,
+        variadic,
+        declared,
+    )
+    if key not in _modules:
+        name = '_'.join(['bench_commands'] + [str(x) for x in key])
+        module = create_module(
+            name,
+            config.functions,
+            config.params,
+            config.style,
+            config.typed,
+            config.path,
+            variadic=variadic,
+            declared=declared,
+        )
+        assert module is not None  # nosec
+        _modules[key] = module
+    return _modules[key]
+
+
+def get_command_parser(parser: ArgumentParser, name: str) -> ArgumentParser:
+    """Get parser of command, building it when deferred."""
+    action = next(
+        x for x in parser._actions if isinstance(x, SubParsersAction)
+    )
+    if hasattr(action, 'get_parser'):
+        return action.get_parser(name)
+    return action.choices[name]
+
+
+def build_parser(
+    config: Config, lazy_commands: bool = False, variadic: bool = False
+) -> Parser:
+    """Build parser from synthesized command module."""
+    parser = Parser(prog='bench', description='Benchmark commands.')
+    parser.add_commands(
+        get_module(config, variadic), lazy_commands=lazy_commands
+    )
+    return parser
+
+
+def get_args(config: Config) -> List[str]:
+    """Get command line selecting the last command."""
+    args = [f"command-{config.functions - 1}", 'value']
+    # NOTE: second parameter is always a string flag
+    if config.params > 1:
+        args += ['--param1', 'other']
+    return args
+
+
+def reset() -> None:
+    """Clear introspection records shared between parsers."""
+    get_inspection.cache_clear()
+
+
+@register('import')
+def bench_import(config: Config) -> Dict[str, Any]:
+    """Measure import time of argufy in a fresh interpreter."""
+    samples = []
+    for _ in range(config.repeat):
+        output = subprocess.run(  # nosec
+            [sys.executable, '-c', IMPORT_SCRIPT],
+            check=True,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+        ).stdout
+        samples.append(float(output))
+    return {'seconds': summarize(samples)}
+
+
+@register('parser_init')
+def bench_parser_init(config: Config) -> Dict[str, Any]:
+    """Measure construction of an empty parser."""
+    return {
+        'seconds': measure(lambda _: Parser(), config.repeat),
+        'seconds_explicit': measure(
+            lambda _: Parser(prog='bench', description='Benchmark.'),
+            config.repeat,
+        ),
+    }
+
+
+@register('add_commands')
+def bench_add_commands(config: Config) -> Dict[str, Any]:
+    """Measure adding synthesized commands to a parser."""
+    module = get_module(config)
+    declared = get_module(config, declared=True)
+
+    def setup(**kwargs: Any) -> Parser:
+        reset()
+        return Parser(
+            prog='bench', description='Benchmark commands.', **kwargs
+        )
+
+    return {
+        'seconds': measure(
+            lambda x: x.add_commands(module), config.repeat, setup
+        ),
+        'seconds_lazy': measure(
+            lambda x: x.add_commands(module, lazy_commands=True),
+            config.repeat,
+            setup,
+        ),
+        'seconds_lazy_help': measure(
+            lambda x: x.add_commands(module),
+            config.repeat,
+            lambda: setup(lazy_help=True),
+        ),
+        'seconds_pinned_style': measure(
+            lambda x: x.add_commands(module),
+            config.repeat,
+            lambda: setup(docstring_style=config.style),
+        ),
+        'seconds_scan': measure(
+            lambda x: x.add_commands(module),
+            config.repeat,
+            lambda: setup(docstring_style='scan'),
+        ),
+        'seconds_registry': measure(
+            lambda x: x.add_commands(declared), config.repeat, setup
+        ),
+    }
+
+
+@register('parse')
+def bench_parse(config: Config) -> Dict[str, Any]:
+    """Measure parsing the command line of a command."""
+    parser = build_parser(config)
+    compiled = build_parser(config)
+    compiled.parse_engine = 'compiled'
+    args = get_args(config)
+    return {
+        'seconds_parse_known_args': measure(
+            lambda _: parser.parse_known_args(args), config.repeat
+        ),
+        'seconds_compiled': measure(
+            lambda _: compiled.parse_known_args(args), config.repeat
+        ),
+        'seconds_retrieve': measure(
+            lambda _: parser.retrieve(args), config.repeat
+        ),
+    }
+
+
+@register('dispatch')
+def bench_dispatch(config: Config) -> Dict[str, Any]:
+    """Measure parsing and calling a command."""
+    args = get_args(config)
+    parser = build_parser(config)
+
+    def setup() -> Parser:
+        reset()
+        return build_parser(config, lazy_commands=True)
+
+    return {
+        'seconds': measure(lambda _: parser.dispatch(args), config.repeat),
+        'seconds_cold': measure(
+            lambda x: x.dispatch(args), config.repeat, setup
+        ),
+    }
+
+
+@register('help')
+def bench_help(config: Config) -> Dict[str, Any]:
+    """Measure rendering help and usage messages."""
+    parser = build_parser(config)
+    name = f"command-{config.functions - 1}"
+    command = get_command_parser(parser, name)
+
+    def source_help() -> str:
+        reset()
+        # NOTE: dotted paths are read from source instead of the module
+        source = Parser(prog='bench', description='Benchmark commands.')
+        source.add_commands(get_module(config).__name__)
+        return get_command_parser(source, name).format_help()
+
+    return {
+        'seconds_help': measure(lambda _: parser.format_help(), config.repeat),
+        'seconds_usage': measure(
+            lambda _: parser.format_usage(), config.repeat
+        ),
+        'seconds_command_help': measure(
+            lambda _: command.format_help(), config.repeat
+        ),
+        'seconds_help_uncached': measure(
+            lambda _: parser.format_help(),
+            config.repeat,
+            setup=parser.help_cache.clear,
+        ),
+        'seconds_source_help': measure(lambda _: source_help(), config.repeat),
+    }
+
+
+@register('memory')
+def bench_memory(config: Config) -> Dict[str, Any]:
+    """Measure memory allocated to build a parser and dispatch a command."""
+    args = get_args(config)
+    get_module(config)
+
+    def build(lazy_commands: bool = False) -> None:
+        reset()
+        build_parser(config, lazy_commands).dispatch(args)
+
+    return {
+        'bytes': measure_memory(build),
+        'bytes_lazy': measure_memory(lambda: build(lazy_commands=True)),
+    }
+
+
+@register('batch')
+def bench_batch(config: Config) -> Dict[str, Any]:
+    """Measure dispatching many command lines through one parser."""
+    parser = build_parser(config)
+    lines = [' '.join(get_args(config))] * BATCH_SIZE
+    return {
+        'lines': BATCH_SIZE,
+        'seconds': measure(
+            lambda _: parser.dispatch_batch(lines), config.repeat
+        ),
+    }
+
+
+@register('chain')
+def bench_chain(config: Config) -> Dict[str, Any]:
+    """Measure parsing and dispatching chains of commands."""
+    parser = build_parser(config)
+    args = [f"command-{config.functions - 1}", 'value']
+    return {
+        f"seconds_{length}": measure(
+            lambda _: parser.dispatch(args * length), config.repeat
+        )
+        for length in CHAIN_LENGTHS
+    }
+
+
+@register('argv')
+def bench_argv(config: Config) -> Dict[str, Any]:
+    """Measure dispatching commands with very long variadic command lines."""
+    parser = build_parser(config, variadic=True)
+    args = get_args(config)
+    # NOTE: options precede the values the same as xargs command lines
+    options = args[:1] + args[2:]
+    return {
+        f"seconds_{size}": measure(
+            parser.dispatch,
+            config.repeat,
+            setup=lambda: options + [f"value{x}" for x in range(size)],
+        )
+        for size in ARGV_SIZES
+    }
+
+
+@register('options')
+def bench_options(config: Config) -> Dict[str, Any]:
+    """Measure matching flags of commands with many options."""
+
+    def parse(count: int) -> Dict[str, float]:
+        wide = Config(1, count, config.style, config.typed, path=config.path)
+        parser = build_parser(wide)
+        # NOTE: negative values are matched against options before they
+        # are known to be values, the same as abbreviations
+        args = ['command-0', 'value']
+        for index in range(3, count, 5):
+            args += [f"--param{index}", '-1.5']
+        return measure(lambda _: parser.parse_known_args(args), config.repeat)
+
+    return {f"seconds_{count}": parse(count) for count in OPTION_COUNTS}
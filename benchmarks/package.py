@@ -0,0 +1,51 @@
+# copyright: (c) 2020 by Jesse Johnson.
+# license: Apache 2.0, see LICENSE for more details.
+"""Benchmark adding package trees and descending into one command."""
+
+import os
+import tempfile
+from functools import partial
+from typing import Any, Dict, List, Optional
+
+from argufy import Parser, SpecCache
+from argufy.inspection import get_inspection
+
+from benchmarks.suite import Config, measure, register
+from benchmarks.synth import create_package, generate_source
+
+# NOTE: trees are ten by ten packages with modules at the bottom
+PACKAGES = 10
+TREE_SIZES = (1000, 5000)
+FUNCTIONS = 5
+
+
+def parse(cache: Optional[SpecCache], name: str, args: List[str]) -> None:
+    """Add package to a new parser then parse the command line."""
+    get_inspection.cache_clear()
+    parser = Parser(prog='bench', spec_cache=cache)
+    parser.add_package(name)
+    parser.parse_known_args(args)
+
+
+@register('package')
+def bench_package(config: Config) -> Dict[str, Any]:
+    """Measure parsing a command of a module deep in a package tree."""
+    path = config.path or tempfile.mkdtemp(prefix='argufy-bench-')
+    source = generate_source(
+        FUNCTIONS, config.params, config.style, config.typed
+    )
+    args = ['package0', 'package0', 'module0', f"command-{FUNCTIONS - 1}"]
+    args += ['value']
+    results = {}
+    for size in TREE_SIZES:
+        name = f"bench_package_{size}"
+        create_package(name, PACKAGES, size // PACKAGES**2, source, path)
+        # NOTE: index of discovered modules is stored by the first run
+        cache = SpecCache(os.path.join(path, f"{name}_cache"))
+        Parser(spec_cache=cache).add_package(name)
+        run = partial(parse, name=name, args=args)
+        results[f"seconds_{size}"] = measure(run, config.repeat)
+        results[f"seconds_indexed_{size}"] = measure(
+            run, config.repeat, setup=lambda: cache
+        )
+    return results
@@ -0,0 +1,59 @@
+# copyright: (c) 2020 by Jesse Johnson.
+# license: Apache 2.0, see LICENSE for more details.
+"""Benchmark throughput of command output written to a pipe."""
+
+import subprocess  # nosec
+import sys
+from typing import Any, Dict, List
+
+from benchmarks.suite import Config, register, summarize
+
+# NOTE: lines resemble JSONL records emitted by commands
+LINE_SIZE = 100
+LINE_COUNT = 200000
+CHUNK_SIZE = 1 << 16
+
+WRITE_SCRIPT = '''
+import sys, time
+{imports}
+line = 'x' * {size} + '\\n'
+start = time.perf_counter()
+for _ in range({count}):
+    sys.stdout.write(line)
+sys.stdout.flush()
+sys.stderr.write(str(time.perf_counter() - start))
+'''
+
+
+def write_to_pipe(imports: str) -> float:
+    """Time writing lines from a fresh interpreter into a pipe."""
+    process = subprocess.Popen(  # nosec
+        [
+            sys.executable,
+            '-c',
+            WRITE_SCRIPT.format(
+                imports=imports, size=LINE_SIZE - 1, count=LINE_COUNT
+            ),
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    assert process.stdout is not None and process.stderr is not None  # nosec
+    while process.stdout.read(CHUNK_SIZE):
+        pass
+    seconds = float(process.stderr.read())
+    process.wait()
+    return seconds
+
+
+@register('pipe')
+def bench_pipe(config: Config) -> Dict[str, Any]:
+    """Measure pipe throughput with and without argufy imported."""
+    results: Dict[str, Any] = {'bytes': LINE_SIZE * LINE_COUNT}
+    for name, imports in (('baseline', ''), ('argufy', 'import argufy')):
+        samples: List[float] = [
+            write_to_pipe(imports) for _ in range(config.repeat)
+        ]
+        results[f"seconds_{name}"] = summarize(samples)
+        results[f"throughput_{name}"] = results['bytes'] / min(samples)
+    return results
@@ -0,0 +1,77 @@
+# copyright: (c) 2020 by Jesse Johnson.
+# license: Apache 2.0, see LICENSE for more details.
+"""Benchmark latency of commands sent to a warm server."""
+
+import io
+import os
+import subprocess  # nosec
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+from argufy import client
+
+from benchmarks.core import get_args, get_module
+from benchmarks.suite import Config, measure, register, summarize
+
+SCRIPT = '''
+import sys
+sys.path.insert(0, {path!r})
+from argufy import Parser
+parser = Parser(prog='bench', description='Benchmark commands.')
+parser.add_commands({module!r})
+{action}
+'''
+
+
+def get_script(config: Config, action: str) -> str:
+    """Get script building parser of synthesized module."""
+    module = get_module(config)
+    return SCRIPT.format(
+        path=os.path.dirname(str(module.__file__)),
+        module=module.__name__,
+        action=action,
+    )
+
+
+@register('server')
+def bench_server(config: Config) -> Dict[str, Any]:
+    """Measure invocations through a warm server against fresh processes."""
+    args = get_args(config)
+    samples: List[float] = []
+    for _ in range(config.repeat):
+        start = time.perf_counter()
+        subprocess.run(  # nosec
+            [
+                sys.executable,
+                '-c',
+                get_script(config, f"parser.dispatch({args!r})"),
+            ],
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        samples.append(time.perf_counter() - start)
+
+    with tempfile.TemporaryDirectory(prefix='argufy-bench-') as path:
+        socket = os.path.join(path, 'bench.sock')
+        server = subprocess.Popen(  # nosec
+            [
+                sys.executable,
+                '-c',
+                get_script(config, f"parser.serve({socket!r})"),
+            ]
+        )
+        try:
+            while not os.path.exists(socket):
+                if server.poll() is not None:
+                    raise RuntimeError('benchmark server exited')
+                time.sleep(0.01)
+            seconds = measure(
+                lambda _: client.run(socket, args, stdout=io.BytesIO()),
+                config.repeat,
+            )
+        finally:
+            server.terminate()
+            server.wait()
+    return {'seconds_process': summarize(samples), 'seconds_server': seconds}
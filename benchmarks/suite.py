@@ -0,0 +1,170 @@
+# copyright: (c) 2020 by Jesse Johnson.
+# license: Apache 2.0, see LICENSE for more details.
+"""Register, time and report benchmarks."""
+
+import gc
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+Benchmark = Callable[['Config'], Dict[str, Any]]
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+class Config:
+    """Provide size of synthesized modules and timing settings."""
+
+    def __init__(
+        self,
+        functions: int = 50,
+        params: int = 5,
+        style: str = 'numpy',
+        typed: bool = True,
+        repeat: int = 5,
+        path: Optional[str] = None,
+    ) -> None:
+        """Initialize benchmark settings.
+
+        Parameters
+        ----------
+        functions: int
+            Number of command functions per synthesized module.
+        params: int
+            Number of parameters per command function.
+        style: str
+            Docstring style of the functions: numpy, google or rest.
+        typed: bool
+            Annotate parameters with types.
+        repeat: int
+            Number of timed runs of each measurement.
+        path: str, optional
+            Directory used to write synthesized modules.
+
+        """
+        self.functions = functions
+        self.params = params
+        self.style = style
+        self.typed = typed
+        self.repeat = repeat
+        self.path = path
+
+    def dump(self) -> Dict[str, Any]:
+        """Describe benchmark settings."""
+        return {
+            'functions': self.functions,
+            'params': self.params,
+            'style': self.style,
+            'typed': self.typed,
+            'repeat': self.repeat,
+        }
+
+
+def register(name: str) -> Callable[[Benchmark], Benchmark]:
+    """Register benchmark under name."""
+
+    def decorator(fn: Benchmark) -> Benchmark:
+        BENCHMARKS[name] = fn
+        return fn
+
+    return decorator
+
+
+def summarize(samples: Sequence[float]) -> Dict[str, float]:
+    """Summarize timing samples in seconds."""
+    return {
+        'min': min(samples),
+        'median': statistics.median(samples),
+        'mean': statistics.mean(samples),
+        'max': max(samples),
+    }
+
+
+def measure(
+    fn: Callable[[Any], Any],
+    repeat: int,
+    setup: Optional[Callable[[], Any]] = None,
+) -> Dict[str, float]:
+    """Time function, passing it a fresh value from setup on each run.
+
+    Parameters
+    ----------
+    fn: Callable
+        Function being timed.
+    repeat: int
+        Number of timed runs.
+    setup: Callable, optional
+        Untimed function providing the argument of each run.
+
+    Returns
+    -------
+    Dict[str, float]:
+        Summary of the timing samples in seconds.
+
+    """
+    samples: List[float] = []
+    for _ in range(repeat):
+        value = setup() if setup else None
+        # NOTE: collection pauses would otherwise land in random samples
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            fn(value)
+            samples.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return summarize(samples)
+
+
+def measure_memory(fn: Callable[[], Any]) -> Dict[str, int]:
+    """Trace memory allocated while calling function."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'current': current, 'peak': peak}
+
+
+def run(
+    config: Config, names: Optional[Sequence[str]] = None
+) -> Dict[str, Any]:
+    """Run benchmarks and collect machine-readable results.
+
+    Parameters
+    ----------
+    config: Config
+        Benchmark settings.
+    names: Sequence[str], optional
+        Benchmarks to be run, otherwise all registered benchmarks.
+
+    Returns
+    -------
+    Dict[str, Any]:
+        Environment, settings and results of each benchmark.
+
+    """
+    from argufy import __version__
+
+    selected = list(names or BENCHMARKS)
+    unknown = [x for x in selected if x not in BENCHMARKS]
+    if unknown:
+        raise KeyError(f"unknown benchmarks: {', '.join(unknown)}")
+    return {
+        'meta': {
+            'argufy': __version__,
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'executable': sys.executable,
+            'timestamp': time.time(),
+        },
+        'config': config.dump(),
+        'results': {x: BENCHMARKS[x](config) for x in selected},
+    }
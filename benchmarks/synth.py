@@ -0,0 +1,188 @@
+# copyright: (c) 2020 by Jesse Johnson.
+# license: Apache 2.0, see LICENSE for more details.
+"""Synthesize command modules of configurable size."""
+
+import importlib
+import os
+import sys
+import tempfile
+from types import ModuleType
+from typing import List, Optional
+
+TYPES = ('str', 'int', 'float', 'bool', 'list')
+DEFAULTS = {'str': "'x'", 'int': '0', 'float': '0.0', 'bool': 'False'}
+DEFAULTS['list'] = '[]'
+
+
+def _get_docstring(index: int, types: List[str], style: str) -> str:
+    """Generate docstring of command in requested style."""
+    lines = [f"Run command {index}.", '']
+    if style == 'numpy':
+        lines += ['Parameters', '----------']
+        for i, kind in enumerate(types):
+            lines += [f"param{i}: {kind}", f"    Value of param {i}."]
+    elif style == 'google':
+        lines += ['Args:']
+        for i, kind in enumerate(types):
+            lines += [f"    param{i} ({kind}): Value of param {i}."]
+    elif style == 'rest':
+        for i, kind in enumerate(types):
+            lines += [f":param param{i}: Value of param {i}."]
+            lines += [f":type param{i}: {kind}"]
+    else:
+        raise ValueError(f"unknown docstring style: {style}")
+    body = '\n    '.join(lines)
+    return f'    """{body}\n\n    """'
+
+
+def generate_source(
+    functions: int,
+    params: int,
+    style: str = 'numpy',
+    typed: bool = True,
+    variadic: bool = False,
+    declared: bool = False,
+) -> str:
+    """Generate source of command module.
+
+    Parameters
+    ----------
+    functions: int
+        Number of command functions.
+    params: int
+        Number of parameters per function.
+    style: str
+        Docstring style of the functions: numpy, google or rest.
+    typed: bool
+        Annotate parameters with types.
+    variadic: bool
+        Make the positional parameter take any number of values.
+    declared: bool
+        Declare the functions as commands with the decorator.
+
+    Returns
+    -------
+    str:
+        Source of the command module.
+
+    """
+    source = ['"""Synthesized command module."""', '']
+    if declared:
+        source += ['import argufy', '']
+    for index in range(functions):
+        # NOTE: first parameter is positional, the rest are flags
+        types = ['str'] + [TYPES[i % len(TYPES)] for i in range(params - 1)]
+        args = []
+        for i, kind in enumerate(types[:params]):
+            star = '*' if variadic and not i else ''
+            annotation = f": {kind}" if typed else ''
+            default = f" = {DEFAULTS[kind]}" if i else ''
+            args.append(f"{star}param{i}{annotation}{default}")
+        source += ['', '@argufy.command'] if declared else ['']
+        source += [
+            f"def command_{index}({', '.join(args)}):",
+            _get_docstring(index, types[:params], style),
+            '    return param0',
+            '',
+        ]
+    return '\n'.join(source)
+
+
+def create_module(
+    name: str,
+    functions: int,
+    params: int,
+    style: str = 'numpy',
+    typed: bool = True,
+    path: Optional[str] = None,
+    load: bool = True,
+    variadic: bool = False,
+    declared: bool = False,
+) -> Optional[ModuleType]:
+    """Write command module to disk and optionally import it.
+
+    Parameters
+    ----------
+    name: str
+        Name of the module.
+    functions: int
+        Number of command functions.
+    params: int
+        Number of parameters per function.
+    style: str
+        Docstring style of the functions: numpy, google or rest.
+    typed: bool
+        Annotate parameters with types.
+    path: str, optional
+        Directory added to the import path that holds the module.
+    load: bool
+        Import the module after writing it.
+    variadic: bool
+        Make the positional parameter take any number of values.
+    declared: bool
+        Declare the functions as commands with the decorator.
+
+    Returns
+    -------
+    Optional[ModuleType]:
+        Imported module when requested.
+
+    """
+    path = path or tempfile.mkdtemp(prefix='argufy-bench-')
+    with open(os.path.join(path, f"{name}.py"), 'w', encoding='utf-8') as f:
+        f.write(
+            generate_source(
+                functions, params, style, typed, variadic, declared
+            )
+        )
+    if path not in sys.path:
+        sys.path.insert(0, path)
+    importlib.invalidate_caches()
+    sys.modules.pop(name, None)
+    return importlib.import_module(name) if load else None
+
+
+def create_package(
+    name: str, packages: int, modules: int, source: str, path: str
+) -> None:
+    """Write package tree two levels deep to disk without importing it.
+
+    Parameters
+    ----------
+    name: str
+        Name of the root package.
+    packages: int
+        Number of subpackages of each package above the modules.
+    modules: int
+        Number of modules in each package at the bottom of the tree.
+    source: str
+        Source of every module.
+    path: str
+        Directory added to the import path that holds the package.
+
+    """
+
+    def write(directory: str, module: str, text: str) -> None:
+        with open(
+            os.path.join(directory, f"{module}.py"), 'w', encoding='utf-8'
+        ) as f:
+            f.write(text)
+
+    for outer in range(packages):
+        for inner in range(packages):
+            directory = os.path.join(
+                path, name, f"package{outer}", f"package{inner}"
+            )
+            os.makedirs(directory)
+            write(directory, '__init__', '"""Synthesized package."""\n')
+            for index in range(modules):
+                write(directory, f"module{index}", source)
+        write(
+            os.path.join(path, name, f"package{outer}"),
+            '__init__',
+            '"""Synthesized package."""\n',
+        )
+    write(os.path.join(path, name), '__init__', '"""Synthesized package."""\n')
+    if path not in sys.path:
+        sys.path.insert(0, path)
+    importlib.invalidate_caches()
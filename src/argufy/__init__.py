@@ -5,9 +5,12 @@
 import logging
 from typing import List
 
-from argufy.argument import Argument  # noqa
+from argufy.argument import Argument, ArgumentSpec  # noqa
+from argufy.cache import SpecCache  # noqa
 from argufy.formatter import ArgufyHelpFormatter  # noqa
 from argufy.parser import Parser  # noqa
+from argufy.registry import command  # noqa
+from argufy.stream import NulStream, Stream  # noqa
 
 __author__ = 'Jesse P. Johnson'
 __author_email__ = 'jpj6652@gmail.com'
@@ -16,6 +19,15 @@ __description__ = 'Inspection based parser built on argparse.'
 __version__ = '0.1.2b3'
 __license__ = 'Apache-2.0'
 __copyright__ = 'Copyright 2020 Jesse Johnson.'
-__all__: List[str] = ['Argument', 'ArgufyHelpFormatter', 'Parser']
+__all__: List[str] = [
+    'Argument',
+    'ArgumentSpec',
+    'ArgufyHelpFormatter',
+    'NulStream',
+    'Parser',
+    'SpecCache',
+    'command',
+    'Stream',
+]
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
@@ -0,0 +1,16 @@
+# copyright: (c) 2020 by Jesse Johnson.
+# license: Apache 2.0, see LICENSE for more details.
+"""Provide build tools for argufy based CLIs."""
+
+from argufy import Parser, __version__, cli
+
+
+def main() -> None:
+    """Do main function for argufy tools."""
+    parser = Parser(prog='argufy', version=__version__, batch=True)
+    parser.add_commands(cli)
+    parser.dispatch()
+
+
+if __name__ == '__main__':
+    main()
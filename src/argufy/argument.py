@@ -3,29 +3,231 @@
 """Arguments for inspection based CLI parser."""
 
 # import logging
+import collections.abc
 import re
 import typing
 from ast import literal_eval
 from inspect import Parameter
 from inspect import _empty as empty
 from pydoc import locate
-from typing import Any, List, Optional, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from docstring_parser.common import DocstringParam
 
+from argufy.stream import Stream
+
+
+def list_item(value: str) -> Any:
+    """Convert list item to integer when it is a digit."""
+    return int(value) if value.isdigit() else value
+
+
+def _freeze(value: Any) -> Any:
+    """Get hashable equivalent of argument value."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(x) for x in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(x) for x in value)
+    if isinstance(value, dict):
+        return tuple((k, _freeze(v)) for k, v in value.items())
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+class ArgumentSpec:
+    """Provide immutable argparse parameters of an argument."""
+
+    # NOTE: kwargs are passed to argparse in this order when they are set
+    fields = (
+        'action',
+        'choices',
+        'default',
+        'help',
+        'metavar',
+        'nargs',
+        'type',
+    )
+    __slots__ = ('name',) + fields
+
+    name: Tuple[str, ...]
+    action: Any
+    choices: Any
+    default: Any
+    help: Any
+    metavar: Any
+    nargs: Any
+    type: Any
+
+    def __init__(self, name: Tuple[str, ...], **kwargs: Any) -> None:
+        """Initialize argument spec.
+
+        Parameters
+        ----------
+        name: Tuple[str, ...]
+            Name, or flags, of the argument.
+        kwargs: Any
+            Parameters passed to argparse add_argument.
+
+        """
+        unknown = set(kwargs).difference(ArgumentSpec.fields)
+        if unknown:
+            raise TypeError(f"unknown argument parameters: {sorted(unknown)}")
+        object.__setattr__(self, 'name', tuple(name))
+        for field in ArgumentSpec.fields:
+            object.__setattr__(self, field, kwargs.get(field, empty))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Prevent changes to argument spec."""
+        raise AttributeError(f"argument spec is immutable: {name}")
+
+    def __delattr__(self, name: str) -> None:
+        """Prevent changes to argument spec."""
+        raise AttributeError(f"argument spec is immutable: {name}")
+
+    @property
+    def kwargs(self) -> Dict[str, Any]:
+        """Get parameters passed to argparse add_argument."""
+        return {
+            k: getattr(self, k)
+            for k in ArgumentSpec.fields
+            if getattr(self, k) is not empty
+        }
+
+    def replace(self, **changes: Any) -> 'ArgumentSpec':
+        """Get copy of argument spec with parameters changed."""
+        name = changes.pop('name', self.name)
+        return ArgumentSpec(name, **{**self.kwargs, **changes})
+
+    def __iter__(self) -> Iterator[Any]:
+        """Unpack spec into names and argparse parameters."""
+        return iter((list(self.name), self.kwargs))
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare argument specs."""
+        if not isinstance(other, ArgumentSpec):
+            return NotImplemented
+        return all(
+            getattr(self, x) == getattr(other, x)
+            for x in ArgumentSpec.__slots__
+        )
+
+    def __hash__(self) -> int:
+        """Get hash of argument spec."""
+        return hash(
+            tuple(_freeze(getattr(self, x)) for x in ArgumentSpec.__slots__)
+        )
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Serialize argument spec for pickle and copy."""
+        return (_load_spec, (self.name, self.kwargs))
+
+    def __repr__(self) -> str:
+        """Get representation of argument spec."""
+        kwargs = ''.join(f", {k}={v!r}" for k, v in self.kwargs.items())
+        return f"ArgumentSpec({self.name!r}{kwargs})"
+
+
+def _load_spec(name: Tuple[str, ...], kwargs: Dict[str, Any]) -> ArgumentSpec:
+    """Create argument spec from its serialized parameters."""
+    return ArgumentSpec(name, **kwargs)
+
+
+class ShortFlags:
+    """Allocate short flags to the options of one parser."""
+
+    strategies = ('case', 'letters', 'none')
+    __slots__ = ('strategy', 'taken')
+
+    def __init__(
+        self, strategy: str = 'case', reserved: Iterable[str] = ('h',)
+    ) -> None:
+        """Initialize short flag allocator.
+
+        Parameters
+        ----------
+        strategy: str
+            Resolve collisions by trying the first letter then its
+            uppercase with 'case', every letter of the name in turn with
+            'letters', or never allocate short flags with 'none'.
+        reserved: Iterable[str]
+            Letters already used by flags of the parser.
+
+        """
+        if strategy not in ShortFlags.strategies:
+            raise ValueError(f"unknown short flag strategy: {strategy}")
+        self.strategy = strategy
+        self.taken: Set[str] = set(reserved)
+
+    def __get_candidates(self, name: str) -> Iterator[str]:
+        """Get letters that may be used as short flag, in order."""
+        if self.strategy == 'case':
+            yield name[:1]
+            yield name[:1].upper()
+        elif self.strategy == 'letters':
+            for letter in name:
+                if letter.isalpha():
+                    yield letter.lower()
+                    yield letter.upper()
+
+    def allocate(self, name: str) -> Optional[str]:
+        """Get an unused short flag for option name.
+
+        Parameters
+        ----------
+        name: str
+            Long name of the option without prefix.
+
+        Returns
+        -------
+        Optional[str]:
+            Short flag, or None when every candidate is taken.
+
+        """
+        for letter in self.__get_candidates(name):
+            if letter not in self.taken:
+                self.taken.add(letter)
+                return f"-{letter}"
+        return None
+
 
 class Argument:  # pylint: disable=too-many-instance-attributes
     """Represent argparse arguments."""
 
-    __short_flags: List[str] = ['-h']
+    __slots__ = (
+        '__short_flags',
+        '__name',
+        '__type',
+        '__metavar',
+        '__action',
+        '__choices',
+        '__nargs',
+        '__default',
+        '__help',
+    )
 
     def __init__(
         self,
         docstring: Optional[DocstringParam] = None,
         parameters: Optional[Parameter] = None,
+        short_flags: Optional[ShortFlags] = None,
     ) -> None:
         """Initialize argparse argument."""
         # self.attributes: Dict[Any, Any] = {}
+        # NOTE: arguments of the same parser must share the allocator
+        self.__short_flags = short_flags or ShortFlags()
 
         # set parameter default
         if parameters:
@@ -92,6 +294,18 @@ class Argument:  # pylint: disable=too-many-instance-attributes
             ):
                 self.type = locate(docstring.type_name)
 
+    @property
+    def spec(self) -> ArgumentSpec:
+        """Get immutable argparse parameters of argument."""
+        kwargs = {}
+        for field in ArgumentSpec.fields:
+            try:
+                kwargs[field] = getattr(self, field)
+            except AttributeError:
+                continue
+        # NOTE: arguments from keywords are named by the parser
+        return ArgumentSpec(getattr(self, 'name', ()), **kwargs)
+
     @property
     def name(self) -> List[str]:
         """Get argparse command/argument name."""
@@ -119,13 +333,9 @@ class Argument:  # pylint: disable=too-many-instance-attributes
             # NOTE: check for conflicting flags
             if '-' not in name:
                 # TODO: check if common short flag (ex: version)
-                n = name[:1]
-                if n not in Argument.__short_flags:
-                    Argument.__short_flags.append(n)
-                    flags.insert(0, f"-{n}")
-                elif n.upper() not in Argument.__short_flags:
-                    Argument.__short_flags.append(n.upper())
-                    flags.insert(0, f"-{n.upper()}")
+                flag = self.__short_flags.allocate(name)
+                if flag:
+                    flags.insert(0, flag)
             self.__name = flags
 
     @property
@@ -148,7 +358,7 @@ class Argument:  # pylint: disable=too-many-instance-attributes
             self.__type = annotation
             self.action = 'append'
         elif annotation == list:
-            self.__type = lambda v: int(v) if v.isdigit() else v
+            self.__type = list_item
             self.action = 'append'
         elif annotation == tuple:
             self.__type = annotation
@@ -156,6 +366,14 @@ class Argument:  # pylint: disable=too-many-instance-attributes
         elif annotation == set:
             self.__type = annotation
             self.nargs = '+'
+        elif isinstance(annotation, type) and issubclass(annotation, Stream):
+            # NOTE: values are read lazily from the file given as argument
+            self.__type = annotation
+        elif annotation in (
+            collections.abc.Iterator,
+            collections.abc.Iterable,
+        ):
+            self.__type = Stream
         else:
             # log.debug('unmatched annotation:', annotation)
             self.__type = annotation
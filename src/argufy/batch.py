@@ -0,0 +1,108 @@
+# copyright: (c) 2020 by Jesse Johnson.
+# license: Apache 2.0, see LICENSE for more details.
+"""Dispatch many command lines through one parser."""
+
+import json
+import shlex
+import sys
+from argparse import SUPPRESS, Action, ArgumentParser, Namespace
+from typing import IO, Any, Iterator, List, Optional, Sequence, Union
+
+LINE_FORMATS = ('shell', 'nul', 'json')
+
+
+def split_line(line: str, line_format: Optional[str] = None) -> List[str]:
+    """Split command line into arguments.
+
+    Parameters
+    ----------
+    line: str
+        Command line read from a batch.
+    line_format: str, optional
+        Encoding of the line: 'shell' quoted, 'nul' separated, or 'json'
+        array. Detected from the line when not provided.
+
+    Returns
+    -------
+    List[str]:
+        Arguments of the command line, empty for blank lines and comments.
+
+    """
+    line = line.rstrip('\r\n')
+    if line_format is None:
+        if line.lstrip().startswith('['):
+            line_format = 'json'
+        elif '\0' in line:
+            line_format = 'nul'
+        else:
+            line_format = 'shell'
+
+    if line_format == 'shell':
+        return shlex.split(line, comments=True)
+    if line_format == 'nul':
+        # NOTE: arguments may be terminated, rather than separated, by NUL
+        args = line.split('\0')
+        return args[:-1] if args[-1] == '' else args
+    if line_format == 'json':
+        if not line.strip():
+            return []
+        args = json.loads(line)
+        if not isinstance(args, list) or not all(
+            isinstance(x, str) for x in args
+        ):
+            raise ValueError('command line is not an array of strings')
+        return args
+    raise ValueError(f"unknown line format: {line_format}")
+
+
+def read_lines(source: Union[str, IO[str], Sequence[str]]) -> Iterator[str]:
+    """Read command lines from a filepath, stdin as '-', or a stream."""
+    if source == '-':
+        yield from sys.stdin
+    elif isinstance(source, str):
+        with open(source, encoding='utf-8') as f:
+            yield from f
+    else:
+        yield from source
+
+
+def get_status(err: SystemExit) -> int:
+    """Get exit status of command the way the interpreter reports it."""
+    if err.code is None:
+        return 0
+    if isinstance(err.code, int):
+        return err.code
+    print(err.code, file=sys.stderr)
+    return 1
+
+
+class BatchAction(Action):
+    """Dispatch command lines read from a file and exit."""
+
+    def __init__(
+        self,
+        option_strings: Sequence[str],
+        dest: str = SUPPRESS,
+        default: str = SUPPRESS,
+        metavar: Optional[str] = 'FILE',
+        help: Optional[str] = None,  # pylint: disable=redefined-builtin
+    ) -> None:
+        """Initialize batch action."""
+        super().__init__(
+            option_strings=option_strings,
+            dest=dest,
+            default=default,
+            metavar=metavar,
+            help=help,
+        )
+
+    def __call__(
+        self,
+        parser: ArgumentParser,
+        namespace: Namespace,
+        values: Any,
+        option_string: Optional[str] = None,
+    ) -> None:
+        """Dispatch every command line then exit with combined status."""
+        statuses = parser.dispatch_batch(values)  # type: ignore
+        parser.exit(1 if any(x for _, x in statuses) else 0)
@@ -0,0 +1,148 @@
+# copyright: (c) 2020 by Jesse Johnson.
+# license: Apache 2.0, see LICENSE for more details.
+"""Precompiled call layouts used to dispatch commands."""
+
+import asyncio
+import inspect
+import threading
+import weakref
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from argufy.inspection import get_inspection
+
+_local = threading.local()
+
+
+class _EventLoop:
+    """Hold event loop of a thread, closing it when the thread finishes."""
+
+    __slots__ = ('loop', '__weakref__')
+
+    def __init__(self) -> None:
+        """Initialize event loop of the current thread."""
+        self.loop = asyncio.new_event_loop()
+        # NOTE: thread locals are released when their thread finishes,
+        # the finalizer is only kept until then or interpreter exit
+        weakref.finalize(self, self.loop.close)
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Get event loop reused by synchronous dispatch within a thread."""
+    holder = getattr(_local, 'holder', None)
+    if holder is None or holder.loop.is_closed():
+        holder = _local.holder = _EventLoop()
+    return holder.loop
+
+
+def run_coroutine(coroutine: Awaitable[Any]) -> Any:
+    """Run coroutine to completion on the reusable event loop."""
+    return get_event_loop().run_until_complete(coroutine)
+
+
+class Binder:
+    """Bind parsed values to the parameters of a command."""
+
+    __slots__ = ('fn', 'parameters', 'keys', 'splat', 'coroutine')
+
+    def __init__(
+        self,
+        fn: Callable[..., Any],
+        keywords: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Initialize binder from command signature.
+
+        Parameters
+        ----------
+        fn: Callable
+            Command that parsed values are bound to.
+        keywords: Iterable[str], optional
+            Argument names of the command parser, otherwise keywords are
+            taken from the command docstring.
+
+        """
+        inspection = get_inspection(fn)
+        self.fn = fn
+        # NOTE: coroutine functions are awaited instead of called directly
+        self.coroutine = inspect.iscoroutinefunction(fn)
+        self.splat: Optional[str] = inspection.splat
+        self.parameters: FrozenSet[str] = frozenset(
+            inspection.signature.parameters
+        )
+
+        # values passed to command as keyword arguments
+        self.keys: FrozenSet[str] = (
+            self.parameters
+            | frozenset(inspection.keywords if keywords is None else keywords)
+        ) - {self.splat}
+
+    def bind(
+        self, values: Dict[str, Any]
+    ) -> Tuple[Sequence[Any], Dict[str, Any], Dict[str, Any]]:
+        """Separate values into command and module arguments.
+
+        Parameters
+        ----------
+        values: dict
+            Parsed values of a command.
+
+        Returns
+        -------
+        Sequence[Any]:
+            Values passed to the variable positional parameter.
+        Dict[str, Any]:
+            Values passed as keyword arguments.
+        Dict[str, Any]:
+            Values that are not part of the command signature.
+
+        """
+        splat: Sequence[Any] = ()
+        kwargs: Dict[str, Any] = {}
+        extras: Dict[str, Any] = {}
+        for key, value in values.items():
+            if key in self.keys:
+                kwargs[key] = value
+            elif key == self.splat:
+                splat = value or ()
+            else:
+                extras[key] = value
+        return splat, kwargs, extras
+
+    def call(
+        self,
+        splat: Sequence[Any],
+        kwargs: Dict[str, Any],
+        reuse_loop: bool = True,
+    ) -> Any:
+        """Call command, running coroutines on the reusable event loop.
+
+        Parameters
+        ----------
+        splat: Sequence[Any]
+            Values passed to the variable positional parameter.
+        kwargs: dict
+            Values passed as keyword arguments.
+        reuse_loop: bool
+            Keep the event loop of the thread for later calls, otherwise
+            coroutines run on a loop closed once they complete.
+
+        Returns
+        -------
+        Any:
+            Result of the command.
+
+        """
+        if self.coroutine:
+            if not reuse_loop:
+                return asyncio.run(self.fn(*splat, **kwargs))
+            return run_coroutine(self.fn(*splat, **kwargs))
+        return self.fn(*splat, **kwargs)
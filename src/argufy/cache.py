@@ -0,0 +1,318 @@
+# copyright: (c) 2020 by Jesse Johnson.
+# license: Apache 2.0, see LICENSE for more details.
+"""Persistent cache of introspected command specs."""
+
+import hashlib
+import json
+import logging
+import os
+import sys
+import tempfile
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Union
+
+from argufy.argument import ArgumentSpec
+from argufy.source import Reference, find_source, resolve
+
+log = logging.getLogger(__name__)
+
+
+def encode_value(value: Any) -> Any:
+    """Convert argument value into a JSON compatible structure."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, list):
+        return [encode_value(x) for x in value]
+    if isinstance(value, tuple):
+        return {'tuple': [encode_value(x) for x in value]}
+    if isinstance(value, (set, frozenset)):
+        return {'set': [encode_value(x) for x in value]}
+    if isinstance(value, Reference):
+        return {'ref': value.reference}
+    if callable(value):
+        qualname = getattr(value, '__qualname__', '')
+        module = getattr(value, '__module__', None)
+        if module and qualname and '<' not in qualname:
+            return {'ref': f"{module}:{qualname}"}
+    raise TypeError(f"cannot encode value: {value!r}")
+
+
+def decode_value(value: Any) -> Any:
+    """Convert JSON compatible structure back into argument value."""
+    if isinstance(value, list):
+        return [decode_value(x) for x in value]
+    if isinstance(value, dict):
+        if 'tuple' in value:
+            return tuple(decode_value(x) for x in value['tuple'])
+        if 'set' in value:
+            return {decode_value(x) for x in value['set']}
+        if 'ref' in value:
+            # NOTE: avoid importing command modules until values are parsed
+            if value['ref'].partition(':')[0] in sys.modules:
+                return resolve(value['ref'])
+            return Reference(value['ref'])
+    return value
+
+
+def encode_arguments(arguments: List[Any]) -> List[Dict[str, Any]]:
+    """Convert argument specs into JSON compatible structures."""
+    return [
+        {
+            'name': list(names),
+            'kwargs': {k: encode_value(v) for k, v in kwargs.items()},
+        }
+        for names, kwargs in arguments
+    ]
+
+
+def decode_arguments(arguments: List[Dict[str, Any]]) -> List[ArgumentSpec]:
+    """Convert JSON compatible structures into argument specs."""
+    return [
+        ArgumentSpec(
+            x['name'],
+            **{k: decode_value(v) for k, v in x['kwargs'].items()},
+        )
+        for x in arguments
+    ]
+
+
+class SpecCache:
+    """Store argument specs derived from command modules on disk."""
+
+    def __init__(
+        self, path: Optional[str] = None, use_hash: bool = False
+    ) -> None:
+        """Initialize spec cache.
+
+        Parameters
+        ----------
+        path: str, optional
+            Directory used to store cached specs.
+        use_hash: bool
+            Validate entries with file hash instead of modified time.
+
+        """
+        self.path = (
+            path
+            or os.environ.get('ARGUFY_CACHE_DIR')
+            or os.path.join(os.path.expanduser('~'), '.cache', 'argufy')
+        )
+        self.use_hash = use_hash
+        self.hits = 0
+        self.misses = 0
+
+    def __get_key(
+        self, module: Union[ModuleType, str], settings: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Get key used to validate cached module specs."""
+        from argufy import __version__
+
+        if isinstance(module, str):
+            name, filename = module, find_source(module)
+        else:
+            name, filename = module.__name__, getattr(module, '__file__', None)
+        if not filename or not os.path.isfile(filename):
+            return None
+        key: Dict[str, Any] = {
+            'version': __version__,
+            'module': name,
+            'settings': settings,
+        }
+        if self.use_hash:
+            with open(filename, 'rb') as f:
+                key['hash'] = hashlib.sha256(f.read()).hexdigest()
+        else:
+            stat = os.stat(filename)
+            key['mtime'] = stat.st_mtime_ns
+            key['size'] = stat.st_size
+        return key
+
+    def __get_filepath(
+        self, module: Union[ModuleType, str], settings: Dict[str, Any]
+    ) -> str:
+        """Get cache filepath for module and parser settings."""
+        name = module if isinstance(module, str) else module.__name__
+        digest = hashlib.sha1(  # nosec
+            json.dumps(settings, sort_keys=True).encode('utf-8')
+        ).hexdigest()[:12]
+        return os.path.join(self.path, f"{name}.{digest}.json")
+
+    def load(
+        self, module: Union[ModuleType, str], settings: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Load module spec when cached entry is still valid.
+
+        Parameters
+        ----------
+        module: Union[ModuleType, str]
+            Module, or its dotted path, that the specs were derived from.
+        settings: dict
+            Parser settings that affect the derived specs.
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]:
+            Module spec or None when missing or stale.
+
+        """
+        key = self.__get_key(module, settings)
+        spec = None
+        if key is not None:
+            try:
+                with open(
+                    self.__get_filepath(module, settings), encoding='utf-8'
+                ) as f:
+                    entry = json.load(f)
+                if entry['key'] == key:
+                    spec = self.decode(entry['spec'])
+            except (OSError, ValueError, KeyError, ImportError) as err:
+                log.debug("spec cache unavailable: %s", err)
+        if spec is None:
+            self.misses += 1
+            log.debug("spec cache miss: %s", key)
+        else:
+            self.hits += 1
+            log.debug("spec cache hit: %s", key)
+        return spec
+
+    def store(
+        self,
+        module: Union[ModuleType, str],
+        settings: Dict[str, Any],
+        spec: Dict[str, Any],
+    ) -> bool:
+        """Store module spec when it can be serialized.
+
+        Parameters
+        ----------
+        module: Union[ModuleType, str]
+            Module, or its dotted path, that the specs were derived from.
+        settings: dict
+            Parser settings that affect the derived specs.
+        spec: dict
+            Module spec to be stored.
+
+        Returns
+        -------
+        bool:
+            Whether the module spec was stored.
+
+        """
+        key = self.__get_key(module, settings)
+        if key is None:
+            return False
+        try:
+            data = json.dumps({'key': key, 'spec': self.encode(spec)})
+            os.makedirs(self.path, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp, self.__get_filepath(module, settings))
+        except (OSError, TypeError) as err:
+            log.debug("spec cache skipped %s: %s", key['module'], err)
+            return False
+        return True
+
+    @staticmethod
+    def encode(spec: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert module spec into JSON compatible structure."""
+        commands = []
+        for command in spec['commands']:
+            if command['arguments'] is None:
+                raise TypeError(f"incomplete command: {command['name']}")
+            commands.append(
+                {
+                    **command,
+                    'arguments': encode_arguments(command['arguments']),
+                }
+            )
+        return {
+            'description': spec['description'],
+            'arguments': encode_arguments(spec['arguments']),
+            'commands': commands,
+        }
+
+    @staticmethod
+    def decode(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert JSON compatible structure into module spec."""
+        return {
+            'description': data['description'],
+            'arguments': decode_arguments(data['arguments']),
+            'commands': [
+                {**x, 'arguments': decode_arguments(x['arguments'])}
+                for x in data['commands']
+            ],
+        }
+
+    def __get_index_filepath(self, package: str) -> str:
+        """Get cache filepath for the modules discovered in package."""
+        return os.path.join(self.path, f"{package}.index.json")
+
+    def load_index(self, package: str) -> Optional[Dict[str, Any]]:
+        """Load modules discovered in package tree by a previous run.
+
+        Parameters
+        ----------
+        package: str
+            Dotted path of the package.
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]:
+            Modules and packages found in each package directory, which
+            are validated by the caller when they are used.
+
+        """
+        from argufy import __version__
+
+        try:
+            with open(
+                self.__get_index_filepath(package), encoding='utf-8'
+            ) as f:
+                entry = json.load(f)
+            if entry['version'] == __version__:
+                return dict(entry['index'])
+        except (OSError, ValueError, KeyError, TypeError) as err:
+            log.debug("package index unavailable: %s", err)
+        return None
+
+    def store_index(self, package: str, index: Dict[str, Any]) -> bool:
+        """Store modules discovered in package tree.
+
+        Parameters
+        ----------
+        package: str
+            Dotted path of the package.
+        index: dict
+            Modules and packages found in each package directory.
+
+        Returns
+        -------
+        bool:
+            Whether the index was stored.
+
+        """
+        from argufy import __version__
+
+        try:
+            data = json.dumps({'version': __version__, 'index': index})
+            os.makedirs(self.path, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp, self.__get_index_filepath(package))
+        except (OSError, TypeError) as err:
+            log.debug("package index skipped %s: %s", package, err)
+            return False
+        return True
+
+    def clear(self) -> None:
+        """Remove all cached specs."""
+        if os.path.isdir(self.path):
+            for filename in os.listdir(self.path):
+                if filename.endswith('.json'):
+                    os.remove(os.path.join(self.path, filename))
+
+    def report(self) -> Dict[str, int]:
+        """Report cache hits and misses."""
+        return {'hits': self.hits, 'misses': self.misses}
@@ -0,0 +1,71 @@
+# copyright: (c) 2020 by Jesse Johnson.
+# license: Apache 2.0, see LICENSE for more details.
+"""Provide build tools for argufy based CLIs."""
+
+import json
+import os
+from typing import Any, Optional
+
+from argufy.cache import SpecCache, resolve
+
+
+def _load_parser(target: str) -> Any:
+    """Get parser from 'module:attribute' reference."""
+    obj = resolve(target)
+    return obj() if callable(obj) and not hasattr(obj, 'dispatch') else obj
+
+
+def cache_warm(target: str, cache_dir: Optional[str] = None) -> None:
+    """Build parser to store its command specs in the spec cache.
+
+    Parameters
+    ----------
+    target: str
+        Reference to parser or parser factory as 'module:attribute'.
+    cache_dir: str, optional
+        Directory used to store cached specs.
+
+    """
+    if cache_dir:
+        os.environ['ARGUFY_CACHE_DIR'] = cache_dir
+    parser = _load_parser(target)
+    if not getattr(parser, 'spec_cache', None):
+        raise SystemExit(f"parser has no spec cache: {target}")
+    print(json.dumps(parser.spec_cache.report()))
+
+
+# pylint: disable-next=redefined-builtin
+def compile(
+    target: str, output: Optional[str] = None, rendered: bool = False
+) -> None:
+    """Generate static manifest of parser and its commands.
+
+    Parameters
+    ----------
+    target: str
+        Reference to parser or parser factory as 'module:attribute'.
+    output: str, optional
+        Filepath where the manifest is written instead of stdout.
+    rendered: bool
+        Include help and usage rendered for the current terminal.
+
+    """
+    parser = _load_parser(target)
+    data = json.dumps(parser.to_manifest(rendered), indent=2)
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            f.write(data)
+    else:
+        print(data)
+
+
+def cache_clear(cache_dir: Optional[str] = None) -> None:
+    """Remove all cached command specs.
+
+    Parameters
+    ----------
+    cache_dir: str, optional
+        Directory used to store cached specs.
+
+    """
+    SpecCache(cache_dir).clear()
@@ -0,0 +1,149 @@
+# copyright: (c) 2020 by Jesse Johnson.
+# license: Apache 2.0, see LICENSE for more details.
+"""Forward command line to a warm argufy server over a Unix socket.
+
+This module only depends on the standard library so that it can be run
+directly as a script, avoiding the cost of importing argufy itself.
+
+"""
+
+import json
+import os
+import selectors
+import socket
+import struct
+import sys
+from typing import IO, Dict, Optional, Sequence
+
+# NOTE: frames are a channel byte followed by the payload size
+FRAME = struct.Struct('>cI')
+STDOUT = b'1'
+STDERR = b'2'
+EXIT = b'x'
+CHUNK_SIZE = 1 << 16
+
+
+def send_frame(sock: socket.socket, channel: bytes, data: bytes) -> None:
+    """Send frame of output on channel."""
+    sock.sendall(FRAME.pack(channel, len(data)) + data)
+
+
+def _get_fileno(stream: IO[bytes]) -> Optional[int]:
+    """Get file descriptor of stream when it has one."""
+    try:
+        return stream.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def run(
+    path: str,
+    argv: Sequence[str],
+    stdin: Optional[IO[bytes]] = None,
+    stdout: Optional[IO[bytes]] = None,
+    stderr: Optional[IO[bytes]] = None,
+    env: Optional[Dict[str, str]] = None,
+    cwd: Optional[str] = None,
+) -> int:
+    """Run command on server and stream back its output.
+
+    Parameters
+    ----------
+    path: str
+        Filepath of the server socket.
+    argv: Sequence[str]
+        Command line arguments passed to the parser.
+    stdin: IO[bytes], optional
+        Stream forwarded as stdin of the command.
+    stdout: IO[bytes], optional
+        Stream receiving stdout of the command.
+    stderr: IO[bytes], optional
+        Stream receiving stderr of the command.
+    env: Dict[str, str], optional
+        Environment of the command, defaults to the current environment.
+    cwd: str, optional
+        Working directory of the command, defaults to the current one.
+
+    Returns
+    -------
+    int:
+        Exit status of the command.
+
+    """
+    stdout = stdout or sys.stdout.buffer
+    stderr = stderr or sys.stderr.buffer
+    header = {
+        'argv': list(argv),
+        'env': dict(os.environ if env is None else env),
+        'cwd': cwd or os.getcwd(),
+    }
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+        sock.sendall(json.dumps(header).encode('utf-8') + b'\n')
+
+        # NOTE: stdin is multiplexed with output so neither blocks the other
+        selector = selectors.DefaultSelector()
+        selector.register(sock, selectors.EVENT_READ)
+        # NOTE: regular files cannot be polled but are always readable, so
+        # a chunk of them is sent between polls of the socket instead
+        pending = stdin
+        if stdin is not None:
+            fileno = _get_fileno(stdin)
+            if fileno is not None:
+                try:
+                    selector.register(fileno, selectors.EVENT_READ)
+                    pending = None
+                except OSError:
+                    pass
+        else:
+            sock.shutdown(socket.SHUT_WR)
+
+        buffer = b''
+        while True:
+            events = selector.select(None if pending is None else 0)
+            if pending is not None:
+                chunk = pending.read(CHUNK_SIZE)
+                if chunk:
+                    sock.sendall(chunk)
+                else:
+                    pending = None
+                    sock.shutdown(socket.SHUT_WR)
+            for key, _ in events:
+                if key.fileobj is not sock:
+                    chunk = os.read(key.fd, CHUNK_SIZE)
+                    if chunk:
+                        sock.sendall(chunk)
+                    else:
+                        selector.unregister(key.fd)
+                        sock.shutdown(socket.SHUT_WR)
+                    continue
+
+                data = sock.recv(CHUNK_SIZE)
+                if not data:
+                    raise ConnectionError('server closed connection')
+                buffer += data
+                while len(buffer) >= FRAME.size:
+                    channel, size = FRAME.unpack_from(buffer)
+                    start, end = FRAME.size, FRAME.size + size
+                    if len(buffer) < end:
+                        break
+                    payload, buffer = buffer[start:end], buffer[end:]
+                    if channel == EXIT:
+                        return int(payload)
+                    stream = stdout if channel == STDOUT else stderr
+                    stream.write(payload)
+                    stream.flush()
+
+
+def main(args: Optional[Sequence[str]] = None) -> None:
+    """Forward command line to server given as first argument."""
+    args = sys.argv[1:] if args is None else args
+    if not args:
+        sys.exit('usage: client SOCKET [ARGS ...]')
+    # NOTE: interactive terminals are not forwarded to avoid blocking
+    stdin = None if sys.stdin is None or sys.stdin.isatty() else sys.stdin
+    sys.exit(run(args[0], args[1:], stdin=stdin.buffer if stdin else None))
+
+
+if __name__ == '__main__':
+    main()
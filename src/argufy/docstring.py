@@ -0,0 +1,201 @@
+# copyright: (c) 2020 by Jesse Johnson.
+# license: Apache 2.0, see LICENSE for more details.
+"""Parse docstrings in a pinned style or scan them for parameters."""
+
+import re
+from typing import List, Optional, Tuple
+
+from docstring_parser import Docstring, DocstringParam, DocstringStyle
+from docstring_parser import parse as docparse
+
+# NOTE: names of styles mapped to those of docstring_parser
+STYLES = {
+    'auto': 'AUTO',
+    'rest': 'REST',
+    'google': 'GOOGLE',
+    'numpy': 'NUMPYDOC',
+    'epydoc': 'EPYDOC',
+    'scan': None,
+}
+
+# section headings and the kind of parameters they describe
+SECTIONS = {
+    'Args': 'param',
+    'Arguments': 'param',
+    'Parameters': 'param',
+    'Params': 'param',
+    'Other Parameters': 'param',
+    'Keyword Args': 'param',
+    'Keyword Arguments': 'param',
+    'Attributes': 'attribute',
+}
+
+_REST_PARAM = re.compile(r'^:param\s+(?:(\S+)\s+)?(\*{0,2}\w+)\s*:\s*(.*)$')
+_REST_TYPE = re.compile(r'^:type\s+(\*{0,2}\w+)\s*:\s*(.*)$')
+_GOOGLE_PARAM = re.compile(r'^(\*{0,2}\w+)\s*(?:\((.*)\))?\s*:\s*(.*)$')
+_NUMPY_PARAM = re.compile(r'^(\*{0,2}\w+)\s*(?::\s*(.*))?$')
+_OPTIONAL = re.compile(r',\s*optional\s*$')
+
+
+def _split_type(type_name: Optional[str]) -> Tuple[Optional[str], bool]:
+    """Separate optional marker from type name."""
+    if not type_name:
+        return None, False
+    if _OPTIONAL.search(type_name):
+        return _OPTIONAL.sub('', type_name), True
+    return type_name.strip(), False
+
+
+class _Lines:
+    """Provide stripped lines of a docstring with their indentation."""
+
+    __slots__ = ('text', 'indents')
+
+    def __init__(self, lines: List[str]) -> None:
+        """Initialize lines."""
+        self.text = [x.strip() for x in lines]
+        self.indents = [len(x) - len(x.lstrip()) for x in lines]
+
+    def is_rule(self, index: int) -> bool:
+        """Check if line underlines a numpy section heading."""
+        return (
+            index < len(self.text)
+            and self.text[index][:3] == '---'
+            and not self.text[index].strip('-')
+        )
+
+    def get_description(self, index: int, text: str) -> Optional[str]:
+        """Get first line of description, on the line or following it."""
+        if text:
+            return text.strip()
+        following = index + 1
+        if (
+            following < len(self.text)
+            and self.text[following]
+            and self.indents[following] > self.indents[index]
+        ):
+            return self.text[following]
+        return None
+
+
+def _scan_rest(lines: _Lines) -> List[DocstringParam]:
+    """Get parameters of restructured text fields."""
+    params: List[DocstringParam] = []
+    types = {}
+    for line in lines.text:
+        if line[:6] == ':type ':
+            match = _REST_TYPE.match(line)
+            if match:
+                types[match.group(1)] = match.group(2).strip() or None
+    for index, line in enumerate(lines.text):
+        if line[:7] != ':param ':
+            continue
+        match = _REST_PARAM.match(line)
+        if match:
+            type_name, name, text = match.groups()
+            params.append(
+                DocstringParam(
+                    args=['param', name],
+                    description=lines.get_description(index, text),
+                    arg_name=name,
+                    type_name=type_name or types.get(name),
+                    is_optional=None,
+                    default=None,
+                )
+            )
+    return params
+
+
+def _scan_sections(lines: _Lines) -> List[DocstringParam]:
+    """Get parameters of google and numpy sections."""
+    params: List[DocstringParam] = []
+    text, indents = lines.text, lines.indents
+    size = len(text)
+    index = 0
+    while index < size:
+        heading = text[index]
+        numpy = lines.is_rule(index + 1)
+        kind = SECTIONS.get(heading if numpy else heading[:-1])
+        if kind is None or not (numpy or heading[-1:] == ':'):
+            index += 1
+            continue
+
+        indent = indents[index]
+        index += 2 if numpy else 1
+        pattern = _NUMPY_PARAM if numpy else _GOOGLE_PARAM
+        # NOTE: entries align with the first one below the heading
+        entry = None
+        while index < size:
+            line = text[index]
+            current = indents[index]
+            if line:
+                if current < indent or (not numpy and current == indent):
+                    break
+                if numpy and lines.is_rule(index + 1):
+                    break
+                if entry is None:
+                    entry = current
+                match = pattern.match(line) if current == entry else None
+                if match:
+                    type_name, optional = _split_type(match.group(2))
+                    params.append(
+                        DocstringParam(
+                            args=[kind, match.group(1)],
+                            description=lines.get_description(
+                                index, '' if numpy else match.group(3)
+                            ),
+                            arg_name=match.group(1),
+                            type_name=type_name,
+                            is_optional=optional,
+                            default=None,
+                        )
+                    )
+            index += 1
+    return params
+
+
+def scan(text: str) -> Docstring:
+    """Get summary and parameters of docstring without parsing it.
+
+    Parameters
+    ----------
+    text: str
+        Docstring in restructured text, google or numpy style.
+
+    Returns
+    -------
+    Docstring:
+        Docstring with short description, and parameters with their type
+        and the first line of their description.
+
+    """
+    # NOTE: only relative indentation is used so lines are not dedented
+    lines = _Lines(text.expandtabs().splitlines())
+    docstring = Docstring()
+    docstring.short_description = next((x for x in lines.text if x), None)
+    docstring.meta.extend(_scan_rest(lines) or _scan_sections(lines))
+    return docstring
+
+
+def parse(text: str, style: str = 'auto') -> Docstring:
+    """Parse docstring in a style.
+
+    Parameters
+    ----------
+    text: str
+        Docstring to be parsed.
+    style: str
+        Name of docstring style, 'auto' to try each, or 'scan' for
+        parameters only.
+
+    Returns
+    -------
+    Docstring:
+        Parsed docstring.
+
+    """
+    if style not in STYLES:
+        raise ValueError(f"unknown docstring style: {style}")
+    if style == 'scan':
+        return scan(text)
+    return docparse(text, getattr(DocstringStyle, str(STYLES[style])))
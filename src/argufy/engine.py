@@ -0,0 +1,420 @@
+# copyright: (c) 2020 by Jesse Johnson.
+# license: Apache 2.0, see LICENSE for more details.
+"""Parse command lines with tables compiled from a parser tree.
+
+The engine only handles the actions that argufy generates. Anything else is
+left to argparse, by returning None, so that results are always the same as
+argparse.
+
+"""
+
+import copy
+import logging
+import sys
+from argparse import (
+    _UNRECOGNIZED_ARGS_ATTR,
+    ONE_OR_MORE,
+    OPTIONAL,
+    SUPPRESS,
+    ZERO_OR_MORE,
+    Action,
+    ArgumentError,
+    ArgumentParser,
+    Namespace,
+    _AppendAction,
+    _AppendConstAction,
+    _CountAction,
+    _StoreAction,
+    _StoreConstAction,
+    _StoreFalseAction,
+    _StoreTrueAction,
+)
+from argparse import _SubParsersAction as SubParsersAction
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from weakref import WeakKeyDictionary
+
+log = logging.getLogger(__name__)
+
+# NOTE: matching of positionals differs in older versions so every command
+# line is left to argparse there
+SUPPORTED = sys.version_info[:2] >= (3, 8)
+
+# NOTE: actions that only store their values on the namespace
+STORE_ACTIONS = (
+    _AppendAction,
+    _AppendConstAction,
+    _CountAction,
+    _StoreAction,
+    _StoreConstAction,
+    _StoreFalseAction,
+    _StoreTrueAction,
+)
+
+# minimum and maximum values consumed by each nargs
+Arity = Tuple[int, Optional[int]]
+ARITIES: Dict[Any, Arity] = {
+    None: (1, 1),
+    OPTIONAL: (0, 1),
+    ZERO_OR_MORE: (0, None),
+    ONE_OR_MORE: (1, None),
+}
+
+
+class Unsupported(Exception):
+    """Command line must be parsed by argparse."""
+
+
+class Table:
+    """Provide layout of a parser compiled for parsing."""
+
+    __slots__ = ('key', 'arities', 'positionals', 'commands')
+
+    def __init__(
+        self,
+        key: Tuple[Action, ...],
+        arities: Dict[Action, Arity],
+        positionals: List[Tuple[Action, int, Optional[int]]],
+        commands: Optional[SubParsersAction],
+    ) -> None:
+        """Initialize table.
+
+        Parameters
+        ----------
+        key: Tuple[Action, ...]
+            Actions of the parser the table was compiled from.
+        arities: Dict[Action, Arity]
+            Values consumed by each option the engine can take.
+        positionals: List[Tuple[Action, int, Optional[int]]]
+            Positionals with the values they consume, in order.
+        commands: SubParsersAction, optional
+            Action selecting the command parser.
+
+        """
+        self.key = key
+        self.arities = arities
+        self.positionals = positionals
+        self.commands = commands
+
+
+_tables: 'WeakKeyDictionary[ArgumentParser, Optional[Table]]' = (
+    WeakKeyDictionary()
+)
+
+
+def _get_arity(nargs: Any) -> Optional[Arity]:
+    """Get values consumed by nargs, or None when not supported."""
+    if isinstance(nargs, int):
+        return nargs, nargs
+    return ARITIES.get(nargs)
+
+
+def compile_parser(parser: ArgumentParser) -> Optional[Table]:
+    """Compile parser into tables, or None when it cannot be compiled.
+
+    Parameters
+    ----------
+    parser: ArgumentParser
+        Parser compiled, including arguments added after a previous call.
+
+    Returns
+    -------
+    Optional[Table]:
+        Layout of the parser.
+
+    """
+    key = tuple(parser._actions)
+    if parser in _tables:
+        table = _tables[parser]
+        if table is None or table.key == key:
+            return table
+
+    arities: Dict[Action, Arity] = {}
+    positionals: List[Tuple[Action, int, Optional[int]]] = []
+    commands = None
+    result: Optional[Table] = None
+    for action in parser._actions:
+        if isinstance(action, SubParsersAction):
+            commands = action
+            continue
+        arity = _get_arity(action.nargs)
+        if not action.option_strings:
+            if type(action) is not _StoreAction or arity is None:
+                break
+            positionals.append((action, *arity))
+        elif type(action) in STORE_ACTIONS and arity is not None:
+            arities[action] = arity
+    else:
+        # NOTE: commands consume every argument so cannot share a parser
+        # with other positionals
+        if commands is None:
+            result = Table(key, arities, positionals, commands)
+        elif not positionals:
+            result = Table(key, arities, [(commands, 1, None)], commands)
+    if result is None and key:
+        log.debug("parser %s not compiled", parser.prog)
+    _tables[parser] = result
+    return result
+
+
+def get_values(
+    parser: ArgumentParser, action: Action, arg_strings: List[str]
+) -> Any:
+    """Convert values of action, skipping conversion of plain strings."""
+    if (
+        arg_strings
+        and action.type in (None, str)
+        and action.choices is None
+        and action.nargs in (ZERO_OR_MORE, ONE_OR_MORE)
+    ):
+        return arg_strings
+    return parser._get_values(action, arg_strings)
+
+
+def _match_positionals(
+    positionals: List[Tuple[Action, int, Optional[int]]], count: int
+) -> List[int]:
+    """Get values of the most positionals that match a run of values."""
+    for size in range(len(positionals), 0, -1):
+        minimums = [low for _, low, _ in positionals[:size]]
+        if sum(minimums) > count:
+            continue
+        # NOTE: each positional is greedy the same as the argparse pattern
+        counts = []
+        for index, (_, low, high) in enumerate(positionals[:size]):
+            following = index + 1
+            available = count - sum(minimums[following:])
+            take = available if high is None else min(high, available)
+            counts.append(take)
+            count -= take
+        return counts
+    return []
+
+
+class _Level:
+    """Parse the arguments of one parser in the tree."""
+
+    def __init__(
+        self,
+        parser: ArgumentParser,
+        table: Table,
+        args: List[str],
+        namespace: Namespace,
+    ) -> None:
+        """Initialize parse of arguments."""
+        self.parser = parser
+        self.table = table
+        self.args = args
+        self.namespace = namespace
+        self.positionals = list(table.positionals)
+        self.extras: List[str] = []
+        self.seen: set = set()
+
+    def take_action(
+        self,
+        action: Action,
+        arg_strings: List[str],
+        option_string: Optional[str] = None,
+    ) -> None:
+        """Convert values and store them on the namespace."""
+        self.seen.add(action)
+        values = get_values(self.parser, action, arg_strings)
+        if values is not SUPPRESS:
+            action(self.parser, self.namespace, values, option_string)
+
+    def take_command(self, start: int) -> None:
+        """Parse arguments of the selected command."""
+        action = self.table.commands
+        assert action is not None  # nosec
+        self.seen.add(action)
+        # NOTE: commands are not converted so only the name is checked
+        if action.type is not None:
+            raise Unsupported(action.dest)
+        name = self.args[start]
+        self.parser._check_value(action, name)
+        if action.dest is not SUPPRESS:
+            setattr(self.namespace, action.dest, name)
+        if hasattr(action, 'get_parser'):
+            subparser = action.get_parser(name)
+        else:
+            subparser = action._name_parser_map[name]
+
+        following = start + 1
+        subnamespace, extras = parse_level(subparser, self.args[following:])
+        for key, value in vars(subnamespace).items():
+            setattr(self.namespace, key, value)
+        if extras:
+            vars(self.namespace).setdefault(_UNRECOGNIZED_ARGS_ATTR, [])
+            getattr(self.namespace, _UNRECOGNIZED_ARGS_ATTR).extend(extras)
+
+    def consume_positionals(self, start: int, stop: int) -> int:
+        """Consume positionals matching values from start until stop."""
+        if self.positionals and self.positionals[0][0] is self.table.commands:
+            if start == stop:
+                return start
+            # NOTE: commands take every remaining argument
+            self.positionals.clear()
+            self.take_command(start)
+            return len(self.args)
+
+        counts = _match_positionals(self.positionals, stop - start)
+        for (action, _, _), count in zip(self.positionals, counts):
+            end = start + count
+            self.take_action(action, self.args[start:end])
+            start = end
+        del self.positionals[: len(counts)]
+        return start
+
+    def consume_optional(
+        self, start: int, option: Tuple[Any, ...], stop: int
+    ) -> int:
+        """Consume option at start and the values following it."""
+        # NOTE: option tuples include the separator of explicit values
+        # since python 3.12, which is not needed here
+        action, option_string, explicit_arg = option[0], option[1], option[-1]
+        if action is None:
+            self.extras.append(self.args[start])
+            return start + 1
+        if action not in self.table.arities:
+            raise Unsupported(option_string)
+        low, high = self.table.arities[action]
+        if explicit_arg is not None:
+            if low > 1 or high == 0:
+                raise Unsupported(option_string)
+            self.take_action(action, [explicit_arg], option_string)
+            return start + 1
+
+        first = start + 1
+        count = stop - first
+        if count < low:
+            raise Unsupported(option_string)
+        if high is not None:
+            count = min(count, high)
+        end = first + count
+        self.take_action(action, self.args[first:end], option_string)
+        return end
+
+    def parse(self) -> List[str]:
+        """Parse arguments in one pass over them."""
+        # classify optionals the same as argparse before consuming any
+        chars = self.parser.prefix_chars
+        options = {}
+        for index, arg in enumerate(self.args):
+            if arg and arg[0] in chars:
+                if arg == '--':
+                    raise Unsupported(arg)
+                option = self.parser._parse_optional(arg)
+                # NOTE: newer versions return every interpretation of the
+                # option instead of a single tuple
+                if isinstance(option, list):
+                    if len(option) != 1:
+                        raise Unsupported(arg)
+                    option = option[0]
+                if option is not None:
+                    options[index] = option
+        indices = list(options) + [len(self.args)]
+
+        start = 0
+        for position, index in enumerate(indices):
+            # values before the option are taken by positionals first
+            while start < index:
+                stop = self.consume_positionals(start, index)
+                if stop == start:
+                    self.extras.extend(self.args[start:index])
+                    break
+                start = stop
+            if start > index:
+                continue
+            start = index
+            if index < len(self.args):
+                start = self.consume_optional(
+                    index, options[index], indices[position + 1]
+                )
+        if self.positionals:
+            self.consume_positionals(len(self.args), len(self.args))
+        return self.extras
+
+    def finish(self) -> None:
+        """Check required arguments and convert defaults not given."""
+        for action in self.parser._actions:
+            if action in self.seen:
+                continue
+            if action.required:
+                raise Unsupported(action.dest)
+            if (
+                isinstance(action.default, str)
+                and hasattr(self.namespace, action.dest)
+                and action.default is getattr(self.namespace, action.dest)
+            ):
+                setattr(
+                    self.namespace,
+                    action.dest,
+                    self.parser._get_value(action, action.default),
+                )
+
+
+def parse_level(
+    parser: ArgumentParser,
+    args: List[str],
+    namespace: Optional[Namespace] = None,
+) -> Tuple[Namespace, List[str]]:
+    """Parse arguments of parser and the command they select."""
+    table = compile_parser(parser)
+    if (
+        table is None
+        or parser.fromfile_prefix_chars
+        or parser._mutually_exclusive_groups
+    ):
+        raise Unsupported(parser.prog)
+
+    namespace = Namespace() if namespace is None else namespace
+    for action in parser._actions:
+        if action.dest is not SUPPRESS and not hasattr(namespace, action.dest):
+            if action.default is not SUPPRESS:
+                setattr(namespace, action.dest, action.default)
+    for dest in parser._defaults:
+        if not hasattr(namespace, dest):
+            setattr(namespace, dest, parser._defaults[dest])
+
+    level = _Level(parser, table, args, namespace)
+    extras = level.parse()
+    level.finish()
+    extras.extend(vars(namespace).pop(_UNRECOGNIZED_ARGS_ATTR, []))
+    return namespace, extras
+
+
+def parse(
+    parser: ArgumentParser,
+    args: Sequence[str],
+    namespace: Optional[Namespace] = None,
+) -> Optional[Tuple[Namespace, List[str]]]:
+    """Parse known arguments with compiled tables of the parser tree.
+
+    Parameters
+    ----------
+    parser: ArgumentParser
+        Root of the parser tree.
+    args: Sequence[str]
+        Command line arguments passed to the parser.
+    namespace: Namespace, optional
+        Argparse namespace object populated with the values.
+
+    Returns
+    -------
+    Optional[Tuple[Namespace, List[str]]]:
+        Namespace and unrecognized arguments, the same as
+        parse_known_args, or None when argparse must parse them instead.
+
+    """
+    if not SUPPORTED:
+        return None
+    # NOTE: values are only stored once every level has been parsed
+    result = copy.copy(namespace) if namespace is not None else None
+    try:
+        result, extras = parse_level(parser, list(args), result)
+    except (ArgumentError, Unsupported) as err:
+        log.debug("parsing with argparse: %s", err)
+        return None
+    if namespace is None:
+        return result, extras
+    vars(namespace).update(vars(result))
+    return namespace, extras
@@ -2,8 +2,10 @@
 
 # from pprint import pprint
 import argparse
+import os
+import sys
 from argparse import Action, HelpFormatter
-from typing import TYPE_CHECKING, Iterable, Optional
+from typing import IO, TYPE_CHECKING, Any, Iterable, Optional
 
 import colorama
 from colorama import Fore, Style
@@ -14,7 +16,35 @@ if TYPE_CHECKING:
         _MutuallyExclusiveGroup as MutuallyExclusiveGroup,
     )
 
-colorama.init()
+# NOTE: visible width of subcommand names before their help message
+COMMAND_WIDTH = 20
+
+
+def supports_color(stream: Optional[IO[str]] = None) -> bool:
+    """Check if stream should receive colored output.
+
+    Parameters
+    ----------
+    stream: IO[str], optional
+        Stream that output is written, defaults to stdout.
+
+    Returns
+    -------
+    bool:
+        Whether stream is a terminal and NO_COLOR is not set.
+
+    """
+    if os.environ.get('NO_COLOR'):
+        return False
+    isatty = getattr(stream or sys.stdout, 'isatty', None)
+    if not (isatty and isatty()):
+        return False
+    # NOTE: only legacy windows consoles need escape codes translated
+    if sys.platform == 'win32' and hasattr(
+        colorama, 'just_fix_windows_console'
+    ):
+        colorama.just_fix_windows_console()
+    return True
 
 
 class ArgufyHelpFormatter(HelpFormatter):
@@ -22,6 +52,25 @@ class ArgufyHelpFormatter(HelpFormatter):
 
     # argparse.HelpFormatter(prog, max_help_position=80, width=130)
 
+    # NOTE: color is detected from stdout when not set
+    color: Optional[bool] = None
+
+    def __init__(
+        self, *args: Any, color: Optional[bool] = None, **kwargs: Any
+    ) -> None:
+        """Initialize formatter.
+
+        Parameters
+        ----------
+        color: bool, optional
+            Render colored output, otherwise detected from stdout.
+
+        """
+        super().__init__(*args, **kwargs)
+        if color is None:
+            color = self.color
+        self.color = supports_color() if color is None else color
+
     def add_usage(
         self,
         usage: Optional[str],
@@ -31,10 +80,14 @@ class ArgufyHelpFormatter(HelpFormatter):
         prefix: Optional[str] = 'usage: ',
     ) -> None:
         """Format usage message."""
-        if prefix is not None:
-            prefix = self.font(prefix)
+        if prefix:
+            prefix = self.__font(prefix)
         super().add_usage(usage, actions, groups, prefix)
 
+    def start_section(self, heading: Optional[str]) -> None:
+        """Format section heading."""
+        super().start_section(self.__font(heading) if heading else heading)
+
     @staticmethod
     def font(text: str, width: str = 'BRIGHT') -> str:
         """Set the string thickness."""
@@ -45,6 +98,14 @@ class ArgufyHelpFormatter(HelpFormatter):
         """Set the string color."""
         return getattr(Fore, color.upper()) + text + Style.RESET_ALL
 
+    def __font(self, text: str, width: str = 'BRIGHT') -> str:
+        """Set the string thickness when color is enabled."""
+        return self.font(text, width) if self.color else text
+
+    def __shade(self, text: str, color: str = 'CYAN') -> str:
+        """Set the string color when color is enabled."""
+        return self.shade(text, color) if self.color else text
+
     # def _format_action_invocation(self, action: Action) -> str:
     #     """Format arguments summary."""
     #     # TODO: find alternative that does not modify action
@@ -61,7 +122,7 @@ class ArgufyHelpFormatter(HelpFormatter):
     def _expand_help(self, action: Action) -> str:
         """Format help message."""
         if action.help:
-            return self.shade(
+            return self.__shade(
                 super()._expand_help(action).rstrip('.').lower(),
                 'YELLOW',
             )
@@ -70,12 +131,12 @@ class ArgufyHelpFormatter(HelpFormatter):
     def _format_action(self, action: Action) -> str:
         """Format arguments."""
         if isinstance(action, argparse._SubParsersAction._ChoicesPseudoAction):
-            subcommand = self.shade(
-                self.font(self._format_action_invocation(action))
-            )
+            invocation = self._format_action_invocation(action)
+            subcommand = self.__shade(self.__font(invocation))
             help_text = self._expand_help(action)
             # TODO: calculate correct spacing
-            return f"    {subcommand.ljust(37)}{help_text}\n"
+            padding = ' ' * max(0, COMMAND_WIDTH - len(invocation))
+            return f"    {subcommand}{padding}{help_text}\n"
         # action.option_strings = [
         #     self.font(self.shade(option))
         #     for option in action.option_strings
@@ -0,0 +1,134 @@
+# copyright: (c) 2020 by Jesse Johnson.
+# license: Apache 2.0, see LICENSE for more details.
+"""Shared introspection records of command callables."""
+
+import inspect
+from functools import lru_cache
+from inspect import Parameter
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from argufy.docstring import parse as docparse
+
+if TYPE_CHECKING:
+    from inspect import Signature
+
+    from docstring_parser import Docstring, DocstringParam
+
+# NOTE: bounds memory for long running processes building many parsers
+CACHE_SIZE = 1024
+
+
+def index_params(
+    docstring: Optional['Docstring'],
+) -> Dict[str, 'DocstringParam']:
+    """Get docstring params indexed by argument name."""
+    params: Dict[str, 'DocstringParam'] = {}
+    if docstring:
+        for param in docstring.params:
+            # NOTE: first description of an argument takes precedence
+            params.setdefault(param.arg_name, param)
+    return params
+
+
+class Inspection:
+    """Provide signature and docstring details of a callable."""
+
+    __slots__ = (
+        'signature',
+        'splat',
+        '__doc',
+        '__style',
+        '__docstring',
+        '__params',
+    )
+
+    def __init__(self, obj: Any, style: str = 'auto') -> None:
+        """Initialize introspection record.
+
+        Parameters
+        ----------
+        obj: Any
+            Callable to be inspected.
+        style: str
+            Style used to parse the docstring of callable.
+
+        """
+        self.signature: 'Signature' = inspect.signature(obj)
+
+        # variable positional argument passed to callable as splat
+        self.splat: Optional[str] = next(
+            (
+                k
+                for k, v in self.signature.parameters.items()
+                if v.kind == Parameter.VAR_POSITIONAL
+            ),
+            None,
+        )
+
+        # NOTE: docstring is parsed only when first needed
+        self.__doc: Optional[str] = obj.__doc__
+        self.__style = style
+        self.__docstring: Optional['Docstring'] = None
+        self.__params: Optional[Dict[str, 'DocstringParam']] = None
+
+    @property
+    def docstring(self) -> Optional['Docstring']:
+        """Get parsed docstring of callable."""
+        if self.__doc and self.__docstring is None:
+            self.__docstring = docparse(self.__doc, self.__style)
+        return self.__docstring
+
+    @property
+    def params(self) -> Dict[str, 'DocstringParam']:
+        """Get docstring params indexed by argument name."""
+        if self.__params is None:
+            self.__params = index_params(self.docstring)
+        return self.__params
+
+    @property
+    def keywords(self) -> List[str]:
+        """Get docstring arguments that are not part of the signature."""
+        return [x for x in self.params if x not in self.signature.parameters]
+
+    @property
+    def summary(self) -> Optional[str]:
+        """Get short description of callable."""
+        return self.docstring.short_description if self.docstring else None
+
+
+class InspectionCache:
+    """Provide introspection records, evicting least recently used."""
+
+    def __init__(self, maxsize: int = CACHE_SIZE) -> None:
+        """Initialize cache of introspection records."""
+        self.__get = lru_cache(maxsize=maxsize)(Inspection)
+
+    def __call__(self, obj: Any, style: str = 'auto') -> Inspection:
+        """Get introspection record of callable.
+
+        Parameters
+        ----------
+        obj: Any
+            Callable to be inspected.
+        style: str
+            Style used to parse the docstring of callable.
+
+        Returns
+        -------
+        Inspection:
+            Introspection record shared by every parser.
+
+        """
+        # NOTE: style is always passed so defaults share the cached record
+        return self.__get(obj, style)
+
+    def cache_info(self) -> Any:
+        """Get statistics of cached records."""
+        return self.__get.cache_info()
+
+    def cache_clear(self) -> None:
+        """Remove all cached records."""
+        self.__get.cache_clear()
+
+
+get_inspection = InspectionCache()
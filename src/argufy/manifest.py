@@ -0,0 +1,222 @@
+# copyright: (c) 2020 by Jesse Johnson.
+# license: Apache 2.0, see LICENSE for more details.
+"""Static manifests describing parser trees."""
+
+import inspect
+from argparse import Action, ArgumentParser, _HelpAction
+from argparse import _SubParsersAction as SubParsersAction
+from functools import partial
+from types import ModuleType
+from typing import Any, Dict, List
+
+from argufy.cache import decode_value, encode_value
+
+# NOTE: manifest format changes must increment this version
+MANIFEST_VERSION = 1
+
+PARSER_FIELDS = (
+    'prog',
+    'usage',
+    'description',
+    'epilog',
+    'formatter_class',
+    'prefix_chars',
+    'fromfile_prefix_chars',
+    'argument_default',
+    'conflict_handler',
+    'add_help',
+    'allow_abbrev',
+)
+
+ACTION_FIELDS = (
+    'nargs',
+    'const',
+    'default',
+    'type',
+    'choices',
+    'required',
+    'help',
+    'metavar',
+    'version',
+)
+
+
+def _get_action_name(parser: ArgumentParser, action: Action) -> Any:
+    """Get registered name of action or reference to its class."""
+    for name, action_class in parser._registries['action'].items():
+        if name is not None and action_class is type(action):
+            return name
+    return encode_value(type(action))
+
+
+def _dump_action(parser: ArgumentParser, action: Action) -> Dict[str, Any]:
+    """Describe argument of parser."""
+    params = inspect.signature(type(action).__init__).parameters
+    kwargs = {}
+    for field in ACTION_FIELDS:
+        # NOTE: positionals are required implicitly
+        if field == 'required' and not action.option_strings:
+            continue
+        if field in params and hasattr(action, field):
+            value = getattr(action, field)
+            if value != params[field].default:
+                kwargs[field] = encode_value(value)
+    return {
+        'option_strings': list(action.option_strings),
+        'dest': action.dest,
+        'action': _get_action_name(parser, action),
+        'kwargs': kwargs,
+    }
+
+
+def _dump_commands(
+    action: SubParsersAction, rendered: bool = False
+) -> Dict[str, Any]:
+    """Describe subcommands of parser."""
+    helps = {x.dest: x.help for x in action._choices_actions}
+    commands: List[Dict[str, Any]] = []
+    names: Dict[int, Dict[str, Any]] = {}
+    for name in list(action._name_parser_map):
+        # NOTE: build deferred parsers so they can be described
+        if hasattr(action, 'get_parser'):
+            subparser = action.get_parser(name)
+        else:
+            subparser = action._name_parser_map[name]
+        if id(subparser) in names:
+            names[id(subparser)]['aliases'].append(name)
+            continue
+        command: Dict[str, Any] = {
+            'name': name,
+            'aliases': [],
+            'parser': dump(subparser, rendered),
+        }
+        if name in helps:
+            command['help'] = helps[name]
+        names[id(subparser)] = command
+        commands.append(command)
+    return {
+        'dest': action.dest,
+        'prog': action._prog_prefix,
+        'required': action.required,
+        'help': action.help,
+        'metavar': action.metavar,
+        'commands': commands,
+    }
+
+
+def dump(parser: ArgumentParser, rendered: bool = False) -> Dict[str, Any]:
+    """Describe parser, its arguments, and its subcommands.
+
+    Parameters
+    ----------
+    parser: ArgumentParser
+        Parser to be described.
+    rendered: bool
+        Include help and usage rendered for the current terminal.
+
+    Returns
+    -------
+    Dict[str, Any]:
+        JSON compatible description of the parser tree.
+
+    """
+    # NOTE: help deferred until rendered must be described as well
+    if hasattr(parser, 'load_help'):
+        parser.load_help()
+    actions: List[Dict[str, Any]] = []
+    for action in parser._actions:
+        if isinstance(action, _HelpAction):
+            continue
+        if isinstance(action, SubParsersAction):
+            actions.append({'commands': _dump_commands(action, rendered)})
+        else:
+            actions.append({'argument': _dump_action(parser, action)})
+
+    defaults: Dict[str, Any] = {}
+    for key, value in parser._defaults.items():
+        # NOTE: modules are stored by name and imported when required
+        if isinstance(value, ModuleType):
+            defaults[key] = value.__name__
+        else:
+            defaults[key] = encode_value(value)
+
+    record = {
+        'parser': {
+            k: encode_value(getattr(parser, k))
+            for k in PARSER_FIELDS
+            if hasattr(parser, k)
+        },
+        'defaults': defaults,
+        'actions': actions,
+    }
+    if rendered and hasattr(parser, 'help_cache'):
+        parser.format_usage()
+        parser.format_help()
+        record['help'] = dict(parser.help_cache)
+    return record
+
+
+def get_parser_kwargs(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Get arguments used to create parser from its description."""
+    return {k: decode_value(v) for k, v in record['parser'].items()}
+
+
+def load(parser: ArgumentParser, record: Dict[str, Any]) -> None:
+    """Populate parser from its description.
+
+    Parameters
+    ----------
+    parser: ArgumentParser
+        Parser that arguments and subcommands will be added.
+    record: dict
+        Description of the parser tree.
+
+    """
+    parser.set_defaults(
+        **{k: decode_value(v) for k, v in record['defaults'].items()}
+    )
+    for entry in record['actions']:
+        if 'argument' in entry:
+            argument = entry['argument']
+            kwargs = {
+                k: decode_value(v) for k, v in argument['kwargs'].items()
+            }
+            kwargs['action'] = decode_value(argument['action'])
+            if argument['option_strings']:
+                parser.add_argument(
+                    *argument['option_strings'],
+                    dest=argument['dest'],
+                    **kwargs,
+                )
+            else:
+                parser.add_argument(argument['dest'], **kwargs)
+            continue
+
+        commands = entry['commands']
+        command = parser.add_subparsers(
+            dest=commands['dest'],
+            prog=commands['prog'],
+            parser_class=type(parser),
+            required=commands['required'],
+            help=commands['help'],
+            metavar=commands['metavar'],
+        )
+        for cmd in commands['commands']:
+            kwargs = get_parser_kwargs(cmd['parser'])
+            if 'help' in cmd:
+                kwargs['help'] = cmd['help']
+            # NOTE: subcommand parsers are built when selected
+            if hasattr(command, 'add_deferred_parser') and not cmd['aliases']:
+                command.add_deferred_parser(
+                    cmd['name'], partial(load, record=cmd['parser']), **kwargs
+                )
+            else:
+                load(
+                    command.add_parser(
+                        cmd['name'], aliases=cmd['aliases'], **kwargs
+                    ),
+                    cmd['parser'],
+                )
+    # NOTE: rendered help only matches once every action has been added
+    if 'help' in record and hasattr(parser, 'help_cache'):
+        parser.help_cache.update(record['help'])
@@ -2,19 +2,40 @@
 # license: Apache 2.0, see LICENSE for more details.
 """Argufy is an inspection based CLI parser."""
 
+import importlib
 import inspect
+import json
 import logging
+import os
+import re
+import shutil
 import sys
 import typing
-from argparse import ArgumentParser
+import zlib
+from argparse import (
+    _UNRECOGNIZED_ARGS_ATTR,
+    Action,
+    ArgumentError,
+    ArgumentParser,
+    HelpFormatter,
+    _StoreAction,
+)
 from argparse import _SubParsersAction as SubParsersAction
+from bisect import bisect_left
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
 
 # from dataclasses import is_dataclass
+from functools import partial
 from inspect import Parameter
 from inspect import _empty as empty
 from inspect import _ParameterKind as ParameterKind
 from types import ModuleType
 from typing import (
+    IO,
     TYPE_CHECKING,
     Any,
     Callable,
@@ -24,23 +45,200 @@ from typing import (
     Sequence,
     Tuple,
     TypeVar,
+    Union,
 )
 
-from docstring_parser import parse as docparse
-
-from argufy.argument import Argument
-from argufy.formatter import ArgufyHelpFormatter
+from argufy import engine, manifest
+from argufy.argument import Argument, ArgumentSpec, ShortFlags
+from argufy.batch import BatchAction, get_status, read_lines, split_line
+from argufy.binder import Binder
+from argufy.cache import Reference, SpecCache
+from argufy.docstring import STYLES
+from argufy.docstring import parse as docparse
+from argufy.formatter import ArgufyHelpFormatter, supports_color
+from argufy.inspection import get_inspection, index_params
+from argufy.registry import (
+    Command,
+    get_argument_specs,
+    get_summary,
+    registry,
+)
+from argufy.source import (
+    SourceFunction,
+    find_package,
+    get_mtimes,
+    scan_module,
+    scan_package,
+)
 
 if TYPE_CHECKING:
     from argparse import Namespace
-    from inspect import Signature
-
-    from docstring_parser import Docstring, DocstringParam
+    from concurrent.futures import Future
 
 log = logging.getLogger(__name__)
 
 # Define function as parameters for MyPy
 F = TypeVar('F', bound=Callable[..., Any])
+A = TypeVar('A', bound=Action)
+
+EXECUTORS: Dict[str, Callable[..., Executor]] = {
+    'thread': ThreadPoolExecutor,
+    'process': ProcessPoolExecutor,
+}
+ENGINES = ('argparse', 'compiled')
+
+
+def _get_option_tuple_size() -> int:
+    """Get number of fields in the option tuples of argparse."""
+    # NOTE: argparse added the separator of explicit values to option tuples
+    # within patch releases, so the shape is probed instead of versioned
+    parser = ArgumentParser(add_help=False)
+    parser.add_argument('--option')
+    return len(parser._get_option_tuples('--opt')[0])
+
+
+OPTION_TUPLE_SIZE = _get_option_tuple_size()
+
+
+def _get_optionals(args: List[str], prefix_chars: str) -> List[str]:
+    """Get arguments starting with a prefix char."""
+    # NOTE: arguments are joined with NUL, which argv cannot contain, so
+    # they are matched in C instead of one at a time
+    joined = '\0' + '\0'.join(args)
+    if joined.count('\0') == len(args):
+        chars = re.escape(prefix_chars)
+        return re.findall(f"\\0([{chars}][^\\0]*)", joined)
+    return [x for x in args if x and x[0] in prefix_chars]
+
+
+def _add_spec(parser: ArgumentParser, spec: ArgumentSpec) -> None:
+    """Add argument to parser, dropping short flags it already uses."""
+    names, kwargs = spec
+    if len(names) > 1:
+        names = [
+            x
+            for x in names
+            if len(x) != 2 or x not in parser._option_string_actions
+        ]
+    parser.add_argument(*names, **kwargs)
+
+
+class OptionIndex(dict):
+    """Map option strings to actions, indexing them by prefix."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize option map."""
+        super().__init__(*args, **kwargs)
+        self.__keys: Optional[List[str]] = None
+        self.__order: Dict[str, int] = {}
+
+    # NOTE: these are the only methods argparse modifies option maps with
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Map option string to action."""
+        super().__setitem__(key, value)
+        self.__keys = None
+
+    def __delitem__(self, key: str) -> None:
+        """Remove option string."""
+        super().__delitem__(key)
+        self.__keys = None
+
+    def pop(self, key: str, *args: Any) -> Any:
+        """Remove option string and return its action."""
+        self.__keys = None
+        return super().pop(key, *args)
+
+    def match(self, prefix: str, exact: Optional[str] = None) -> List[str]:
+        """Get option strings starting with prefix in the order added.
+
+        Parameters
+        ----------
+        prefix: str
+            Prefix of the option strings.
+        exact: str, optional
+            Option string also matched when equal.
+
+        Returns
+        -------
+        List[str]:
+            Matching option strings.
+
+        """
+        if self.__keys is None:
+            self.__keys = sorted(self)
+            self.__order = {x: i for i, x in enumerate(self)}
+        start = bisect_left(self.__keys, prefix)
+        end = bisect_left(self.__keys, prefix + chr(sys.maxunicode))
+        matches = self.__keys[start:end]
+        if exact is not None and exact in self and exact not in matches:
+            matches.append(exact)
+        return sorted(matches, key=self.__order.__getitem__)
+
+
+class CommandsAction(SubParsersAction):
+    """Provide subparsers that can defer building command parsers."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize subparsers action."""
+        super().__init__(*args, **kwargs)
+        self._deferred: Dict[
+            str, Tuple[Dict[str, Any], Callable[[ArgumentParser], Any]]
+        ] = {}
+
+    def add_deferred_parser(
+        self,
+        name: str,
+        builder: Callable[[ArgumentParser], Any],
+        **kwargs: Any,
+    ) -> None:
+        """Register command name and help without building its parser.
+
+        Parameters
+        ----------
+        name: str
+            Name of the command.
+        builder: Callable
+            Function used to populate the parser once it is created.
+        kwargs: Any
+            Arguments passed to the parser when it is created.
+
+        """
+        if name in self._name_parser_map:
+            raise ArgumentError(self, f"conflicting subparser: {name}")
+
+        # create a pseudo-action to hold the choice help
+        if 'help' in kwargs:
+            help_text = kwargs.pop('help')
+            self._choices_actions.append(
+                self._ChoicesPseudoAction(name, (), help_text)
+            )
+        if kwargs.get('prog') is None:
+            kwargs['prog'] = f"{self._prog_prefix} {name}"
+
+        # NOTE: placeholder keeps choices ordered for usage and validation
+        self._name_parser_map[name] = None
+        self._deferred[name] = (kwargs, builder)
+
+    def get_parser(self, name: str) -> ArgumentParser:
+        """Get command parser, building it first when deferred."""
+        if name in self._deferred:
+            kwargs, builder = self._deferred.pop(name)
+            parser = self._parser_class(**kwargs)
+            self._name_parser_map[name] = parser
+            builder(parser)
+        return self._name_parser_map[name]
+
+    def __call__(
+        self,
+        parser: ArgumentParser,
+        namespace: 'Namespace',
+        values: Any,
+        option_string: Optional[str] = None,
+    ) -> None:
+        """Build selected command parser before parsing its arguments."""
+        if values and values[0] in self._deferred:
+            self.get_parser(values[0])
+        super().__call__(parser, namespace, values, option_string)
 
 
 class Parser(ArgumentParser):
@@ -80,15 +278,61 @@ class Parser(ArgumentParser):
         allow_abbrev: bool
             Allows long options to be abbreviated if the abbreviation is
             unambiguous
+        lazy_commands: bool
+            Defer building command parsers until they are selected
+        spec_cache: SpecCache
+            Cache used to store introspected command specs on disk
+        lazy_help: bool
+            Take types from signatures and parse docstrings for help only
+            when it is rendered
+        docstring_style: str
+            Style of docstrings: 'auto', 'rest', 'google', 'numpy',
+            'epydoc', or 'scan' for parameters only
+        batch: bool
+            Add a --batch flag that dispatches command lines from a file
+        server: bool
+            Add a --serve flag that dispatches commands sent over a socket
+        chain_workers: int
+            Run chained commands concurrently with this many at once
+        chain_executor: str
+            Pool running chained commands: 'thread' or 'process'
+        parse_engine: str
+            Parse with 'argparse', or tables 'compiled' from the parser,
+            which falls back to argparse before Python 3.8
+        short_flags: str
+            Allocate short flags by 'case', 'letters', or 'none' at all
 
         """
         # TODO: handle environment variables
 
-        module = self.__get_parent_module()
+        spec_cache = kwargs.pop('spec_cache', None)
+        self.spec_cache: Optional[SpecCache] = (
+            SpecCache() if spec_cache is True else spec_cache or None
+        )
+        self.lazy_help = kwargs.pop('lazy_help', False)
+        self.docstring_style = kwargs.pop('docstring_style', 'auto')
+        if self.docstring_style not in STYLES:
+            raise ValueError(
+                f"unknown docstring style: {self.docstring_style}"
+            )
+        # NOTE: objects whose docstrings describe arguments without help
+        self.help_sources: List[Any] = []
+
+        # NOTE: subparsers and manifests provide their own description
+        module = (
+            self.__get_parent_module()
+            if 'description' not in kwargs or 'prog' not in kwargs
+            else None
+        )
         if module and module.__doc__:
-            docstring = docparse(module.__doc__)
-            if not kwargs.get('description'):
-                kwargs['description'] = docstring.short_description
+            if 'description' not in kwargs:
+                kwargs['description'] = (
+                    get_summary(module)
+                    if self.spec_cache or self.lazy_help
+                    else docparse(
+                        module.__doc__, self.docstring_style
+                    ).short_description
+                )
             if 'prog' not in kwargs:
                 kwargs['prog'] = module.__name__.split('.')[0]
         if 'version' in kwargs:
@@ -108,19 +352,44 @@ class Parser(ArgumentParser):
         self.main_args_builder = kwargs.pop('main_args_builder', None)
         self.command_type = kwargs.pop('command_type', None)
         self.command_scheme = kwargs.pop('command_scheme', None)
+        self.lazy_commands = kwargs.pop('lazy_commands', False)
+        self.chain_workers = kwargs.pop('chain_workers', None)
+        self.chain_executor = kwargs.pop('chain_executor', 'thread')
+        self.parse_engine = kwargs.pop('parse_engine', 'argparse')
+        if self.parse_engine not in ENGINES:
+            raise ValueError(f"unknown parse engine: {self.parse_engine}")
+        self.short_flags = kwargs.pop('short_flags', 'case')
+        if self.short_flags not in ShortFlags.strategies:
+            raise ValueError(
+                f"unknown short flag strategy: {self.short_flags}"
+            )
+        # NOTE: rendered help and usage keyed by terminal and parser layout
+        self.help_cache: Dict[str, str] = {}
+        # NOTE: stream that help or usage is being printed to
+        self.__stream: Any = None
+        batch = kwargs.pop('batch', False)
+        server = kwargs.pop('server', False)
+        self.__binders: Dict[Callable[..., Any], Binder] = {}
 
         if 'formatter_class' not in kwargs:
             self.formatter_class = ArgufyHelpFormatter
 
         super().__init__(**kwargs)
-
-        # NOTE: cannot move to formatter
-        self._positionals.title = ArgufyHelpFormatter.font(
-            self._positionals.title or 'arguments'
-        )
-        self._optionals.title = ArgufyHelpFormatter.font(
-            self._optionals.title or 'flags'
-        )
+        self.register('action', 'parsers', CommandsAction)
+
+        # NOTE: argument groups share the option map of their parser
+        options = OptionIndex(self._option_string_actions)
+        for container in [
+            self,
+            *self._action_groups,
+            *self._mutually_exclusive_groups,
+        ]:
+            container._option_string_actions = options
+        self.register('action', 'batch', BatchAction)
+
+        # NOTE: section headings are styled by the formatter
+        self._positionals.title = self._positionals.title or 'arguments'
+        self._optionals.title = self._optionals.title or 'flags'
 
         # XXX version lookup infinite loop when absent
         if hasattr(self, 'prog_version'):
@@ -130,25 +399,91 @@ class Parser(ArgumentParser):
                 version=f"%(prog)s {self.prog_version}",
                 help='display application version',
             )
+        if batch:
+            self.add_argument(
+                '--batch',
+                action='batch',
+                help='dispatch command lines read from file, or - for stdin',
+            )
+        if server:
+            # NOTE: server support is only imported when requested
+            from argufy.server import ServeAction
+
+            self.add_argument(
+                '--serve',
+                action=ServeAction,
+                help='dispatch commands sent by clients over a unix socket',
+            )
+
+    @classmethod
+    def from_manifest(
+        cls, source: Union[str, Dict[str, Any]], **kwargs: Any
+    ) -> 'Parser':
+        """Create parser from a static manifest.
+
+        Parameters
+        ----------
+        source: Union[str, Dict[str, Any]]
+            Filepath of manifest or the loaded manifest itself.
+        kwargs: Any
+            Parser settings that override those of the manifest.
+
+        Returns
+        -------
+        Parser:
+            Parser with commands that import their module when selected.
+
+        """
+        if isinstance(source, str):
+            with open(source, encoding='utf-8') as f:
+                record: Dict[str, Any] = json.load(f)
+        else:
+            record = source
+        if record.get('version') != manifest.MANIFEST_VERSION:
+            raise ValueError(f"unsupported manifest: {record.get('version')}")
+        settings = {**record['settings'], **kwargs}
+        parser = cls(**manifest.get_parser_kwargs(record), **settings)
+        manifest.load(parser, record)
+        return parser
+
+    def to_manifest(self, rendered: bool = False) -> Dict[str, Any]:
+        """Describe parser tree as a static manifest.
+
+        Parameters
+        ----------
+        rendered: bool
+            Include help and usage rendered for the current terminal.
+
+        Returns
+        -------
+        Dict[str, Any]:
+            JSON compatible description of parser and its commands.
+
+        """
+        return {
+            'version': manifest.MANIFEST_VERSION,
+            'settings': {
+                'use_module_args': self.use_module_args,
+                'main_args_builder': self.main_args_builder,
+                'command_type': self.command_type,
+                'command_scheme': self.command_scheme,
+                'chain_workers': self.chain_workers,
+                'chain_executor': self.chain_executor,
+                'parse_engine': self.parse_engine,
+                'short_flags': self.short_flags,
+                'lazy_help': self.lazy_help,
+                'docstring_style': self.docstring_style,
+            },
+            **manifest.dump(self, rendered),
+        }
 
     @staticmethod
     def __get_parent_module() -> Optional[ModuleType]:
         """Get name of module importing this module."""
-        stack = inspect.stack()
         # TODO: need way to better identify parent module
-        stack_frame = stack[2]
-        result = inspect.getmodule(stack_frame[0]) or None
-        return result
-
-    @staticmethod
-    def __clean_args(argument: Argument) -> Dict[Any, Any]:
-        """Retrieve cleaned parameters from an Argument."""
-        size = len('_Argument__')
-        return {
-            k[size:]: v
-            for k, v in vars(argument).items()
-            if k.startswith('_Argument__')
-        }
+        # NOTE: avoid inspect.stack which reads source for every frame
+        frame = sys._getframe(2)
+        return sys.modules.get(frame.f_globals.get('__name__', ''))
 
     @staticmethod
     def _get_excludes(exclude_prefixes: Tuple[str, ...] = tuple()) -> tuple:
@@ -157,24 +492,6 @@ class Parser(ArgumentParser):
             return tuple(exclude_prefixes) + Parser.exclude_prefixes
         return Parser.exclude_prefixes
 
-    @staticmethod
-    def __get_description(
-        name: str, docstring: 'Docstring'
-    ) -> Optional['DocstringParam']:
-        """Get argument description from docstring."""
-        return next((d for d in docstring.params if d.arg_name == name), None)
-
-    @staticmethod
-    def __get_keyword_args(
-        signature: 'Signature', docstring: 'Docstring'
-    ) -> List[str]:
-        """Get keyward arguments from docstring."""
-        return [
-            x.arg_name
-            for x in docstring.params
-            if x.arg_name not in list(signature.parameters)
-        ]
-
     @staticmethod
     def __generate_parameter(name: str, module: ModuleType) -> Parameter:
         """Generate inpect parameter."""
@@ -186,77 +503,190 @@ class Parser(ArgumentParser):
         )
         return parameter
 
-    def add_commands(  # pylint: disable=too-many-locals,too-many-branches
+    def __get_cache_settings(
+        self, excludes: tuple, style: str
+    ) -> Dict[str, Any]:
+        """Get parser settings that affect cached module specs."""
+        return {
+            'excludes': list(excludes),
+            'command_scheme': self.command_scheme,
+            'use_module_args': self.use_module_args,
+            'main_args_builder': self.main_args_builder,
+            'short_flags': self.short_flags,
+            'lazy_help': self.lazy_help,
+            'docstring_style': style,
+        }
+
+    def __get_module_spec(
+        self,
+        module: Union[ModuleType, str],
+        excludes: tuple,
+        style: str,
+        lazy: bool = False,
+    ) -> Dict[str, Any]:
+        """Get module spec from cache or by inspecting module."""
+        registered = self.__get_registry_spec(module, excludes, style, lazy)
+        if registered is not None:
+            return registered
+        if self.spec_cache:
+            settings = self.__get_cache_settings(excludes, style)
+            spec = self.spec_cache.load(module, settings)
+            if spec is None:
+                # NOTE: cached specs must include every command argument
+                spec = self.__inspect_module(
+                    importlib.import_module(module)
+                    if isinstance(module, str)
+                    else module,
+                    excludes,
+                    style,
+                )
+                self.spec_cache.store(module, settings, spec)
+            return spec
+        if isinstance(module, str):
+            source_spec = self.__scan_module(module, excludes)
+            if source_spec is not None:
+                return source_spec
+            module = importlib.import_module(module)
+        return self.__inspect_module(module, excludes, style, lazy)
+
+    def __get_command_spec(
+        self,
+        entry: Command,
+        module_name: str,
+        style: str,
+        lazy: bool = False,
+    ) -> Dict[str, Any]:
+        """Get command spec of a declared command."""
+        name = entry.name
+        # control command name format
+        if self.command_scheme == 'chain':
+            name = f"{module_name.replace('_', '-')}.{name}"
+        return {
+            'name': name,
+            'function': entry.fn.__name__,
+            'help': entry.get_help(style, self.lazy_help),
+            # defer arguments until command is selected
+            'arguments': (
+                None
+                if lazy
+                else entry.get_arguments(
+                    style, self.short_flags, self.lazy_help
+                )
+            ),
+            'fn': entry.fn,
+        }
+
+    def __get_registry_spec(
+        self,
+        module: Union[ModuleType, str],
+        excludes: tuple,
+        style: str,
+        lazy: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """Get module spec from commands declared with the decorator."""
+        # NOTE: module variables and builder arguments require inspection
+        if self.use_module_args or self.main_args_builder:
+            return None
+        name = module if isinstance(module, str) else module.__name__
+        if name not in registry:
+            return None
+        module_name = name.split('.')[-1]
+        return {
+            'description': (
+                None if isinstance(module, str) else get_summary(module)
+            ),
+            'arguments': [],
+            'commands': [
+                self.__get_command_spec(x, module_name, style, lazy)
+                for x in registry[name].values()
+                if not x.fn.__name__.startswith(excludes)
+            ],
+        }
+
+    def __scan_module(
+        self, name: str, excludes: tuple
+    ) -> Optional[Dict[str, Any]]:
+        """Get module spec from source without importing module."""
+        # NOTE: module variables and builder arguments require import
+        if self.use_module_args:
+            return None
+        summary = scan_module(name)
+        if summary is None or (
+            self.main_args_builder
+            and self.main_args_builder['function'] in summary['functions']
+        ):
+            return None
+
+        module_name = name.split('.')[-1]
+        commands = []
+        for function in sorted(summary['functions']):
+            if function.startswith(excludes):
+                continue
+            # control command name format
+            if self.command_scheme == 'chain':
+                cmd_name = f"{module_name}.{function}"
+            else:
+                cmd_name = function
+            commands.append(
+                {
+                    'name': cmd_name.replace('_', '-'),
+                    'function': function,
+                    'help': summary['functions'][function],
+                    'arguments': None,
+                    'fn': summary['sources'][function],
+                }
+            )
+        return {
+            'description': summary['description'],
+            'arguments': [],
+            'commands': commands,
+        }
+
+    # pylint: disable-next=too-many-branches
+    def __inspect_module(
         self,
         module: ModuleType,
-        parser: Optional[ArgumentParser] = None,
-        exclude_prefixes: tuple = tuple(),
-        command_type: Optional[str] = None,
-    ) -> 'Parser':
-        """Add commands.
+        excludes: tuple,
+        style: str,
+        lazy: bool = False,
+    ) -> Dict[str, Any]:
+        """Inspect module for commands and arguments.
 
         Parameters
         ----------
-        module: ModuleType,
+        module: ModuleType
             Module used to import functions for CLI commands.
-        parser: ArgumentParser, optional
-            Parser used to append subparsers to create subcommands.
-        exclude_prefixes: tuple,
+        excludes: tuple
             Methods from a module that should be excluded.
-        command_type: str, optional
-            Choose format type of commands to be created.
+        style: str
+            Style used to parse docstrings.
+        lazy: bool
+            Defer inspecting command arguments.
 
         Returns
         -------
-        self:
-            Return object itself to allow chaining functions.
+        Dict[str, Any]:
+            Module description, parser arguments, and commands.
 
         """
-        # use self or an existing parser
-        if not parser:
-            parser = self
-        parser.formatter_class = ArgufyHelpFormatter
-
         module_name = module.__name__.split('.')[-1]
-        docstring = docparse(module.__doc__) if module.__doc__ else None
-        excludes = Parser._get_excludes(exclude_prefixes)
-
-        # use exsiting subparser or create a new one
-        if not any(isinstance(x, SubParsersAction) for x in parser._actions):
-            # TODO: use metavar for hidden commands
-            parser.add_subparsers(dest=module_name, parser_class=Parser)
-
-        # check if command exists
-        command = next(
-            (x for x in parser._actions if isinstance(x, SubParsersAction)),
-            None,
-        )
-
-        # set command name scheme
-        if command_type is None:
-            command_type = self.command_type
-
-        # create subcommand for command
-        if command_type == 'subcommand':
-            if command:
-                msg = docstring.short_description if docstring else None
-                subcommand = command.add_parser(
-                    module_name.replace('_', '-'),
-                    description=msg,
-                    formatter_class=self.formatter_class,
-                    help=msg,
-                )
-                subcommand.set_defaults(mod=module)
-
-            # append subcommand to exsiting command or create a new one
-            return self.add_commands(
-                module=module,
-                parser=subcommand,
-                exclude_prefixes=Parser._get_excludes(exclude_prefixes),
-                command_type='command',
+        if self.lazy_help:
+            docstring = None
+            description = get_summary(module)
+        else:
+            docstring = (
+                docparse(module.__doc__, style) if module.__doc__ else None
             )
+            description = docstring.short_description if docstring else None
+        params = index_params(docstring)
+        spec: Dict[str, Any] = {
+            'description': description,
+            'arguments': [],
+            'commands': [],
+        }
+        # NOTE: module arguments are all added to the same parser
+        short_flags = ShortFlags(self.short_flags)
 
-        # TODO: separate into method
         # pylint: disable-next=too-many-nested-blocks
         for name, value in inspect.getmembers(module):
             # TODO: Possible singledispatch candidate
@@ -276,7 +706,11 @@ class Parser(ArgumentParser):
                         self.main_args_builder
                         and name == self.main_args_builder['function']
                     ):
-                        self.add_arguments(value, parser)
+                        spec['arguments'].extend(
+                            self.__get_argument_specs(
+                                value, style, short_flags
+                            )
+                        )
 
                     # create commands from functions
                     elif (
@@ -287,29 +721,31 @@ class Parser(ArgumentParser):
                             and name == self.main_args_builder['function']
                         )
                     ):
-                        # create command from function
-                        if command:
-                            # control command name format
-                            if self.command_scheme == 'chain':
-                                cmd_name = f"{module_name}.{name}"
-                            else:
-                                cmd_name = name
-
-                            msg = (
-                                docparse(value.__doc__).short_description
-                                if value.__doc__
-                                else None
-                            )
-                            cmd = command.add_parser(
-                                cmd_name.replace('_', '-'),
-                                description=msg,
-                                formatter_class=self.formatter_class,
-                                help=msg,
-                            )
-                            cmd.set_defaults(mod=module, fn=value)
-                        # add arguments from function
-                        # log.debug("command %s %s %s", name, value, cmd)
-                        self.add_arguments(value, cmd)
+                        # control command name format
+                        if self.command_scheme == 'chain':
+                            cmd_name = f"{module_name}.{name}"
+                        else:
+                            cmd_name = name
+
+                        # defer arguments until command is selected
+                        if lazy or self.lazy_help:
+                            msg = get_summary(value)
+                        else:
+                            msg = get_inspection(value, style).summary
+                        spec['commands'].append(
+                            {
+                                'name': cmd_name.replace('_', '-'),
+                                'function': name,
+                                'help': msg,
+                                'arguments': (
+                                    None
+                                    if lazy
+                                    else self.__get_argument_specs(
+                                        value, style
+                                    )
+                                ),
+                            }
+                        )
 
                 # create arguments from module varibles
                 elif (
@@ -323,18 +759,417 @@ class Parser(ArgumentParser):
                 ):
                     # TODO: Reconcile inspect parameters with dict
                     # TODO: use argparse.SUPPRESS for hidden arguments
-                    arguments = self.__clean_args(
-                        Argument(
-                            self.__get_description(name, docstring)
-                            if docstring
-                            else None,
-                            self.__generate_parameter(name, module),
-                        )
+                    argument = Argument(
+                        params.get(name),
+                        self.__generate_parameter(name, module),
+                        short_flags,
+                    )
+                    spec['arguments'].append(argument.spec)
+        return spec
+
+    def add_commands(
+        self,
+        module: Union[ModuleType, str],
+        parser: Optional[ArgumentParser] = None,
+        exclude_prefixes: tuple = tuple(),
+        command_type: Optional[str] = None,
+        lazy_commands: Optional[bool] = None,
+        docstring_style: Optional[str] = None,
+    ) -> 'Parser':
+        """Add commands.
+
+        Parameters
+        ----------
+        module: Union[ModuleType, str],
+            Module, or dotted path of module that is imported only when
+            one of its commands is selected, used for CLI commands.
+        parser: ArgumentParser, optional
+            Parser used to append subparsers to create subcommands.
+        exclude_prefixes: tuple,
+            Methods from a module that should be excluded.
+        command_type: str, optional
+            Choose format type of commands to be created.
+        lazy_commands: bool, optional
+            Defer building command parsers until they are selected.
+        docstring_style: str, optional
+            Style of docstrings in module, otherwise that of the parser.
+
+        Returns
+        -------
+        self:
+            Return object itself to allow chaining functions.
+
+        """
+        # use self or an existing parser
+        if not parser:
+            parser = self
+
+        excludes = Parser._get_excludes(exclude_prefixes)
+        if isinstance(module, str) and module in sys.modules:
+            module = sys.modules[module]
+
+        # set command name scheme
+        if command_type is None:
+            command_type = self.command_type
+        if lazy_commands is None:
+            lazy_commands = self.lazy_commands
+        if docstring_style is None:
+            docstring_style = self.docstring_style
+        elif docstring_style not in STYLES:
+            raise ValueError(f"unknown docstring style: {docstring_style}")
+        spec = self.__get_module_spec(
+            module, excludes, docstring_style, lazy_commands
+        )
+
+        # create subcommand for command
+        if command_type == 'subcommand':
+            module_name = self.__get_module_name(module)
+            command = self.__get_command(parser, module_name)
+            msg = spec['description']
+
+            def build_subcommand(subcommand: ArgumentParser) -> None:
+                subcommand.set_defaults(mod=module)
+                # append subcommand to exsiting command or create a new one
+                self.__add_spec_commands(
+                    module, spec, subcommand, docstring_style, lazy_commands
+                )
+
+            if (lazy_commands or isinstance(module, str)) and isinstance(
+                command, CommandsAction
+            ):
+                command.add_deferred_parser(
+                    module_name.replace('_', '-'),
+                    build_subcommand,
+                    description=msg,
+                    formatter_class=self.formatter_class,
+                    help=msg,
+                )
+            else:
+                build_subcommand(
+                    command.add_parser(
+                        module_name.replace('_', '-'),
+                        description=msg,
+                        formatter_class=self.formatter_class,
+                        help=msg,
                     )
-                    name = arguments.pop('name')
-                    parser.add_argument(*name, **arguments)
+                )
+            return self
+
+        self.__add_spec_commands(
+            module, spec, parser, docstring_style, lazy_commands
+        )
         return self
 
+    def add_package(
+        self,
+        package: Union[ModuleType, str],
+        parser: Optional[ArgumentParser] = None,
+        recursive: bool = True,
+        exclude_prefixes: tuple = tuple(),
+        docstring_style: Optional[str] = None,
+    ) -> 'Parser':
+        """Add modules of package as subcommands built when selected.
+
+        Parameters
+        ----------
+        package: Union[ModuleType, str]
+            Package, or dotted path of package, whose modules are added.
+        parser: ArgumentParser, optional
+            Parser used to append subparsers to create subcommands.
+        recursive: bool
+            Add subpackages as subcommands of their modules.
+        exclude_prefixes: tuple
+            Modules, and functions of modules, that should be excluded.
+        docstring_style: str, optional
+            Style of docstrings in package, otherwise that of the parser.
+
+        Returns
+        -------
+        self:
+            Return object itself to allow chaining functions.
+
+        """
+        if not parser:
+            parser = self
+        if isinstance(package, str):
+            name, path = package, find_package(package)
+        else:
+            name = package.__name__
+            path = next(iter(getattr(package, '__path__', [])), None)
+        if path is None:
+            raise ValueError(f"not a package: {name}")
+        if docstring_style is not None and docstring_style not in STYLES:
+            raise ValueError(f"unknown docstring style: {docstring_style}")
+
+        # NOTE: modules found by previous runs are reused while the
+        # directories they were found in are unchanged
+        index = self.spec_cache.load_index(name) if self.spec_cache else None
+        self.__add_package_level(
+            name,
+            path,
+            {
+                'root': name,
+                'index': index or {},
+                'recursive': recursive,
+                'excludes': tuple(exclude_prefixes),
+                'style': docstring_style,
+            },
+            parser,
+        )
+        return self
+
+    def __add_package_level(
+        self,
+        name: str,
+        path: str,
+        settings: Dict[str, Any],
+        parser: ArgumentParser,
+    ) -> None:
+        """Populate parser with deferred subcommands of a package."""
+        index = settings['index']
+        mtime = os.stat(path).st_mtime_ns
+        entry = index.get(name)
+        # NOTE: editing a module only changes the mtime of its own file
+        if (
+            entry is None
+            or entry['mtime'] != mtime
+            or entry.get('mtimes')
+            != get_mtimes(path, entry['modules'], entry['packages'])
+        ):
+            log.debug("discovering modules of %s", name)
+            entry = index[name] = {'mtime': mtime, **scan_package(path)}
+            if self.spec_cache:
+                self.spec_cache.store_index(settings['root'], index)
+
+        # NOTE: selecting the level without a command shows its help
+        if name != settings['root']:
+            parser.set_defaults(mod=name)
+        excludes = Parser._get_excludes(settings['excludes'])
+        command = self.__get_command(parser, name.split('.')[-1])
+        children = [
+            (x, partial(self.__add_package_module, f"{name}.{x}", settings))
+            for x in entry['modules']
+        ]
+        if settings['recursive']:
+            children.extend(
+                (
+                    x,
+                    partial(
+                        self.__add_package_level,
+                        f"{name}.{x}",
+                        os.path.join(path, x),
+                        settings,
+                    ),
+                )
+                for x in entry['packages']
+            )
+        for child, builder in sorted(children, key=lambda x: x[0]):
+            if child.startswith(excludes):
+                continue
+            summary = entry['summaries'].get(child)
+            if isinstance(command, CommandsAction):
+                command.add_deferred_parser(
+                    child.replace('_', '-'),
+                    builder,
+                    description=summary,
+                    formatter_class=self.formatter_class,
+                    help=summary,
+                )
+            else:
+                builder(
+                    command.add_parser(
+                        child.replace('_', '-'),
+                        description=summary,
+                        formatter_class=self.formatter_class,
+                        help=summary,
+                    )
+                )
+
+    def __add_package_module(
+        self, name: str, settings: Dict[str, Any], parser: ArgumentParser
+    ) -> None:
+        """Populate parser with commands of a package module."""
+        parser.set_defaults(mod=name)
+        self.add_commands(
+            name,
+            parser,
+            settings['excludes'],
+            command_type='command',
+            docstring_style=settings['style'],
+        )
+
+    def command(
+        self,
+        fn: Optional[Callable[..., Any]] = None,
+        *,
+        name: Optional[str] = None,
+        help: Optional[str] = None,  # pylint: disable=redefined-builtin
+    ) -> Any:
+        """Add function as a command of this parser.
+
+        Parameters
+        ----------
+        fn: Callable[..., Any], optional
+            Function added, when used without arguments.
+        name: str, optional
+            Name of the command, otherwise that of the function.
+        help: str, optional
+            Help of the command, otherwise the summary of its docstring.
+
+        Returns
+        -------
+        Any:
+            Function unchanged, or decorator when used with arguments.
+
+        """
+
+        def register(fn: Callable[..., Any]) -> Callable[..., Any]:
+            style = self.docstring_style
+            entry = Command(fn, name, help)
+            module = sys.modules.get(fn.__module__, fn.__module__)
+            spec = {
+                'description': None,
+                'arguments': [],
+                'commands': [
+                    self.__get_command_spec(
+                        entry,
+                        self.__get_module_name(module),
+                        style,
+                        self.lazy_commands,
+                    )
+                ],
+            }
+            self.__add_spec_commands(
+                module, spec, self, style, self.lazy_commands
+            )
+            return fn
+
+        return register if fn is None else register(fn)
+
+    @staticmethod
+    def __get_module_name(module: Union[ModuleType, str]) -> str:
+        """Get last component of module name."""
+        name = module if isinstance(module, str) else module.__name__
+        return name.split('.')[-1]
+
+    @staticmethod
+    def __get_command(parser: ArgumentParser, dest: str) -> SubParsersAction:
+        """Get existing subparsers or create a new one."""
+        parser.formatter_class = ArgufyHelpFormatter
+
+        # check if command exists
+        command = next(
+            (x for x in parser._actions if isinstance(x, SubParsersAction)),
+            None,
+        )
+        if command is None:
+            # TODO: use metavar for hidden commands
+            command = parser.add_subparsers(dest=dest, parser_class=Parser)
+        return command
+
+    def __add_spec_commands(
+        self,
+        module: Union[ModuleType, str],
+        spec: Dict[str, Any],
+        parser: ArgumentParser,
+        style: str,
+        lazy_commands: bool = False,
+    ) -> None:
+        """Populate parser with arguments and commands from module spec."""
+        command = self.__get_command(parser, self.__get_module_name(module))
+        # NOTE: modules given by dotted path are imported when selected
+        lazy = (lazy_commands or isinstance(module, str)) and isinstance(
+            command, CommandsAction
+        )
+
+        for argument in spec['arguments']:
+            _add_spec(parser, argument)
+        if (
+            self.lazy_help
+            and spec['arguments']
+            and isinstance(parser, Parser)
+            and isinstance(module, ModuleType)
+        ):
+            parser.help_sources.append((module, style))
+            if self.main_args_builder:
+                parser.help_sources.append(
+                    (
+                        getattr(module, self.main_args_builder['function']),
+                        style,
+                    )
+                )
+
+        # create command from function
+        for cmd_spec in spec['commands']:
+            builder = partial(
+                self.__build_command,
+                module,
+                cmd_spec['function'],
+                cmd_spec['arguments'],
+                style,
+                cmd_spec.get('fn'),
+            )
+            if lazy:
+                command.add_deferred_parser(  # type: ignore
+                    cmd_spec['name'],
+                    builder,
+                    description=cmd_spec['help'],
+                    formatter_class=self.formatter_class,
+                    help=cmd_spec['help'],
+                )
+            else:
+                builder(
+                    command.add_parser(
+                        cmd_spec['name'],
+                        description=cmd_spec['help'],
+                        formatter_class=self.formatter_class,
+                        help=cmd_spec['help'],
+                    )
+                )
+
+    def __build_command(
+        self,
+        module: Union[ModuleType, str],
+        function: str,
+        arguments: Optional[List[ArgumentSpec]],
+        style: str,
+        fn: Optional[Callable[..., Any]],
+        cmd: ArgumentParser,
+    ) -> None:
+        """Populate command parser from function."""
+        if fn is None:
+            if isinstance(module, str):
+                module = importlib.import_module(module)
+            fn = getattr(module, function)
+        cmd.set_defaults(mod=module, fn=fn)
+
+        # log.debug("command %s %s %s", name, value, cmd)
+        if arguments is None:
+            arguments = self.__get_argument_specs(fn, style)
+        for argument in arguments:
+            _add_spec(cmd, argument)
+        if self.lazy_help and isinstance(cmd, Parser):
+            cmd.help_sources.append((fn, style))
+
+        # NOTE: compile call layout once when command is registered, or
+        # once imported for functions read from source
+        if not isinstance(fn, SourceFunction):
+            self.__binders[fn] = Binder(fn, (x.dest for x in cmd._actions))
+
+    def __get_argument_specs(
+        self,
+        obj: Any,
+        style: str,
+        short_flags: Optional[ShortFlags] = None,
+    ) -> List[ArgumentSpec]:
+        """Get argument names and argparse parameters from object."""
+        return get_argument_specs(
+            obj,
+            style,
+            self.short_flags if short_flags is None else short_flags,
+            self.lazy_help,
+        )
+
     def add_arguments(
         self, obj: Any, parser: Optional[ArgumentParser] = None
     ) -> 'Parser':
@@ -355,112 +1190,339 @@ class Parser(ArgumentParser):
         """
         if not parser:
             parser = self
-
-        # prep object for inspection
-        docstring = docparse(obj.__doc__)
-        signature = inspect.signature(obj)
-
-        # populate subcommand with keyword arguments
-        for arg in signature.parameters:
-            param = signature.parameters[arg]
-            description = self.__get_description(arg, docstring)
-            log.debug("param: %s, %s", param, param.kind)
-
-            if not param.kind == Parameter.VAR_KEYWORD:
-                log.debug("param annotation: %s", param.annotation)
-                argument = self.__clean_args(Argument(description, param))
-                name = argument.pop('name')
-                # print(name, argument)
-                parser.add_argument(*name, **argument)
-
-        # populate options
-        # log.debug("params %s", params)
-        if docstring:
-            for arg in self.__get_keyword_args(signature, docstring):
-                description = self.__get_description(arg, docstring)
-                arguments = self.__clean_args(Argument(docstring=description))
-                parser.add_argument(f"--{arg.replace('_', '-')}", **arguments)
-
-        # log.debug("arguments %s", arguments)
-        # TODO for any docstring not collected parse here (args, kwargs)
-        # log.debug('docstring params', docstring.params)
+        for argument in self.__get_argument_specs(obj, self.docstring_style):
+            _add_spec(parser, argument)
         return self
 
-    def __set_main_arguments(self, ns: 'Namespace') -> 'Namespace':
+    def __get_binder(self, fn: Callable[..., Any]) -> Binder:
+        """Get precompiled binder of command."""
+        binder = self.__binders.get(fn)
+        if binder is None:
+            binder = self.__binders[fn] = Binder(fn)
+        return binder
+
+    def __set_main_arguments(self, values: Dict[str, Any]) -> None:
         """Separate and set main arguments from builder function.
 
         Paramters
         ---------
-        ns: Namespace
-            Argparse namespace object for a command.
-
-        Returns
-        -------
-        Namespace:
-            Argparse namespace object with command arguments.
+        values: dict
+            Parsed values of a command.
 
         """
         # pass main arguments to builder function
         if self.main_args_builder:
-            builder_mod = sys.modules[self.main_args_builder['module']]
+            builder_mod = importlib.import_module(
+                self.main_args_builder['module']
+            )
             builder = getattr(builder_mod, self.main_args_builder['function'])
-            builder_signature = inspect.signature(builder)
-            builder_args = {}
-            for param in builder_signature.parameters:
-                if param in vars(ns):
-                    builder_args[param] = vars(ns).pop(param)
+            builder_args = {
+                k: values.pop(k)
+                for k in self.__get_binder(builder).parameters
+                if k in values
+            }
             builder_mod.__dict__[self.main_args_builder['instance']] = builder(
                 **builder_args
             )
-        return ns
 
-    def __set_module_arguments(
-        self, fn: Callable[[F], F], ns: 'Namespace'
-    ) -> 'Namespace':
-        """Separate and set module arguments from functions.
+    def __get_help_layout(self) -> str:
+        """Get digest of the parser details shown by help and usage."""
+        texts: List[Any] = [
+            self.prog,
+            self.usage,
+            self.description,
+            self.epilog,
+        ]
+        for action in self._actions:
+            texts += [
+                action.option_strings,
+                action.dest,
+                action.nargs,
+                action.required,
+                action.metavar,
+                action.help,
+            ]
+            if isinstance(action, SubParsersAction):
+                texts += [
+                    (x.dest, x.metavar, x.help)
+                    for x in action._choices_actions
+                ]
+            else:
+                texts.append(action.choices)
+        # NOTE: digest is stable between processes for rendered manifests
+        return f"{zlib.crc32(repr(texts).encode('utf-8')):08x}"
+
+    def __get_color(self, stream: Any = None) -> bool:
+        """Check if messages are colored for the stream printed to."""
+        color = getattr(self.formatter_class, 'color', None)
+        if color is None:
+            color = supports_color(stream or self.__stream)
+        return color
+
+    def __render(self, kind: str, render: Callable[[], str]) -> str:
+        """Get message rendered for the terminal and parser layout."""
+        color = self.__get_color()
+        layout = f":{self.__get_help_layout()}"
+        width = shutil.get_terminal_size().columns
+        key = f"{kind}:{width}:{color:d}{layout}"
+        if key not in self.help_cache:
+            # NOTE: messages rendered before the parser changed are stale
+            for stale in [
+                x for x in self.help_cache if not x.endswith(layout)
+            ]:
+                del self.help_cache[stale]
+            self.help_cache[key] = render()
+        return self.help_cache[key]
+
+    def _add_action(self, action: A) -> A:
+        """Add action, discarding help rendered without it."""
+        self.help_cache.clear()
+        return super()._add_action(action)
+
+    def _remove_action(self, action: Action) -> None:
+        """Remove action, discarding help rendered with it."""
+        self.help_cache.clear()
+        super()._remove_action(action)
+
+    def _get_formatter(self, file: Any = None) -> HelpFormatter:
+        """Get formatter coloring messages for the stream printed to."""
+        formatter_class: Any = self.formatter_class
+        if isinstance(formatter_class, type) and issubclass(
+            formatter_class, ArgufyHelpFormatter
+        ):
+            return formatter_class(
+                prog=self.prog, color=self.__get_color(file)
+            )
+        return super()._get_formatter()
+
+    def print_usage(self, file: Any = None) -> None:
+        """Print usage message, colored when the stream is a terminal."""
+        self.__stream = file or sys.stdout
+        try:
+            super().print_usage(file)
+        finally:
+            self.__stream = None
+
+    def print_help(self, file: Any = None) -> None:
+        """Print help message, colored when the stream is a terminal."""
+        self.__stream = file or sys.stdout
+        try:
+            super().print_help(file)
+        finally:
+            self.__stream = None
+
+    def format_usage(self) -> str:
+        """Get usage message, rendered once per terminal and layout."""
+        return self.__render('usage', super().format_usage)
+
+    def format_help(self) -> str:
+        """Get help message, rendered once per terminal and layout."""
+        self.load_help()
+        return self.__render('help', super().format_help)
+
+    def load_help(self) -> None:
+        """Set help of arguments from docstrings deferred by lazy_help."""
+        while self.help_sources:
+            source, style = self.help_sources.pop()
+            # NOTE: parsed docstrings are released once help is set
+            params = index_params(
+                docparse(source.__doc__, style) if source.__doc__ else None
+            )
+            for action in self._actions:
+                param = params.get(action.dest.replace('-', '_'))
+                if action.help is None and param and param.description:
+                    action.help = param.description
+
+    def parse_known_args(  # type: ignore
+        self,
+        args: Optional[Sequence[str]] = None,
+        namespace: Optional['Namespace'] = None,
+    ) -> Tuple['Namespace', List[str]]:
+        """Parse arguments, passing variadic tails on in one slice.
 
-        Paramters
-        ---------
-        fn: Callable
-            Function used to seperate module arguments from function.
-        ns: Namespace
-            Argparse namespace object for a command.
+        Parameters
+        ----------
+        args: Sequence[str], optional
+            Command line arguments, defaults to those of the process.
+        namespace: Namespace, optional
+            Argparse namespace object populated with the values.
 
         Returns
         -------
         Namespace:
-            Argparse namespace object with command arguments.
+            Argparse namespace object with parsed values.
+        List[str]:
+            Arguments not recognized by the parser.
 
         """
-        # XXX: only works on subcommands that use 'mod'
-        if 'mod' in ns:
-            mod = vars(ns).pop('mod')
+        if args is None:
+            args = sys.argv[1:]
+        elif not isinstance(args, list):
+            args = list(args)
+        if self.parse_engine == 'compiled':
+            parsed = engine.parse(self, args, namespace)
+            if parsed is not None:
+                return parsed
+        # NOTE: argparse matches a pattern of every argument before using
+        # any, which dominates parsing of very long command lines
+        if not self.fromfile_prefix_chars and not any(
+            action.required
+            for action in self._actions
+            if action.option_strings
+        ):
+            positionals = [a for a in self._actions if not a.option_strings]
+            if len(positionals) == 1 and isinstance(
+                positionals[0], SubParsersAction
+            ):
+                return self.__parse_command_tail(args, namespace)
+            # NOTE: argparse already ran the variadic action on no values,
+            # which only a plain store is unaffected by
+            if (
+                positionals
+                and positionals[-1].nargs == '*'
+                and type(positionals[-1]) is _StoreAction
+            ):
+                parsed = self.__parse_variadic_tail(args, namespace)
+                if parsed is not None:
+                    return parsed
+        return super().parse_known_args(args, namespace)
+
+    def _get_option_tuples(self, option_string: str) -> List[Any]:
+        """Get actions of the option strings that an argument abbreviates.
+
+        Option strings are looked up in the prefix index of the parser
+        instead of compared one at a time. Matches are returned in the order
+        they were added so ambiguity errors are the same as argparse.
+
+        """
+        options = self._option_string_actions
+        # NOTE: option tuples of unknown shape are left to argparse
+        known = OPTION_TUPLE_SIZE in (3, 4)
+        if not known or not isinstance(options, OptionIndex):
+            return super()._get_option_tuples(option_string)
+
+        chars = self.prefix_chars
+        if option_string[0] in chars and option_string[1] in chars:
+            if not self.allow_abbrev:
+                return []
+            prefix, sep, value = option_string.partition('=')
+            explicit_arg = value if sep else None
+            tuples = [
+                (options[x], x, sep or None, explicit_arg)
+                for x in options.match(prefix)
+            ]
+        elif option_string[0] in chars:
+            short_option = option_string[:2]
+            tuples = [
+                (
+                    (options[x], x, '', option_string[2:])
+                    if x == short_option
+                    else (options[x], x, None, None)
+                )
+                for x in options.match(option_string, short_option)
+            ]
         else:
-            mod = None
+            return super()._get_option_tuples(option_string)
+        if OPTION_TUPLE_SIZE == 3:
+            return [(x[0], x[1], x[3]) for x in tuples]
+        return tuples
 
-        # separate namespace from other variables
-        signature = inspect.signature(fn)
-        docstring = docparse(fn.__doc__) if fn.__doc__ else None
+    def __skip_options(self, args: List[str]) -> Optional[int]:
+        """Get index of the first positional value following the options.
 
-        # inspect non-signature keyword args
-        keywords = (
-            self.__get_keyword_args(signature, docstring)
-            if docstring
-            else list(signature.parameters)
-        )
-        args = [
-            {k: vars(ns).pop(k)}
-            for k in list(vars(ns).keys()).copy()
-            if not signature.parameters.get(k) and k not in keywords
-        ]
-        log.debug("arguments %s, %s", args, keywords)
+        Returns
+        -------
+        Optional[int]:
+            Index of first positional value, or None when an option is not
+            matched exactly or takes a variable number of values.
 
-        # set module variables
-        if mod and self.use_module_args:
-            for arg in args:
-                for k, v in arg.items():
-                    mod.__dict__[k] = v
-        return ns
+        """
+        index = 0
+        while index < len(args):
+            token = args[index]
+            if token == '' or token[0] not in self.prefix_chars:
+                return index
+            if token in self._option_string_actions:
+                nargs = self._option_string_actions[token].nargs
+                if nargs is not None and not isinstance(nargs, int):
+                    return None
+                values = 1 if nargs is None else nargs
+            elif token.split('=', 1)[0] in self._option_string_actions:
+                values = 0
+            else:
+                return None
+            start, index = index + 1, index + 1 + values
+            for value in args[start:index]:
+                if value == '' or value[0] in self.prefix_chars:
+                    return None
+        return index
+
+    def __parse_command_tail(
+        self, args: List[str], namespace: Optional['Namespace']
+    ) -> Tuple['Namespace', List[str]]:
+        """Parse options before command and pass the rest to its parser."""
+        action = next(
+            a for a in self._actions if isinstance(a, SubParsersAction)
+        )
+        index = self.__skip_options(args)
+        if index is None or index == len(args) or action.required:
+            return super().parse_known_args(args, namespace)
+        start = index + 1
+
+        # NOTE: argparse rejects ambiguous abbreviations of these options
+        # even among the arguments of the command
+        for token in _get_optionals(args[start:], self.prefix_chars):
+            if token == '--':
+                break
+            self._parse_optional(token)
+        parsed, extras = super().parse_known_args(args[:index], namespace)
+        try:
+            # NOTE: subparsers do not convert values so only the command
+            # needs to be checked
+            self._get_values(action, args[index:start])
+            action(self, parsed, args[index:])
+        except ArgumentError as err:
+            if not getattr(self, 'exit_on_error', True):
+                raise
+            self.error(str(err))
+        extras.extend(vars(parsed).pop(_UNRECOGNIZED_ARGS_ATTR, []))
+        return parsed, extras
+
+    def __parse_variadic_tail(
+        self, args: List[str], namespace: Optional['Namespace']
+    ) -> Optional[Tuple['Namespace', List[str]]]:
+        """Parse options before positionals and slice the variadic tail."""
+        positionals = [a for a in self._actions if not a.option_strings]
+        action = positionals.pop()
+        fixed = 0
+        for positional in positionals:
+            if positional.nargs is None:
+                fixed += 1
+            elif isinstance(positional.nargs, int):
+                fixed += positional.nargs
+            else:
+                return None
+        index = self.__skip_options(args)
+        if index is None or index + fixed >= len(args):
+            return None
+        end = index + fixed
+        tail = args[end:]
+        if any(
+            _get_optionals(x, self.prefix_chars)
+            for x in (args[index:end], tail)
+        ):
+            return None
+
+        # NOTE: options and fixed positionals are parsed by argparse while
+        # the remaining values are only converted
+        parsed, extras = super().parse_known_args(args[:end], namespace)
+        try:
+            action(self, parsed, engine.get_values(self, action, tail))
+        except ArgumentError as err:
+            if not getattr(self, 'exit_on_error', True):
+                raise
+            self.error(str(err))
+        return parsed, extras
 
     def retrieve(
         self,
@@ -490,14 +1552,27 @@ class Parser(ArgumentParser):
         if args == []:
             args = ['--help']  # pragma: no cover
         main_ns, main_args = self.parse_known_args(args, ns)
-        if main_args == [] and 'fn' in vars(main_ns):
+        # NOTE: remaining arguments of a selected command are chained
+        if 'fn' in vars(main_ns):
             return main_args, main_ns
         # default to help message for subcommand
         if 'mod' in vars(main_ns):
-            mod_args = []
-            mod_args.append(vars(main_ns)['mod'].__name__.split('.')[-1])
-            mod_args.append('--help')
-            self.parse_args(mod_args)
+            mod = vars(main_ns)['mod']
+            name = mod if isinstance(mod, str) else mod.__name__
+            # NOTE: modules of packages are nested in their package levels
+            subcommand: Optional[ArgumentParser] = None
+            for part in name.split('.'):
+                found = self.__get_subparser(
+                    subcommand or self, part.replace('_', '-')
+                )
+                if found is not None:
+                    subcommand = found
+            if subcommand is not None:
+                subcommand.print_help()
+                subcommand.exit()
+            self.parse_args([self.__get_module_name(mod), '--help'])
+        if main_args != []:
+            self.error(f"unrecognized arguments: {' '.join(main_args)}")
         return main_args, main_ns
 
     def dispatch(
@@ -521,32 +1596,309 @@ class Parser(ArgumentParser):
 
         """
         # parse variables
-        arguments, namespace = self.retrieve(args, ns)
-        log.debug("dispatch: %s, %s", arguments, namespace)
+        # NOTE: chains are parsed up front when run concurrently
+        if self.chain_workers:
+            for future in self.dispatch_chain(args, ns):
+                future.result()
+            return None
+
+        for namespace in self.__parse_chain(args, ns):
+            log.debug("dispatch: %s", namespace)
+            call = self.__get_call(namespace)
+            if call:
+                binder, splat, kwargs = call
+                # XXX: only takes standard types
+                binder.call(splat, kwargs)
+        return None
+
+    def dispatch_chain(
+        self,
+        args: Sequence[str] = sys.argv[1:],
+        ns: Optional['Namespace'] = None,
+        max_workers: Optional[int] = None,
+        executor: Optional[str] = None,
+    ) -> List['Future[Any]']:
+        """Call every chained command concurrently.
 
-        main_ns_result = self.__set_main_arguments(namespace)
+        Paramters
+        ---------
+        args: Sequence[str]
+            Command line arguments of one or more chained commands.
+        ns: Optional[Namespace]
+            Argparse namespace object for a command.
+        max_workers: int, optional
+            Number of commands run at once, defaults to chain_workers.
+        executor: str, optional
+            Pool running the commands: 'thread' or 'process'.
 
-        # call function with variables
-        if 'fn' in namespace:
-            ns_vars = vars(namespace)
-            fn = ns_vars.pop('fn')
-
-            self.__set_module_arguments(fn, main_ns_result)
-
-            # XXX: only takes standard types
-            # attempt to plug parameters using inspect
-            splat = None
-            signature = inspect.signature(fn)
-            for arg in signature.parameters:
-                param = signature.parameters[arg]
-                if str(param).startswith('*') and not str(param).startswith(
-                    '**'
-                ):
-                    splat = ns_vars.pop(arg)
+        Returns
+        -------
+        List[Future[Any]]:
+            Completed result or error of each command in chain order.
+
+        """
+        calls = []
+        for namespace in self.__parse_chain(args, ns):
+            call = self.__get_call(namespace)
+            if call:
+                calls.append(call)
+        log.debug("dispatch chain: %s", calls)
+
+        executor = executor or self.chain_executor
+        if executor not in EXECUTORS:
+            raise ValueError(f"unknown executor: {executor}")
+        with EXECUTORS[executor](
+            max_workers=max_workers or self.chain_workers or None
+        ) as pool:
+            # NOTE: pool workers are discarded with the pool so coroutines
+            # do not keep an event loop in each of them
+            futures = [
+                pool.submit(binder.call, splat, kwargs, reuse_loop=False)
+                for binder, splat, kwargs in calls
+            ]
+        return futures
+
+    async def dispatch_async(
+        self,
+        args: Sequence[str] = sys.argv[1:],
+        ns: Optional['Namespace'] = None,
+    ) -> None:
+        """Call command with arguments, awaiting coroutine functions.
+
+        Paramters
+        ---------
+        args: Sequence[str]
+            Command line arguments passed to the parser.
+        ns: Optional[Namespace]
+            Argparse namespace object for a command.
+
+        """
+        for namespace in self.__parse_chain(args, ns):
+            log.debug("dispatch: %s", namespace)
+            call = self.__get_call(namespace)
+            if call:
+                binder, splat, kwargs = call
+                result = binder.fn(*splat, **kwargs)
+                if binder.coroutine:
+                    await result
+
+    @staticmethod
+    def __get_subparser(
+        parser: ArgumentParser, name: str
+    ) -> Optional[ArgumentParser]:
+        """Get parser of command, building it when deferred."""
+        for action in parser._actions:
+            if isinstance(action, SubParsersAction):
+                if name not in action._name_parser_map:
+                    return None
+                if isinstance(action, CommandsAction):
+                    return action.get_parser(name)
+                return action._name_parser_map[name]
+        return None
+
+    @staticmethod
+    def __get_layout(
+        parser: ArgumentParser,
+    ) -> Optional[Tuple[Dict[str, int], int, bool]]:
+        """Get values consumed by options and positionals of parser.
+
+        Returns
+        -------
+        Optional[Tuple[Dict[str, int], int, bool]]:
+            Number of values taken by each option string, number of
+            positional values, and whether the parser has subcommands.
+            None when an argument takes a variable number of values.
 
-            # XXX: only works with splat and kwargs
-            if splat:
-                fn(*splat, **ns_vars)
+        """
+        options: Dict[str, int] = {}
+        positionals = 0
+        subcommands = False
+        for action in parser._actions:
+            if isinstance(action, SubParsersAction):
+                subcommands = True
+            elif action.nargs is not None and not isinstance(
+                action.nargs, int
+            ):
+                return None
+            elif action.option_strings:
+                for option in action.option_strings:
+                    options[option] = (
+                        1 if action.nargs is None else action.nargs
+                    )
             else:
-                fn(**ns_vars)
-        return self.dispatch(arguments) if arguments != [] else None
+                positionals += 1 if action.nargs is None else action.nargs
+        # NOTE: ordering of positionals and subcommands is not tracked
+        if subcommands and positionals:
+            return None
+        return options, positionals, subcommands
+
+    def __split_chain(self, args: Sequence[str]) -> Optional[List[List[str]]]:
+        """Split chained command lines in one pass over the arguments.
+
+        A command ends once its positionals are filled and the next
+        positional value names a command of this parser.
+
+        Returns
+        -------
+        Optional[List[List[str]]]:
+            Arguments of each chained command, or None when they cannot be
+            split without parsing them.
+
+        """
+        segments = []
+        start = 0
+        parser: ArgumentParser = self
+        layout = self.__get_layout(parser)
+        selected = False
+        index = 0
+        while index < len(args):
+            if layout is None:
+                return None
+            options, positionals, subcommands = layout
+            token = args[index]
+
+            # classify optionals the same as argparse, deferring to it for
+            # abbreviations, inline values and negative numbers
+            if token[:1] in parser.prefix_chars and token != '-':
+                if token not in options:
+                    return None
+                index += 1 + options[token]
+                continue
+            if parser.fromfile_prefix_chars and token[:1] in (
+                parser.fromfile_prefix_chars
+            ):
+                return None
+
+            if positionals:
+                layout = options, positionals - 1, subcommands
+                index += 1
+                continue
+            if subcommands and not selected:
+                subparser = self.__get_subparser(parser, token)
+                if subparser is None:
+                    return None
+                parser = subparser
+                layout = self.__get_layout(parser)
+                selected = 'fn' in parser._defaults
+                index += 1
+                continue
+
+            # start next command from this parser
+            if not selected:
+                return None
+            segments.append(list(args[start:index]))
+            start = index
+            parser, layout, selected = self, self.__get_layout(self), False
+        segments.append(list(args[start:]))
+        return segments
+
+    def __parse_chain(
+        self,
+        args: Sequence[str],
+        ns: Optional['Namespace'] = None,
+    ) -> List['Namespace']:
+        """Parse every chained command, each from only its own arguments."""
+        # NOTE: argparse scans every remaining argument on each parse so
+        # splitting first avoids reparsing the rest of the chain
+        segments = self.__split_chain(args) or [list(args)]
+        namespaces = []
+        for segment in segments:
+            while True:
+                arguments, namespace = self.retrieve(segment, ns)
+                namespaces.append(namespace)
+                if arguments == []:
+                    break
+                segment, ns = arguments, None
+            ns = None
+        return namespaces
+
+    def __get_call(
+        self, namespace: 'Namespace'
+    ) -> Optional[Tuple[Binder, Sequence[Any], Dict[str, Any]]]:
+        """Get command and arguments it is called with from namespace."""
+        values = vars(namespace)
+        self.__set_main_arguments(values)
+
+        # call function with variables
+        if 'fn' not in values:
+            return None
+        fn = values.pop('fn')
+        if isinstance(fn, Reference):
+            fn = fn.resolve()
+        # XXX: only works on subcommands that use 'mod'
+        mod = values.pop('mod', None)
+
+        # separate module arguments from function arguments
+        binder = self.__get_binder(fn)
+        splat, kwargs, module_args = binder.bind(values)
+        log.debug("arguments %s, %s", module_args, kwargs)
+
+        # set module variables
+        if mod and self.use_module_args:
+            if isinstance(mod, str):
+                mod = importlib.import_module(mod)
+            mod.__dict__.update(module_args)
+        return binder, splat, kwargs
+
+    def dispatch_batch(
+        self,
+        source: Union[str, IO[str], Sequence[str]] = '-',
+        line_format: Optional[str] = None,
+    ) -> List[Tuple[int, int]]:
+        """Call command of each line with this parser.
+
+        Parameters
+        ----------
+        source: Union[str, IO[str], Sequence[str]]
+            Filepath, '-' for stdin, or stream of command lines.
+        line_format: str, optional
+            Encoding of each line: 'shell' quoted, 'nul' separated, or
+            'json' array. Detected from each line when not provided.
+
+        Returns
+        -------
+        List[Tuple[int, int]]:
+            Line number and exit status of each dispatched command.
+
+        """
+        statuses = []
+        for lineno, line in enumerate(read_lines(source), 1):
+            try:
+                args = split_line(line, line_format)
+            except ValueError as err:
+                log.warning("batch line %d is invalid: %s", lineno, err)
+                statuses.append((lineno, 2))
+                continue
+            if args == []:
+                continue
+
+            # NOTE: failures are isolated to the line that caused them
+            try:
+                self.dispatch(args)
+                status = 0
+            except SystemExit as err:
+                status = get_status(err)
+            except Exception:  # pylint: disable=broad-except
+                log.exception("batch line %d failed", lineno)
+                status = 1
+            if status:
+                log.warning("batch line %d exited %d", lineno, status)
+            statuses.append((lineno, status))
+        return statuses
+
+    def serve(self, path: str, **kwargs: Any) -> None:
+        """Dispatch commands sent by clients over a Unix socket.
+
+        Parameters
+        ----------
+        path: str
+            Filepath of the Unix socket.
+        idle_timeout: float, optional
+            Seconds without a connection before the server stops.
+        max_children: int
+            Number of commands run concurrently before clients wait.
+
+        """
+        from argufy.server import serve
+
+        serve(self, path, **kwargs)
@@ -0,0 +1,167 @@
+# copyright: (c) 2020 by Jesse Johnson.
+# license: Apache 2.0, see LICENSE for more details.
+"""Registry of functions declared as commands with their argument specs."""
+
+import inspect
+import logging
+from inspect import Parameter
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from argufy.argument import Argument, ArgumentSpec, ShortFlags
+from argufy.inspection import get_inspection
+
+log = logging.getLogger(__name__)
+
+# commands declared with the decorator, by module name in definition order
+registry: Dict[str, Dict[str, 'Command']] = {}
+
+
+def get_summary(obj: Any) -> Optional[str]:
+    """Get first line of docstring without parsing it."""
+    if not obj.__doc__:
+        return None
+    return inspect.cleandoc(obj.__doc__).split('\n', 1)[0] or None
+
+
+def get_argument_specs(
+    obj: Any,
+    style: str = 'auto',
+    short_flags: Union[str, ShortFlags] = 'case',
+    lazy_help: bool = False,
+) -> List[ArgumentSpec]:
+    """Get argument names and argparse parameters from object.
+
+    Parameters
+    ----------
+    obj: Any
+        Callable to be inspected.
+    style: str
+        Style used to parse the docstring of callable.
+    short_flags: Union[str, ShortFlags]
+        Strategy, or allocator shared with other arguments of the parser.
+    lazy_help: bool
+        Skip docstrings unless they describe keyword arguments.
+
+    Returns
+    -------
+    List[ArgumentSpec]:
+        Specs of arguments added to the parser of the command.
+
+    """
+    # prep object for inspection
+    inspection = get_inspection(obj, style)
+    specs = []
+    if isinstance(short_flags, str):
+        short_flags = ShortFlags(short_flags)
+
+    # NOTE: docstrings are only needed for options not in the signature
+    parameters = inspection.signature.parameters
+    lazy = lazy_help and not any(
+        x.kind == Parameter.VAR_KEYWORD for x in parameters.values()
+    )
+
+    # populate subcommand with keyword arguments
+    for arg, param in parameters.items():
+        description = None if lazy else inspection.params.get(arg)
+        log.debug("param: %s, %s", param, param.kind)
+
+        if not param.kind == Parameter.VAR_KEYWORD:
+            log.debug("param annotation: %s", param.annotation)
+            specs.append(Argument(description, param, short_flags).spec)
+
+    # populate options
+    for arg in [] if lazy else inspection.keywords:
+        argument = Argument(docstring=inspection.params[arg])
+        specs.append(
+            argument.spec.replace(name=(f"--{arg.replace('_', '-')}",))
+        )
+
+    # TODO for any docstring not collected parse here (args, kwargs)
+    return specs
+
+
+class Command:
+    """Provide function declared as a command with its argument specs."""
+
+    __slots__ = ('fn', 'name', 'help', '__specs')
+
+    def __init__(
+        self,
+        fn: Callable[..., Any],
+        name: Optional[str] = None,
+        help: Optional[str] = None,  # pylint: disable=redefined-builtin
+    ) -> None:
+        """Initialize command.
+
+        Parameters
+        ----------
+        fn: Callable[..., Any]
+            Function called when the command is dispatched.
+        name: str, optional
+            Name of the command, otherwise that of the function.
+        help: str, optional
+            Help of the command, otherwise the summary of its docstring.
+
+        """
+        self.fn = fn
+        self.name = name or fn.__name__.replace('_', '-')
+        self.help = help
+        # NOTE: specs are computed when first used so declaring commands
+        # does not parse docstrings on import
+        self.__specs: Dict[Tuple[str, str, bool], List[ArgumentSpec]] = {}
+
+    def get_arguments(
+        self, style: str, short_flags: str, lazy_help: bool
+    ) -> List[ArgumentSpec]:
+        """Get argument specs, computed once for each parser settings."""
+        key = (style, short_flags, lazy_help)
+        if key not in self.__specs:
+            self.__specs[key] = get_argument_specs(
+                self.fn, style, short_flags, lazy_help
+            )
+        return self.__specs[key]
+
+    def get_help(self, style: str, lazy_help: bool) -> Optional[str]:
+        """Get help of command."""
+        if self.help is not None:
+            return self.help
+        if lazy_help:
+            return get_summary(self.fn)
+        return get_inspection(self.fn, style).summary
+
+
+def command(
+    fn: Optional[Callable[..., Any]] = None,
+    *,
+    name: Optional[str] = None,
+    help: Optional[str] = None,  # pylint: disable=redefined-builtin
+) -> Any:
+    """Declare function as a command of its module.
+
+    Modules with declared commands are added by `Parser.add_commands`
+    from the registry instead of inspecting every module member, so
+    functions of those modules that are not declared are ignored.
+
+    Parameters
+    ----------
+    fn: Callable[..., Any], optional
+        Function declared, when used without arguments.
+    name: str, optional
+        Name of the command, otherwise that of the function.
+    help: str, optional
+        Help of the command, otherwise the summary of its docstring.
+
+    Returns
+    -------
+    Any:
+        Function unchanged, or decorator when used with arguments.
+
+    """
+
+    def register(fn: Callable[..., Any]) -> Callable[..., Any]:
+        registry.setdefault(fn.__module__, {})[fn.__name__] = Command(
+            fn, name, help
+        )
+        return fn
+
+    return register if fn is None else register(fn)
@@ -0,0 +1,227 @@
+# copyright: (c) 2020 by Jesse Johnson.
+# license: Apache 2.0, see LICENSE for more details.
+"""Serve a warm parser over a Unix socket."""
+
+import io
+import json
+import logging
+import os
+import socket
+import socketserver
+import sys
+import traceback
+from argparse import SUPPRESS, Action, ArgumentParser, Namespace
+from argparse import _SubParsersAction as SubParsersAction
+from typing import TYPE_CHECKING, Any, Optional, Sequence
+
+from argufy.batch import get_status
+from argufy.cache import Reference
+from argufy.client import EXIT, STDERR, STDOUT, send_frame
+
+if TYPE_CHECKING:
+    from argufy.parser import Parser
+
+log = logging.getLogger(__name__)
+
+IDLE_TIMEOUT = 600.0
+MAX_CHILDREN = 40
+
+
+class FrameWriter(io.RawIOBase):
+    """Write output to client as frames of a channel."""
+
+    def __init__(self, sock: socket.socket, channel: bytes) -> None:
+        """Initialize writer of channel."""
+        super().__init__()
+        self.sock = sock
+        self.channel = channel
+
+    def writable(self) -> bool:
+        """Check if stream is writable."""
+        return True
+
+    def write(self, data: Any) -> int:
+        """Send data to client."""
+        data = bytes(data)
+        if data:
+            send_frame(self.sock, self.channel, data)
+        return len(data)
+
+
+def preload(parser: ArgumentParser) -> None:
+    """Build deferred command parsers and import their commands.
+
+    Parameters
+    ----------
+    parser: ArgumentParser
+        Parser whose command tree is loaded before serving.
+
+    """
+    for key, value in parser._defaults.items():
+        if isinstance(value, Reference):
+            parser._defaults[key] = value.resolve()
+    for action in parser._actions:
+        if isinstance(action, SubParsersAction):
+            for name in list(action._name_parser_map):
+                if hasattr(action, 'get_parser'):
+                    preload(action.get_parser(name))
+                else:
+                    preload(action._name_parser_map[name])
+
+
+class CommandHandler(socketserver.StreamRequestHandler):
+    """Dispatch command line received from client."""
+
+    server: 'CommandServer'
+
+    def handle(self) -> None:
+        """Run command with environment of client and send exit status."""
+        header = json.loads(self.rfile.readline())
+        os.environ.clear()
+        os.environ.update(header['env'])
+        os.chdir(header['cwd'])
+
+        # NOTE: each request runs in its own forked process
+        sys.stdin = io.TextIOWrapper(self.rfile, encoding='utf-8')
+        sys.stdout = io.TextIOWrapper(
+            io.BufferedWriter(FrameWriter(self.connection, STDOUT)),
+            encoding='utf-8',
+            line_buffering=True,
+        )
+        sys.stderr = io.TextIOWrapper(
+            io.BufferedWriter(FrameWriter(self.connection, STDERR)),
+            encoding='utf-8',
+            line_buffering=True,
+        )
+        sys.argv = [self.server.parser.prog, *header['argv']]
+
+        try:
+            self.server.parser.dispatch(header['argv'])
+            status = 0
+        except SystemExit as err:
+            status = get_status(err)
+        except Exception:  # pylint: disable=broad-except
+            traceback.print_exc()
+            status = 1
+        sys.stdout.flush()
+        sys.stderr.flush()
+        send_frame(self.connection, EXIT, str(status).encode('utf-8'))
+
+
+class CommandServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    """Fork warm parser for each client connected to the socket."""
+
+    def __init__(
+        self,
+        parser: 'Parser',
+        path: str,
+        idle_timeout: Optional[float] = IDLE_TIMEOUT,
+        max_children: int = MAX_CHILDREN,
+    ) -> None:
+        """Initialize server listening on socket.
+
+        Parameters
+        ----------
+        parser: Parser
+            Parser used to dispatch every command.
+        path: str
+            Filepath of the Unix socket.
+        idle_timeout: float, optional
+            Seconds without a connection before the server stops.
+        max_children: int
+            Number of commands run concurrently before clients wait.
+
+        """
+        self.parser = parser
+        self.timeout = idle_timeout
+        self.max_children = max_children
+        self.idle = False
+        if os.path.exists(path):
+            self.__remove_stale(path)
+        super().__init__(path, CommandHandler)
+        os.chmod(path, 0o600)
+
+    @staticmethod
+    def __remove_stale(path: str) -> None:
+        """Remove socket left behind by a server that is not running."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            try:
+                sock.connect(path)
+            except OSError:
+                os.remove(path)
+                return
+        raise OSError(f"server already listening on {path}")
+
+    def handle_timeout(self) -> None:
+        """Stop serving once no client connected within the timeout."""
+        log.debug("server idle for %s seconds", self.timeout)
+        self.idle = True
+        super().handle_timeout()
+
+    def serve(self) -> None:
+        """Handle clients until the idle timeout elapses."""
+        try:
+            while not self.idle:
+                self.handle_request()
+                # NOTE: reap finished commands between connections
+                self.service_actions()
+        finally:
+            self.server_close()
+            if os.path.exists(self.server_address):  # type: ignore
+                os.remove(self.server_address)  # type: ignore
+
+
+def serve(
+    parser: 'Parser',
+    path: str,
+    idle_timeout: Optional[float] = IDLE_TIMEOUT,
+    max_children: int = MAX_CHILDREN,
+) -> None:
+    """Load parser once and dispatch commands sent over a Unix socket.
+
+    Parameters
+    ----------
+    parser: Parser
+        Parser used to dispatch every command.
+    path: str
+        Filepath of the Unix socket.
+    idle_timeout: float, optional
+        Seconds without a connection before the server stops.
+    max_children: int
+        Number of commands run concurrently before clients wait.
+
+    """
+    preload(parser)
+    CommandServer(parser, path, idle_timeout, max_children).serve()
+
+
+class ServeAction(Action):
+    """Serve commands over a Unix socket and exit."""
+
+    def __init__(
+        self,
+        option_strings: Sequence[str],
+        dest: str = SUPPRESS,
+        default: str = SUPPRESS,
+        metavar: Optional[str] = 'SOCKET',
+        help: Optional[str] = None,  # pylint: disable=redefined-builtin
+    ) -> None:
+        """Initialize serve action."""
+        super().__init__(
+            option_strings=option_strings,
+            dest=dest,
+            default=default,
+            metavar=metavar,
+            help=help,
+        )
+
+    def __call__(
+        self,
+        parser: ArgumentParser,
+        namespace: Namespace,
+        values: Any,
+        option_string: Optional[str] = None,
+    ) -> None:
+        """Serve commands until idle then exit."""
+        serve(parser, values)  # type: ignore
+        parser.exit()
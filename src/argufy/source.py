@@ -0,0 +1,456 @@
+# copyright: (c) 2020 by Jesse Johnson.
+# license: Apache 2.0, see LICENSE for more details.
+"""Inspect command modules from source without importing them."""
+
+import ast
+import builtins
+import importlib
+import importlib.util
+import inspect
+import logging
+import os
+import pkgutil
+import sys
+import tokenize
+from inspect import Parameter, Signature
+from inspect import _empty as empty
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+log = logging.getLogger(__name__)
+
+FunctionNode = Union[ast.FunctionDef, ast.AsyncFunctionDef]
+
+
+def resolve(reference: str) -> Any:
+    """Import object from a 'module:qualname' reference."""
+    module_name, _, qualname = reference.partition(':')
+    obj: Any = importlib.import_module(module_name)
+    for attr in qualname.split('.'):
+        obj = getattr(obj, attr)
+    return obj
+
+
+class Reference:
+    """Provide callable that imports its target when first called."""
+
+    def __init__(self, reference: str) -> None:
+        """Initialize reference from 'module:qualname'."""
+        self.reference = reference
+        self.__name__ = reference.rsplit(':', 1)[-1].rsplit('.', 1)[-1]
+        self.__target: Any = None
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Call referenced target."""
+        return self.resolve()(*args, **kwargs)
+
+    def resolve(self) -> Any:
+        """Import referenced target."""
+        if self.__target is None:
+            self.__target = resolve(self.reference)
+        return self.__target
+
+    def __repr__(self) -> str:
+        """Get representation of reference."""
+        return f"Reference({self.reference!r})"
+
+
+class Unresolved(Exception):
+    """Signature cannot be read from source without importing module."""
+
+
+class SourceFunction(Reference):
+    """Provide signature and docstring of a function read from source.
+
+    The module is only imported once the function is called or resolved.
+
+    """
+
+    def __init__(
+        self,
+        module: str,
+        name: str,
+        signature: Signature,
+        doc: Optional[str],
+    ) -> None:
+        """Initialize function from its module path and source details."""
+        super().__init__(f"{module}:{name}")
+        self.__module__ = module
+        self.__qualname__ = name
+        self.__signature__ = signature
+        self.__doc__ = doc
+
+
+def find_source(name: str) -> Optional[str]:
+    """Get source filepath of module without importing it.
+
+    Parameters
+    ----------
+    name: str
+        Dotted path of the module.
+
+    Returns
+    -------
+    Optional[str]:
+        Filepath of the module source or None when unavailable.
+
+    """
+    parent, _, leaf = name.rpartition('.')
+    if parent and parent not in sys.modules:
+        # NOTE: find_spec would import the parent packages
+        directory = find_package(parent)
+        if directory is None:
+            return None
+        for filepath in (
+            os.path.join(directory, f"{leaf}.py"),
+            os.path.join(directory, leaf, '__init__.py'),
+        ):
+            if os.path.isfile(filepath):
+                return filepath
+        return None
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError) as err:
+        log.debug("module source unavailable: %s", err)
+        return None
+    if (
+        spec is None
+        or not spec.has_location
+        or not spec.origin
+        or not spec.origin.endswith('.py')
+    ):
+        return None
+    return spec.origin
+
+
+def find_package(name: str) -> Optional[str]:
+    """Get directory of package without importing it or its parents.
+
+    Parameters
+    ----------
+    name: str
+        Dotted path of the package.
+
+    Returns
+    -------
+    Optional[str]:
+        Directory of the package or None when it is not a package.
+
+    """
+    top, _, rest = name.partition('.')
+    try:
+        spec = importlib.util.find_spec(top)
+    except (ImportError, ValueError) as err:
+        log.debug("package unavailable: %s", err)
+        return None
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    path = list(spec.submodule_search_locations)[0]
+    for part in rest.split('.') if rest else []:
+        path = os.path.join(path, part)
+        if not os.path.isfile(os.path.join(path, '__init__.py')):
+            return None
+    return path
+
+
+def read_summary(filepath: str) -> Optional[str]:
+    """Get summary of module docstring without parsing the whole module."""
+    try:
+        with open(filepath, 'rb') as f:
+            for token in tokenize.tokenize(f.readline):
+                if token.type in (
+                    tokenize.ENCODING,
+                    tokenize.COMMENT,
+                    tokenize.NL,
+                    tokenize.NEWLINE,
+                ):
+                    continue
+                # NOTE: docstring is only the first statement of the module
+                if token.type == tokenize.STRING:
+                    value = ast.literal_eval(token.string)
+                    if isinstance(value, str):
+                        return get_summary(inspect.cleandoc(value))
+                return None
+    except (OSError, SyntaxError, ValueError, tokenize.TokenError) as err:
+        log.debug("module summary unavailable: %s", err)
+    return None
+
+
+def _get_filepath(path: str, name: str, package: bool) -> str:
+    """Get file holding the docstring of a module or package."""
+    if package:
+        return os.path.join(path, name, '__init__.py')
+    return os.path.join(path, f"{name}.py")
+
+
+def get_mtimes(
+    path: str, modules: List[str], packages: List[str]
+) -> Dict[str, Optional[int]]:
+    """Get modification time of the file of each module and package.
+
+    Parameters
+    ----------
+    path: str
+        Directory of the package.
+    modules: List[str]
+        Names of the modules in the package.
+    packages: List[str]
+        Names of the subpackages in the package.
+
+    Returns
+    -------
+    Dict[str, Optional[int]]:
+        Modification time of each file, or None when it is not source.
+
+    """
+    mtimes: Dict[str, Optional[int]] = {}
+    for names, package in ((modules, False), (packages, True)):
+        for name in names:
+            try:
+                mtimes[name] = os.stat(
+                    _get_filepath(path, name, package)
+                ).st_mtime_ns
+            except OSError:
+                mtimes[name] = None
+    return mtimes
+
+
+def scan_package(path: str) -> Dict[str, Any]:
+    """Get modules and packages in a package directory with summaries.
+
+    Parameters
+    ----------
+    path: str
+        Directory of the package.
+
+    Returns
+    -------
+    Dict[str, Any]:
+        Names of the modules and packages, and the summary of the
+        docstring of each with the modification time it was read at.
+
+    """
+    modules: List[str] = []
+    packages: List[str] = []
+    summaries: Dict[str, Optional[str]] = {}
+    for info in pkgutil.iter_modules([path]):
+        if info.ispkg:
+            packages.append(info.name)
+        else:
+            modules.append(info.name)
+        summaries[info.name] = read_summary(
+            _get_filepath(path, info.name, info.ispkg)
+        )
+    return {
+        'modules': sorted(modules),
+        'packages': sorted(packages),
+        'summaries': summaries,
+        'mtimes': get_mtimes(path, modules, packages),
+    }
+
+
+def get_summary(docstring: Optional[str]) -> Optional[str]:
+    """Get first line of a cleaned docstring."""
+    if not docstring:
+        return None
+    return docstring.split('\n', 1)[0] or None
+
+
+def get_names(tree: ast.Module) -> Dict[str, Any]:
+    """Get names usable by annotations without importing any module.
+
+    Builtin types are available unless the module redefines them, and
+    imported names only when their module has already been imported.
+
+    """
+    names: Dict[str, Any] = {
+        k: v for k, v in vars(builtins).items() if isinstance(v, type)
+    }
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname:
+                    target = alias.name
+                    name = alias.asname
+                else:
+                    target = name = alias.name.split('.')[0]
+                if target in sys.modules:
+                    names[name] = sys.modules[target]
+                else:
+                    names.pop(name, None)
+        elif isinstance(node, ast.ImportFrom):
+            module = (
+                sys.modules.get(node.module or '') if not node.level else None
+            )
+            for alias in node.names:
+                name = alias.asname or alias.name
+                if module is not None and hasattr(module, alias.name):
+                    names[name] = getattr(module, alias.name)
+                else:
+                    names.pop(name, None)
+        elif isinstance(
+            node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+        ):
+            names.pop(node.name, None)
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = getattr(node, 'targets', [getattr(node, 'target', None)])
+            for target in targets:
+                for child in ast.walk(target):
+                    if isinstance(child, ast.Name):
+                        names.pop(child.id, None)
+    return names
+
+
+def evaluate(node: ast.AST, names: Dict[str, Any]) -> Any:
+    """Get value of an annotation from names without running any code."""
+    try:
+        if isinstance(node, ast.Name):
+            return names[node.id]
+        if isinstance(node, ast.Attribute):
+            return getattr(evaluate(node.value, names), node.attr)
+        if isinstance(node, ast.Subscript):
+            # NOTE: python 3.8 and older wrap subscripts with an index
+            index = getattr(node.slice, 'value', node.slice)
+            return evaluate(node.value, names)[evaluate(index, names)]
+        if isinstance(node, ast.Tuple):
+            return tuple(evaluate(x, names) for x in node.elts)
+        if isinstance(node, ast.List):
+            return [evaluate(x, names) for x in node.elts]
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+            return evaluate(node.left, names) | evaluate(node.right, names)
+        value = ast.literal_eval(node)
+    except (
+        AttributeError,
+        IndexError,
+        KeyError,
+        SyntaxError,
+        TypeError,
+        ValueError,
+    ) as err:
+        raise Unresolved(err) from err
+    if isinstance(value, str):
+        # forward references are evaluated the same as typing does
+        return evaluate(ast.parse(value, mode='eval').body, names)
+    return value
+
+
+def get_signature(node: FunctionNode, names: Dict[str, Any]) -> Signature:
+    """Get signature of function from its literal defaults and annotations.
+
+    Parameters
+    ----------
+    node: FunctionNode
+        Definition of the function.
+    names: Dict[str, Any]
+        Names usable by annotations.
+
+    Returns
+    -------
+    Signature:
+        Signature the same as inspect would get from the function.
+
+    """
+    args = node.args
+    positional_only = getattr(args, 'posonlyargs', [])
+    positional = positional_only + args.args
+    missing = len(positional) - len(args.defaults)
+    defaults: List[Optional[ast.expr]] = [None] * missing + list(args.defaults)
+    entries: List[Tuple[ast.arg, Any, Optional[ast.expr]]] = [
+        (
+            x,
+            Parameter.POSITIONAL_ONLY
+            if i < len(positional_only)
+            else Parameter.POSITIONAL_OR_KEYWORD,
+            defaults[i],
+        )
+        for i, x in enumerate(positional)
+    ]
+    if args.vararg:
+        entries.append((args.vararg, Parameter.VAR_POSITIONAL, None))
+    entries.extend(
+        (x, Parameter.KEYWORD_ONLY, y)
+        for x, y in zip(args.kwonlyargs, args.kw_defaults)
+    )
+    if args.kwarg:
+        entries.append((args.kwarg, Parameter.VAR_KEYWORD, None))
+
+    parameters = []
+    for arg, kind, default in entries:
+        try:
+            value = empty if default is None else ast.literal_eval(default)
+        except ValueError as err:
+            raise Unresolved(err) from err
+        parameters.append(
+            Parameter(
+                arg.arg,
+                kind,
+                default=value,
+                annotation=empty
+                if arg.annotation is None
+                else evaluate(arg.annotation, names),
+            )
+        )
+    return Signature(parameters)
+
+
+def get_function(
+    module: str, node: FunctionNode, names: Dict[str, Any]
+) -> Optional[SourceFunction]:
+    """Get function read from source, or None when it must be imported."""
+    # NOTE: decorators may change the signature of the function
+    if node.decorator_list:
+        return None
+    try:
+        signature = get_signature(node, names)
+    except Unresolved as err:
+        log.debug("signature of %s requires import: %s", node.name, err)
+        return None
+    # NOTE: docstring is kept uncleaned the same as __doc__
+    return SourceFunction(
+        module, node.name, signature, ast.get_docstring(node, clean=False)
+    )
+
+
+def scan_module(name: str) -> Optional[Dict[str, Any]]:
+    """Get module description and functions from source.
+
+    Parameters
+    ----------
+    name: str
+        Dotted path of the module.
+
+    Returns
+    -------
+    Optional[Dict[str, Any]]:
+        Module description, mapping of function names to summaries, and
+        mapping of function names to functions read from source, or None
+        for those that must be imported to be inspected.
+
+    """
+    filepath = find_source(name)
+    if filepath is None:
+        return None
+    with open(filepath, 'rb') as f:
+        tree = ast.parse(f.read(), filename=filepath)
+    nodes = [
+        x
+        for x in tree.body
+        if isinstance(x, (ast.FunctionDef, ast.AsyncFunctionDef))
+    ]
+    # NOTE: postponed annotations are kept as strings by inspect
+    postponed = any(
+        isinstance(x, ast.ImportFrom)
+        and x.module == '__future__'
+        and any(y.name == 'annotations' for y in x.names)
+        for x in tree.body
+    )
+    names = get_names(tree)
+    return {
+        'description': get_summary(ast.get_docstring(tree)),
+        'functions': {
+            x.name: get_summary(ast.get_docstring(x)) for x in nodes
+        },
+        'sources': {
+            x.name: None if postponed else get_function(name, x, names)
+            for x in nodes
+        },
+    }
@@ -0,0 +1,78 @@
+# copyright: (c) 2020 by Jesse Johnson.
+# license: Apache 2.0, see LICENSE for more details.
+"""Lazy iterables of arguments read from stdin or files."""
+
+import sys
+from functools import partial
+from typing import Iterator, Optional, TextIO
+
+CHUNK_SIZE = 1 << 16
+
+
+class Stream:
+    """Iterate newline delimited values from a file, or '-' for stdin."""
+
+    delimiter = '\n'
+
+    def __init__(
+        self,
+        source: str = '-',
+        delimiter: Optional[str] = None,
+        encoding: str = 'utf-8',
+    ) -> None:
+        """Initialize stream without reading it.
+
+        Parameters
+        ----------
+        source: str
+            Filepath values are read from, or '-' for stdin.
+        delimiter: str, optional
+            Character separating values, defaults to that of the class.
+        encoding: str
+            Encoding of the file.
+
+        """
+        self.source = source
+        if delimiter is not None:
+            self.delimiter = delimiter
+        self.encoding = encoding
+
+    def __iter__(self) -> Iterator[str]:
+        """Read values one at a time, keeping memory use constant."""
+        if self.source == '-':
+            yield from self.__split(sys.stdin)
+        else:
+            with open(
+                self.source,
+                encoding=self.encoding,
+                # NOTE: only newline delimiters use universal newlines
+                newline=None if self.delimiter == '\n' else '',
+            ) as f:
+                yield from self.__split(f)
+
+    def __split(self, stream: TextIO) -> Iterator[str]:
+        """Split text stream into values."""
+        if self.delimiter == '\n':
+            for line in stream:
+                yield line[:-1] if line.endswith('\n') else line
+            return
+        buffer = ''
+        for chunk in iter(partial(stream.read, CHUNK_SIZE), ''):
+            values = (buffer + chunk).split(self.delimiter)
+            buffer = values.pop()
+            yield from values
+        if buffer:
+            yield buffer
+
+    def __repr__(self) -> str:
+        """Get representation of stream."""
+        return (
+            f"{self.__class__.__name__}({self.source!r}, "
+            f"delimiter={self.delimiter!r})"
+        )
+
+
+class NulStream(Stream):
+    """Iterate NUL delimited values from a file, or '-' for stdin."""
+
+    delimiter = '\0'
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+# type: ignore
+'''Test batch parser.'''
+
+
+def echo(*values: str):
+    '''Mock echo command.
+
+    Parameters
+    ----------
+    values: str
+        values to be printed
+
+    '''
+    print(list(values))
+
+
+def fail(message: str = 'failed'):
+    '''Mock failing command.
+
+    Parameters
+    ----------
+    message: str
+        message of the raised error
+
+    '''
+    raise RuntimeError(message)
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+# type: ignore
+'''Test batch dispatch.'''
+
+import io
+import sys
+from ast import literal_eval
+
+import pytest
+
+from argufy import Parser
+from argufy.batch import split_line
+
+sys.path.append('.')
+import batch_parser  # noqa: E402
+
+
+def get_parser(**kwargs):
+    '''Get parser with batch commands.'''
+    parser = Parser(prog='batch', **kwargs)
+    parser.add_commands(batch_parser)
+    return parser
+
+
+@pytest.mark.parametrize(
+    'line,args',
+    [
+        ("echo 'a b' c\n", ['echo', 'a b', 'c']),
+        ('echo\0a b\0c\0\n', ['echo', 'a b', 'c']),
+        ('["echo", "a b", "c"]\n', ['echo', 'a b', 'c']),
+        ('# comment\n', []),
+        ('\n', []),
+    ],
+)
+def test_split_line(line, args):
+    '''Test command lines are split by detected format.'''
+    assert split_line(line) == args
+
+
+def test_split_line_invalid():
+    '''Test malformed command lines are rejected.'''
+    with pytest.raises(ValueError):
+        split_line('{"echo": 1}', 'json')
+    with pytest.raises(ValueError):
+        split_line("echo 'unterminated")
+
+
+def test_dispatch_batch(capsys):
+    '''Test each line is dispatched with failures isolated.'''
+    statuses = get_parser().dispatch_batch(
+        [
+            'echo a b\n',
+            '\n',
+            'fail --message boom\n',
+            'missing\n',
+            '["echo", "c"]\n',
+            '["echo", 1]\n',
+        ]
+    )
+    assert statuses == [(1, 0), (3, 1), (4, 2), (5, 0), (6, 2)]
+    output = capsys.readouterr().out.splitlines()
+    assert [literal_eval(x) for x in output] == [['a', 'b'], ['c']]
+
+
+def test_batch_flag(capsys, monkeypatch):
+    '''Test batch flag reads stdin and exits with combined status.'''
+    monkeypatch.setattr(sys, 'stdin', io.StringIO('echo a\necho b\n'))
+    with pytest.raises(SystemExit) as err:
+        get_parser(batch=True).dispatch(['--batch', '-'])
+    assert err.value.code == 0
+    output = capsys.readouterr().out.splitlines()
+    assert [literal_eval(x) for x in output] == [['a'], ['b']]
+
+
+def test_batch_flag_failure(tmp_path):
+    '''Test batch flag reports failure when any line fails.'''
+    path = tmp_path / 'commands.txt'
+    path.write_text('echo a\nfail\n')
+    with pytest.raises(SystemExit) as err:
+        get_parser(batch=True).dispatch(['--batch', str(path)])
+    assert err.value.code == 1
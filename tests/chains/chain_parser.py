@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+# type: ignore
+'''Test chain parser.'''
+
+import asyncio
+import os
+import threading
+
+barrier = threading.Barrier(3, timeout=5)
+calls = []
+loops = []
+
+
+def work(name: str):
+    '''Mock command returning its name.
+
+    Parameters
+    ----------
+    name: str
+        name of the work
+
+    '''
+    calls.append(name)
+    return name.upper()
+
+
+def wait(name: str):
+    '''Mock command waiting for other commands to run concurrently.
+
+    Parameters
+    ----------
+    name: str
+        name of the work
+
+    '''
+    barrier.wait()
+    return name
+
+
+def pid(name: str):
+    '''Mock command returning process running it.
+
+    Parameters
+    ----------
+    name: str
+        name of the work
+
+    '''
+    return os.getpid()
+
+
+def fail(name: str):
+    '''Mock failing command.
+
+    Parameters
+    ----------
+    name: str
+        name of the work
+
+    '''
+    raise RuntimeError(name)
+
+
+def tag(name: str, label: str = 'none'):
+    '''Mock command with an option.
+
+    Parameters
+    ----------
+    name: str
+        name of the work
+    label: str
+        label of the work
+
+    '''
+    calls.append((name, label))
+
+
+async def fetch(name: str):
+    '''Mock coroutine command returning its name.
+
+    Parameters
+    ----------
+    name: str
+        name of the work
+
+    '''
+    loops.append(asyncio.get_event_loop())
+    await asyncio.sleep(0)
+    return name.upper()
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+# type: ignore
+'''Test chained commands.'''
+
+import os
+import sys
+
+import pytest
+
+from argufy import Parser
+
+sys.path.append('.')
+import chain_parser  # noqa: E402
+
+
+def get_parser(**kwargs):
+    '''Get parser with chainable commands.'''
+    parser = Parser(prog='chains', **kwargs)
+    parser.add_commands(chain_parser)
+    return parser
+
+
+def test_chain_sequential():
+    '''Test chained commands run in order by default.'''
+    chain_parser.calls.clear()
+    get_parser().dispatch(['work', 'a', 'work', 'b', 'work', 'c'])
+    assert chain_parser.calls == ['a', 'b', 'c']
+
+
+def test_chain_options():
+    '''Test each chained command only receives its own options.'''
+    chain_parser.calls.clear()
+    get_parser().dispatch(
+        ['tag', 'a', '--label', 'x', 'tag', 'b', 'tag', '--label', 'y', 'c']
+    )
+    assert chain_parser.calls == [('a', 'x'), ('b', 'none'), ('c', 'y')]
+
+
+def test_chain_fallback():
+    '''Test arguments that cannot be split are parsed by argparse.'''
+    chain_parser.calls.clear()
+    get_parser().dispatch(['tag', 'a', '--label=x', 'work', 'b'])
+    assert chain_parser.calls == [('a', 'x'), 'b']
+
+
+def test_chain_long():
+    '''Test long chains are not limited by recursion.'''
+    chain_parser.calls.clear()
+    get_parser().dispatch(['work', 'a'] * 2000)
+    assert len(chain_parser.calls) == 2000
+
+
+def test_subcommand_help(capsys):
+    '''Test module help is shown when no command is selected.'''
+    parser = Parser(prog='chains', command_type='subcommand')
+    parser.add_commands(chain_parser)
+    with pytest.raises(SystemExit) as err:
+        parser.dispatch(['chain-parser'])
+    assert err.value.code == 0
+    assert 'usage: chains chain-parser' in capsys.readouterr().out
+
+
+def test_chain_invalid():
+    '''Test unknown arguments after a command are rejected.'''
+    with pytest.raises(SystemExit) as err:
+        get_parser().dispatch(['work', 'a', '--missing'])
+    assert err.value.code == 2
+
+
+def test_chain_concurrent():
+    '''Test chained commands overlap and keep their order.'''
+    chain_parser.barrier.reset()
+    futures = get_parser().dispatch_chain(
+        ['wait', 'a', 'wait', 'b', 'wait', 'c', 'work', 'd'], max_workers=3
+    )
+    assert [x.result() for x in futures] == ['a', 'b', 'c', 'D']
+
+
+def test_chain_coroutines():
+    '''Test coroutines of chained commands do not leave loops open.'''
+    chain_parser.loops.clear()
+    parser = get_parser(chain_workers=2)
+    for _ in range(3):
+        futures = parser.dispatch_chain(['fetch', 'a', 'fetch', 'b'])
+        assert [x.result() for x in futures] == ['A', 'B']
+    assert len(chain_parser.loops) == 6
+    assert all(x.is_closed() for x in chain_parser.loops)
+
+
+def test_chain_errors():
+    '''Test errors are collected in order without stopping the chain.'''
+    chain_parser.calls.clear()
+    futures = get_parser().dispatch_chain(
+        ['fail', 'a', 'work', 'b', 'fail', 'c'], max_workers=2
+    )
+    assert [str(x.exception()) for x in futures] == ['a', 'None', 'c']
+    assert futures[1].result() == 'B'
+
+    with pytest.raises(RuntimeError, match='^a$'):
+        get_parser(chain_workers=2).dispatch(['fail', 'a', 'fail', 'c'])
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires fork')
+def test_chain_process():
+    '''Test chained commands run on a process pool.'''
+    futures = get_parser(chain_executor='process').dispatch_chain(
+        ['pid', 'a', 'work', 'b'], max_workers=2
+    )
+    assert futures[0].result() != os.getpid()
+    assert futures[1].result() == 'B'
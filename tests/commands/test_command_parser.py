@@ -54,3 +54,19 @@ def test_choice(capsys):
     parser.dispatch(['example-choice', '--choice-check', 'B'])
     capture = capsys.readouterr()
     assert literal_eval(capture.out) is True
+
+
+def test_lazy_commands(capsys):
+    '''Do build only the selected command parser.'''
+    parser = Parser(lazy_commands=True)
+    parser.add_commands(command_parser, exclude_prefixes=['test_'])
+    command = parser._subparsers._group_actions[0]
+    assert command._name_parser_map == {
+        'example-bool': None,
+        'example-choice': None,
+    }
+    parser.dispatch(['example-bool', '--bool-check'])
+    capture = capsys.readouterr()
+    assert literal_eval(capture.out) is True
+    assert command._name_parser_map['example-bool'] is not None
+    assert command._name_parser_map['example-choice'] is None
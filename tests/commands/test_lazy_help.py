@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+# type: ignore
+'''Test help deferred until rendered.'''
+
+import sys
+from argparse import _SubParsersAction as SubParsersAction
+from ast import literal_eval
+
+import pytest
+
+from argufy import Parser
+
+sys.path.append('.')
+import command_parser  # noqa: E402
+
+
+def get_helps(parser):
+    '''Get help of parser and each of its commands.'''
+    action = next(
+        x for x in parser._actions if isinstance(x, SubParsersAction)
+    )
+    return [parser.format_help()] + [
+        action.choices[x].format_help() for x in sorted(action.choices)
+    ]
+
+
+def test_lazy_help(capsys, monkeypatch):
+    '''Do parse docstrings only once help is rendered.'''
+    eager = Parser(prog='lazy', description='Lazy.')
+    eager.add_commands(command_parser, exclude_prefixes=['test_'])
+
+    parse = sys.modules['argufy.parser'].docparse
+
+    def fail(*args, **kwargs):
+        raise AssertionError('docstring parsed before help')
+
+    monkeypatch.setattr('argufy.parser.docparse', fail)
+    monkeypatch.setattr('argufy.inspection.docparse', fail)
+    parser = Parser(prog='lazy', description='Lazy.', lazy_help=True)
+    parser.add_commands(command_parser, exclude_prefixes=['test_'])
+    parser.dispatch(['example-choice', '--choice-check', 'B'])
+    assert literal_eval(capsys.readouterr().out) is True
+    with pytest.raises(SystemExit):
+        parser.dispatch(['example-missing'])
+
+    monkeypatch.setattr('argufy.parser.docparse', parse)
+    assert get_helps(parser) == get_helps(eager)
+    command = parser._subparsers._group_actions[0].choices['example-bool']
+    assert command.help_sources == []
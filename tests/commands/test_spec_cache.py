@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+# type: ignore
+'''Test spec cache.'''
+
+import sys
+from ast import literal_eval
+
+import pytest
+
+from argufy import Parser
+from argufy.cache import SpecCache
+
+sys.path.append('.')
+import command_parser  # noqa: E402
+
+
+def test_spec_cache(tmp_path, capsys, monkeypatch):
+    '''Do rebuild parser from cached specs.'''
+    cold = SpecCache(str(tmp_path))
+    parser = Parser(spec_cache=cold)
+    parser.add_commands(command_parser, exclude_prefixes=['test_'])
+    assert cold.report() == {'hits': 0, 'misses': 1}
+
+    def fail(*args, **kwargs):
+        raise AssertionError('docstring parsed on warm start')
+
+    monkeypatch.setattr('argufy.parser.docparse', fail)
+    monkeypatch.setattr('argufy.inspection.docparse', fail)
+    warm = SpecCache(str(tmp_path))
+    parser = Parser(spec_cache=warm)
+    parser.add_commands(command_parser, exclude_prefixes=['test_'])
+    assert warm.report() == {'hits': 1, 'misses': 0}
+
+    parser.dispatch(['example-choice', '--choice-check', 'B'])
+    capture = capsys.readouterr()
+    assert literal_eval(capture.out) is True
+    with pytest.raises(SystemExit):
+        parser.dispatch(['example-missing'])
+
+
+def test_spec_cache_settings(tmp_path):
+    '''Do keep separate entries per parser settings.'''
+    cache = SpecCache(str(tmp_path))
+    Parser(spec_cache=cache).add_commands(command_parser)
+    Parser(spec_cache=cache, command_scheme='chain').add_commands(
+        command_parser
+    )
+    Parser(spec_cache=cache).add_commands(command_parser)
+    assert cache.report() == {'hits': 1, 'misses': 2}
+    cache.clear()
+    assert list(tmp_path.iterdir()) == []
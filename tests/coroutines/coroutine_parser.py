@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+# type: ignore
+'''Test coroutine parser.'''
+
+import asyncio
+
+loops = []
+
+
+async def fetch(*urls: str):
+    '''Mock concurrent fetch command.
+
+    Parameters
+    ----------
+    urls: str
+        urls to be fetched
+
+    '''
+    loops.append(asyncio.get_event_loop())
+
+    async def get(url):
+        await asyncio.sleep(0)
+        return url.upper()
+
+    print(list(await asyncio.gather(*(get(x) for x in urls))))
+
+
+def echo(value: str = 'sync'):
+    '''Mock synchronous command.
+
+    Parameters
+    ----------
+    value: str
+        value to be printed
+
+    '''
+    print(repr(value))
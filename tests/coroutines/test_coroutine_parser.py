@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+# type: ignore
+'''Test coroutine commands.'''
+
+import asyncio
+import sys
+import threading
+from ast import literal_eval
+
+from argufy import Parser
+
+sys.path.append('.')
+import coroutine_parser  # noqa: E402
+
+
+def get_parser():
+    '''Get parser with coroutine commands.'''
+    parser = Parser(prog='coroutines')
+    parser.add_commands(coroutine_parser)
+    return parser
+
+
+def test_dispatch(capsys):
+    '''Test coroutine commands are awaited by synchronous dispatch.'''
+    coroutine_parser.loops.clear()
+    parser = get_parser()
+    parser.dispatch(['fetch', 'a', 'b'])
+    parser.dispatch(['fetch', 'c'])
+    output = capsys.readouterr().out.splitlines()
+    assert [literal_eval(x) for x in output] == [['A', 'B'], ['C']]
+    # NOTE: event loop is reused instead of created per call
+    first, second = coroutine_parser.loops
+    assert first is second and not first.is_running()
+
+
+def test_dispatch_thread(capsys):
+    '''Test event loop of a thread is closed when the thread finishes.'''
+    coroutine_parser.loops.clear()
+    parser = get_parser()
+    for name in ('a', 'b'):
+        thread = threading.Thread(
+            target=parser.dispatch, args=(['fetch', name],)
+        )
+        thread.start()
+        thread.join()
+    first, second = coroutine_parser.loops
+    assert first is not second
+    assert first.is_closed() and second.is_closed()
+    assert capsys.readouterr().out.splitlines() == ["['A']", "['B']"]
+
+
+def test_dispatch_async(capsys):
+    '''Test coroutine commands are awaited on the caller loop.'''
+    coroutine_parser.loops.clear()
+    parser = get_parser()
+
+    async def main():
+        await parser.dispatch_async(['fetch', 'x'])
+        await parser.dispatch_async(['echo', '--value', 'y'])
+        return asyncio.get_event_loop()
+
+    loop = asyncio.new_event_loop()
+    try:
+        assert loop.run_until_complete(main()) is loop
+    finally:
+        loop.close()
+    assert coroutine_parser.loops == [loop]
+    output = capsys.readouterr().out.splitlines()
+    assert [literal_eval(x) for x in output] == [['X'], 'y']
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+# type: ignore
+'''Test docstring scanner against docstring parser.'''
+
+import sys
+from inspect import getmembers, isfunction
+
+import pytest
+from docstring_parser import parse
+
+from argufy import Parser
+from argufy.docstring import parse as parse_style
+from argufy.docstring import scan
+
+sys.path.append('.')
+import test_google  # noqa: E402
+import test_numpy  # noqa: E402
+import test_restructured  # noqa: E402
+
+FIXTURES = {
+    'google': test_google,
+    'numpy': test_numpy,
+    'rest': test_restructured,
+}
+
+
+def summarize(docstring):
+    '''Get the details of a docstring used by arguments.'''
+    return docstring.short_description, [
+        (
+            x.arg_name,
+            x.type_name,
+            x.description.splitlines()[0] if x.description else None,
+            bool(x.is_optional),
+        )
+        for x in docstring.params
+    ]
+
+
+@pytest.mark.parametrize('style', FIXTURES)
+def test_scan(style):
+    '''Test scanner finds the same parameters as docstring parser.'''
+    module = FIXTURES[style]
+    functions = [
+        fn
+        for name, fn in getmembers(module, isfunction)
+        if name.startswith('argument_')
+    ]
+    assert functions
+    for fn in functions:
+        expected = summarize(parse(fn.__doc__))
+        assert summarize(scan(fn.__doc__)) == expected
+        assert summarize(parse_style(fn.__doc__, style)) == expected
+
+
+@pytest.mark.parametrize('style', FIXTURES)
+def test_docstring_style(style):
+    '''Test pinned and scanned styles build the same arguments.'''
+    module = FIXTURES[style]
+    helps = []
+    for docstring_style in ('auto', style, 'scan'):
+        parser = Parser(prog='style', docstring_style=docstring_style)
+        parser.add_commands(module, exclude_prefixes=['test_'])
+        command = parser._subparsers._group_actions[0]
+        helps.append([x.format_help() for x in command.choices.values()])
+    assert helps[0] == helps[1] == helps[2]
+
+    parser = Parser(prog='style')
+    parser.add_commands(
+        module, exclude_prefixes=['test_'], docstring_style='scan'
+    )
+    with pytest.raises(ValueError):
+        parser.add_commands(module, docstring_style='other')
+    with pytest.raises(ValueError):
+        Parser(docstring_style='other')
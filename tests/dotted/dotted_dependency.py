@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+# type: ignore
+'''Test dependency of dotted parser imported with it.'''
+
+SCALE = 2
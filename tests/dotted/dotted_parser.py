@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+# type: ignore
+'''Test dotted parser.'''
+
+from typing import List
+
+import dotted_dependency
+
+
+def example_bool(bool_check: bool = False):
+    '''Mock example bool.
+
+    Parameters
+    ----------
+    bool_check: bool, optional
+        list packages and version
+
+    '''
+    print(bool_check is True)
+
+
+def example_choice(choice_check: str = 'A'):
+    '''Mock example choice.
+
+    Parameters
+    ----------
+    choice_check: str, {'A', 'B', 'C'}
+        example choice
+
+    '''
+    print(choice_check == 'B')
+
+
+def example_scale(values: List[str], *, factor: float = 1.5):
+    '''Mock example scale.
+
+    Parameters
+    ----------
+    values: List[str]
+        values scaled
+    factor: float, optional
+        scale of values
+
+    '''
+    print(len(values) * factor * dotted_dependency.SCALE)
+
+
+def example_default(path: str = dotted_dependency.__name__):
+    '''Mock example default.
+
+    Parameters
+    ----------
+    path: str, optional
+        default that is not a literal
+
+    '''
+    print(path)
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+# type: ignore
+'''Test commands registered by dotted path.'''
+
+import importlib
+import sys
+from ast import literal_eval
+
+import pytest
+
+from argufy import Parser, SpecCache
+
+sys.path.append('.')
+
+
+@pytest.fixture(autouse=True)
+def unload():
+    '''Remove command module so each test starts without it.'''
+    for name in ('dotted_parser', 'dotted_dependency'):
+        sys.modules.pop(name, None)
+    yield
+    for name in ('dotted_parser', 'dotted_dependency'):
+        sys.modules.pop(name, None)
+
+
+def test_help(capsys):
+    '''Do show help without importing command module.'''
+    parser = Parser()
+    parser.add_commands('dotted_parser')
+    with pytest.raises(SystemExit) as err:
+        parser.dispatch(['--help'])
+    assert err.value.code == 0
+    assert 'example-bool' in capsys.readouterr().out
+    assert 'dotted_parser' not in sys.modules
+
+
+def test_dispatch(capsys):
+    '''Do import command module when command is dispatched.'''
+    parser = Parser()
+    parser.add_commands('dotted_parser')
+    assert 'dotted_parser' not in sys.modules
+    parser.dispatch(['example-bool', '--bool-check'])
+    assert 'dotted_parser' in sys.modules
+    assert literal_eval(capsys.readouterr().out) is True
+
+
+def test_command_help(capsys):
+    '''Do show command help from module source without importing it.'''
+    parser = Parser()
+    parser.add_commands('dotted_parser')
+    with pytest.raises(SystemExit) as err:
+        parser.dispatch(['example-scale', '--help'])
+    assert err.value.code == 0
+    output = capsys.readouterr().out
+    assert 'values scaled' in output
+    assert '--factor' in output
+    assert 'dotted_parser' not in sys.modules
+    assert 'dotted_dependency' not in sys.modules
+
+    parser.dispatch(['example-scale', 'a', '--factor', '2'])
+    assert literal_eval(capsys.readouterr().out) == 4.0
+    assert 'dotted_dependency' in sys.modules
+
+
+def test_source_arguments():
+    '''Do read the same arguments from source as from the module.'''
+    parser = Parser()
+    parser.add_commands('dotted_parser')
+    commands = parser._subparsers._group_actions[0]
+    source = commands.get_parser('example-scale')
+    assert 'dotted_parser' not in sys.modules
+
+    imported = Parser()
+    imported.add_commands(importlib.import_module('dotted_parser'))
+    expected = imported._subparsers._group_actions[0].choices['example-scale']
+    assert [
+        (x.option_strings, x.dest, x.nargs, x.type, x.default, x.help)
+        for x in source._actions
+    ] == [
+        (x.option_strings, x.dest, x.nargs, x.type, x.default, x.help)
+        for x in expected._actions
+    ]
+
+
+def test_source_fallback(capsys):
+    '''Do import command module when defaults are not literals.'''
+    parser = Parser()
+    parser.add_commands('dotted_parser')
+    parser.dispatch(['example-bool'])
+    assert 'dotted_dependency' in sys.modules
+    sys.modules.pop('dotted_parser')
+
+    parser = Parser()
+    parser.add_commands('dotted_parser')
+    parser.dispatch(['example-default'])
+    assert capsys.readouterr().out.split() == ['False', 'dotted_dependency']
+
+
+def test_subcommand_chain(capsys):
+    '''Do defer import with subcommands and chain scheme.'''
+    parser = Parser(command_type='subcommand', command_scheme='chain')
+    parser.add_commands('dotted_parser')
+    with pytest.raises(SystemExit) as err:
+        parser.dispatch(['dotted-parser', '--help'])
+    assert err.value.code == 0
+    assert 'dotted-parser.example-choice' in capsys.readouterr().out
+    assert 'dotted_parser' not in sys.modules
+
+    parser.dispatch(
+        [
+            'dotted-parser',
+            'dotted-parser.example-choice',
+            '--choice-check',
+            'B',
+        ]
+    )
+    assert literal_eval(capsys.readouterr().out) is True
+
+
+def test_spec_cache(tmp_path, capsys):
+    '''Do register cached commands without importing command module.'''
+    cache = SpecCache(str(tmp_path))
+    Parser(spec_cache=cache).add_commands('dotted_parser')
+    sys.modules.pop('dotted_parser')
+
+    parser = Parser(spec_cache=cache)
+    parser.add_commands('dotted_parser')
+    assert cache.report() == {'hits': 1, 'misses': 1}
+    assert 'dotted_parser' not in sys.modules
+    parser.dispatch(['example-choice', '--choice-check', 'B'])
+    assert literal_eval(capsys.readouterr().out) is True
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+# type: ignore
+'''Test parsers rebuilt from static manifests.'''
+
+import json
+import sys
+from ast import literal_eval
+
+import pytest
+
+from argufy import Parser
+from argufy.cli import compile
+
+sys.path.append('.')
+
+
+def build():
+    '''Build parser to be compiled.'''
+    parser = Parser(prog='tool', version='1.0', command_type='subcommand')
+    parser.add_commands('manifest_parser')
+    return parser
+
+
+@pytest.fixture
+def source(tmp_path):
+    '''Compile manifest without leaving command module imported.'''
+    output = tmp_path / 'manifest.json'
+    compile(f"{__name__}:build", str(output))
+    sys.modules.pop('manifest_parser', None)
+    yield str(output)
+    sys.modules.pop('manifest_parser', None)
+
+
+def test_manifest(source):
+    '''Do describe every command and its target.'''
+    with open(source, encoding='utf-8') as f:
+        record = json.load(f)
+    commands = record['actions'][1]['commands']['commands'][0]
+    assert commands['name'] == 'manifest-parser'
+    command = commands['parser']['actions'][0]['commands']['commands'][2]
+    assert command['name'] == 'example-count'
+    assert command['parser']['defaults']['fn'] == {
+        'ref': 'manifest_parser:example_count'
+    }
+
+
+def test_help_without_import(source, capsys):
+    '''Do serve help, version, and usage errors without importing.'''
+    parser = Parser.from_manifest(source)
+    with pytest.raises(SystemExit) as err:
+        parser.dispatch(['--version'])
+    assert err.value.code == 0
+    assert capsys.readouterr().out == 'tool 1.0\n'
+
+    with pytest.raises(SystemExit) as err:
+        parser.dispatch(['manifest-parser', 'example-count', '--help'])
+    assert err.value.code == 0
+    assert 'example count' in capsys.readouterr().out
+
+    with pytest.raises(SystemExit) as err:
+        parser.dispatch(['manifest-parser', 'example-count', 'a'])
+    assert err.value.code == 2
+    assert "invalid float value: 'a'" in capsys.readouterr().err
+    assert 'manifest_parser' not in sys.modules
+
+
+def test_dispatch(source, capsys):
+    '''Do import command module when command is dispatched.'''
+    parser = Parser.from_manifest(source)
+    parser.dispatch(['manifest-parser', 'example-count', '2', '--name', 'y'])
+    assert capsys.readouterr().out == '4.0 y\n'
+    parser.dispatch(['manifest-parser', 'example-bool', '--bool-check'])
+    assert literal_eval(capsys.readouterr().out) is True
+
+
+def test_rendered_help(tmp_path, capsys):
+    '''Do reuse help rendered when the manifest was compiled.'''
+    output = tmp_path / 'manifest.json'
+    compile(f"{__name__}:build", str(output), rendered=True)
+    with open(output, encoding='utf-8') as f:
+        record = json.load(f)
+    assert len(record['help']) == 2
+
+    for key, value in record['help'].items():
+        record['help'][key] = value.replace('usage:', 'cached:')
+    parser = Parser.from_manifest(record)
+    with pytest.raises(SystemExit):
+        parser.dispatch(['--help'])
+    assert capsys.readouterr().out.startswith('cached:')
@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+# type: ignore
+'''Test private module.'''
+
+
+def run_private():
+    '''Run private.'''
+    print(repr('private'))
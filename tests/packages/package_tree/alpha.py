@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+# type: ignore
+'''Test alpha module.'''
+
+
+def run_alpha(count: int = 1):
+    '''Run alpha.
+
+    Parameters
+    ----------
+    count: int, optional
+        times alpha is run
+
+    '''
+    print(repr('alpha'))
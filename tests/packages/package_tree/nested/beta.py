@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+# type: ignore
+'''Test beta module.'''
+
+
+def run_beta(name: str = 'beta'):
+    '''Run beta.
+
+    Parameters
+    ----------
+    name: str, optional
+        name printed
+
+    '''
+    print(repr(name))
@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+# type: ignore
+'''Test gamma module.'''
+
+
+def run_gamma(flag: bool = False):
+    '''Run gamma.
+
+    Parameters
+    ----------
+    flag: bool, optional
+        flag printed
+
+    '''
+    print(flag is True)
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+# type: ignore
+'''Test commands discovered in package trees.'''
+
+import os
+import shutil
+import sys
+from ast import literal_eval
+
+import pytest
+
+from argufy import Parser, SpecCache
+
+sys.path.append(os.path.dirname(__file__))
+
+
+@pytest.fixture(autouse=True)
+def unload():
+    '''Remove package modules so each test starts without them.'''
+    yield
+    for name in [x for x in sys.modules if x.startswith('package_tree')]:
+        sys.modules.pop(name)
+
+
+def get_imported():
+    '''Get modules of the package tree that were imported.'''
+    return sorted(x for x in sys.modules if x.startswith('package_tree'))
+
+
+def test_help(capsys):
+    '''Do list modules and packages without importing them.'''
+    parser = Parser(prog='tree')
+    parser.add_package('package_tree')
+    with pytest.raises(SystemExit):
+        parser.dispatch(['--help'])
+    output = capsys.readouterr().out
+    assert 'alpha' in output
+    assert 'nested' in output
+    assert 'private' not in output
+
+    with pytest.raises(SystemExit):
+        parser.dispatch(['nested', 'deep', 'gamma', '--help'])
+    assert 'run-gamma' in capsys.readouterr().out
+    assert get_imported() == []
+
+
+def test_description(capsys):
+    '''Do describe modules and packages with their docstring summary.'''
+    parser = Parser(prog='tree')
+    parser.add_package('package_tree')
+    commands = parser._subparsers._group_actions[0]
+    assert commands.get_parser('alpha').description == 'Test alpha module.'
+    assert commands.get_parser('nested').description == 'Test nested package.'
+    with pytest.raises(SystemExit):
+        parser.dispatch(['--help'])
+    output = capsys.readouterr().out.lower()
+    assert 'test alpha module' in output
+    assert 'test nested package' in output
+
+    with pytest.raises(SystemExit):
+        parser.dispatch(['nested', '--help'])
+    output = capsys.readouterr().out.lower()
+    assert 'test nested package' in output
+    assert 'test deep package' in output
+    assert 'inspection based' not in output
+    assert get_imported() == []
+
+
+def test_level_help(capsys):
+    '''Do show help of a level selected without a command.'''
+    parser = Parser(prog='tree')
+    parser.add_package('package_tree')
+    for args, usage in (
+        (['alpha'], 'usage: tree alpha'),
+        (['nested'], 'usage: tree nested'),
+        (['nested', 'deep'], 'usage: tree nested deep'),
+    ):
+        with pytest.raises(SystemExit) as err:
+            parser.dispatch(args)
+        assert err.value.code == 0
+        assert capsys.readouterr().out.startswith(usage)
+
+
+def test_dispatch(capsys):
+    '''Do import only the module of the dispatched command.'''
+    parser = Parser(prog='tree')
+    parser.add_package('package_tree')
+    parser.dispatch(['nested', 'deep', 'gamma', 'run-gamma', '--flag'])
+    assert literal_eval(capsys.readouterr().out) is True
+    assert get_imported() == [
+        'package_tree',
+        'package_tree.nested',
+        'package_tree.nested.deep',
+        'package_tree.nested.deep.gamma',
+    ]
+
+    parser.dispatch(['alpha', 'run-alpha'])
+    assert literal_eval(capsys.readouterr().out) == 'alpha'
+
+
+def test_not_recursive():
+    '''Do skip subpackages unless recursive.'''
+    parser = Parser(prog='tree')
+    parser.add_package('package_tree', recursive=False)
+    commands = parser._subparsers._group_actions[0]
+    assert list(commands.choices) == ['alpha']
+
+
+def test_index(tmp_path, monkeypatch):
+    '''Do reuse modules discovered by previous runs until changed.'''
+    cache = SpecCache(str(tmp_path))
+    Parser(spec_cache=cache).add_package('package_tree')
+    assert os.path.isfile(tmp_path / 'package_tree.index.json')
+
+    scanned = []
+    scan = sys.modules['argufy.parser'].scan_package
+    monkeypatch.setattr(
+        'argufy.parser.scan_package',
+        lambda x: scanned.append(x) or scan(x),
+    )
+    parser = Parser(spec_cache=cache)
+    parser.add_package('package_tree')
+    commands = parser._subparsers._group_actions[0]
+    commands.get_parser('nested')
+    assert scanned == [
+        os.path.join(os.path.dirname(__file__), 'package_tree', 'nested')
+    ]
+
+    parser = Parser(spec_cache=cache)
+    parser.add_package('package_tree')
+    parser._subparsers._group_actions[0].get_parser('nested')
+    assert len(scanned) == 1
+
+
+def test_index_summaries(tmp_path, monkeypatch):
+    '''Do read summaries again once their module is edited.'''
+    source = tmp_path / 'source'
+    shutil.copytree(
+        os.path.join(os.path.dirname(__file__), 'package_tree'),
+        source / 'edited_tree',
+    )
+    monkeypatch.syspath_prepend(str(source))
+    cache = SpecCache(str(tmp_path / 'cache'))
+    Parser(spec_cache=cache).add_package('edited_tree')
+
+    path = source / 'edited_tree'
+    mtime = os.stat(path).st_mtime_ns
+    module = path / 'alpha.py'
+    module.write_text(
+        module.read_text().replace('Test alpha module.', 'Edited module.')
+    )
+    stat = os.stat(module)
+    os.utime(module, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    os.utime(path, ns=(mtime, mtime))
+
+    parser = Parser(spec_cache=cache)
+    parser.add_package('edited_tree')
+    commands = parser._subparsers._group_actions[0]
+    assert commands.get_parser('alpha').description == 'Edited module.'
+
+
+def test_not_package():
+    '''Do reject modules that are not packages.'''
+    with pytest.raises(ValueError):
+        Parser().add_package('package_tree.alpha')
+    with pytest.raises(ValueError):
+        Parser().add_package('missing_package')
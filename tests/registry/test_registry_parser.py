@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+# type: ignore
+'''Test commands declared with decorators.'''
+
+import sys
+from ast import literal_eval
+
+import pytest
+
+import argufy
+from argufy import Parser
+from argufy.registry import Command, registry
+
+sys.path.append('.')
+import registry_parser  # noqa: E402
+
+
+def get_commands(parser):
+    '''Get commands of parser by name.'''
+    return parser._subparsers._group_actions[0].choices
+
+
+def test_registry():
+    '''Do record declared commands with specs in definition order.'''
+    commands = registry['registry_parser']
+    assert list(commands) == ['example_bool', 'example_choice']
+    assert commands['example_bool'].name == 'example-bool'
+    assert commands['example_choice'].name == 'choose'
+    arguments = commands['example_bool'].get_arguments('auto', 'case', False)
+    assert [x.name for x in arguments] == [('--bool-check',)]
+    assert commands['example_bool'].fn is registry_parser.example_bool
+
+
+def test_add_commands(capsys, monkeypatch):
+    '''Do build commands from registry without inspecting module.'''
+
+    def fail(*args, **kwargs):
+        raise AssertionError('module members inspected')
+
+    monkeypatch.setattr('argufy.parser.inspect.getmembers', fail)
+    parser = Parser(prog='registry')
+    parser.add_commands(registry_parser)
+    assert list(get_commands(parser)) == ['example-bool', 'choose']
+    assert 'pick a choice' in parser.format_help()
+
+    parser.dispatch(['choose', '--choice-check', 'B'])
+    assert literal_eval(capsys.readouterr().out) is True
+    with pytest.raises(SystemExit):
+        parser.dispatch(['example-hidden'])
+
+
+def test_exclude_prefixes():
+    '''Do exclude declared commands by prefix.'''
+    parser = Parser(prog='registry')
+    parser.add_commands(registry_parser, exclude_prefixes=['example_c'])
+    assert list(get_commands(parser)) == ['example-bool']
+
+
+def test_module_names():
+    '''Do keep the decorator name apart from the registry module.'''
+    import argufy.registry as module
+
+    assert argufy.command is module.command
+    assert module.registry is registry
+
+
+def test_deferred_specs(monkeypatch):
+    '''Do compute specs once the command is used by a parser.'''
+    calls = []
+    get_argument_specs = argufy.registry.get_argument_specs
+    monkeypatch.setattr(
+        argufy.registry,
+        'get_argument_specs',
+        lambda *args: calls.append(args[1:]) or get_argument_specs(*args),
+    )
+    command = Command(registry_parser.example_bool)
+    assert calls == []
+    arguments = command.get_arguments('numpy', 'none', True)
+    assert command.get_arguments('numpy', 'none', True) is arguments
+    assert calls == [('numpy', 'none', True)]
+
+
+def test_chain_scheme():
+    '''Do prefix declared commands with module name in chain scheme.'''
+    parser = Parser(prog='registry', command_scheme='chain')
+    parser.add_commands(registry_parser)
+    assert list(get_commands(parser)) == [
+        'registry-parser.example-bool',
+        'registry-parser.choose',
+    ]
+
+
+def test_parser_command(capsys):
+    '''Do add commands declared on a parser.'''
+    parser = Parser(prog='registry')
+
+    @parser.command
+    def greet(name: str, loud: bool = False):
+        '''Greet someone.
+
+        Parameters
+        ----------
+        name: str
+            name greeted
+        loud: bool, optional
+            greet loudly
+
+        '''
+        print(repr(name.upper() if loud else name))
+
+    @parser.command(name='wave')
+    def wave_hand():
+        '''Wave hand.'''
+        print(repr('wave'))
+
+    assert greet.__name__ == 'greet'
+    commands = get_commands(parser)
+    assert list(commands) == ['greet', 'wave']
+    assert 'name greeted' in commands['greet'].format_help()
+
+    parser.dispatch(['greet', 'world', '--loud'])
+    assert literal_eval(capsys.readouterr().out) == 'WORLD'
+    parser.dispatch(['wave'])
+    assert literal_eval(capsys.readouterr().out) == 'wave'
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+# type: ignore
+'''Test server parser.'''
+
+import os
+import sys
+
+
+def echo(*values: str):
+    '''Mock echo command.
+
+    Parameters
+    ----------
+    values: str
+        values to be printed
+
+    '''
+    print(list(values))
+
+
+def upper():
+    '''Mock command reading stdin.'''
+    sys.stdout.write(sys.stdin.read().upper())
+
+
+def context(name: str = 'ARGUFY_TEST'):
+    '''Mock command printing its environment.
+
+    Parameters
+    ----------
+    name: str
+        environment variable to be printed
+
+    '''
+    print([os.getcwd(), os.environ.get(name)])
+
+
+def fail():
+    '''Mock failing command.'''
+    raise RuntimeError('boom')
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+# type: ignore
+'''Test warm command server.'''
+
+import io
+import os
+import socket as sock
+import subprocess
+import sys
+import time
+from ast import literal_eval
+from contextlib import closing
+
+import pytest
+
+from argufy import client
+
+sys.path.append('.')
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, 'fork'), reason='server requires unix sockets'
+)
+
+SERVER = '''
+import sys
+sys.path.insert(0, {path!r})
+import server_parser
+from argufy import Parser
+parser = Parser(prog='server', server=True)
+parser.add_commands(server_parser)
+parser.dispatch(['--serve', {socket!r}])
+'''
+
+
+@pytest.fixture
+def server(tmp_path):
+    '''Start server and wait until it listens.'''
+    socket = str(tmp_path / 'server.sock')
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            '-c',
+            SERVER.format(path=os.path.dirname(__file__), socket=socket),
+        ]
+    )
+    # NOTE: the socket file exists once bound, before the server listens
+    for _ in range(100):
+        try:
+            with closing(sock.socket(sock.AF_UNIX, sock.SOCK_STREAM)) as probe:
+                probe.connect(socket)
+            break
+        except OSError:
+            time.sleep(0.05)
+    yield socket
+    process.terminate()
+    process.wait()
+
+
+def run(socket, *args, **kwargs):
+    '''Run command on server and capture its output.'''
+    stdout, stderr = io.BytesIO(), io.BytesIO()
+    status = client.run(socket, args, stdout=stdout, stderr=stderr, **kwargs)
+    return status, stdout.getvalue().decode(), stderr.getvalue().decode()
+
+
+def test_output(server):
+    '''Test stdout and exit status are returned to client.'''
+    status, out, _ = run(server, 'echo', 'a', 'b')
+    assert status == 0
+    assert literal_eval(out) == ['a', 'b']
+
+
+def test_stdin(server):
+    '''Test stdin is forwarded to command.'''
+    status, out, _ = run(server, 'upper', stdin=io.BytesIO(b'piped\n'))
+    assert status == 0
+    assert out == 'PIPED\n'
+
+
+def test_stdin_file(server, tmp_path):
+    '''Test stdin of a regular file is forwarded in chunks.'''
+    path = tmp_path / 'input.txt'
+    path.write_bytes(b'piped\n' * 50000)
+    sizes = []
+    with open(path, 'rb') as stdin:
+        read = stdin.read
+
+        class Reader:
+            '''Record sizes read from file.'''
+
+            def fileno(self):
+                return stdin.fileno()
+
+            def read(self, size=-1):
+                sizes.append(size)
+                return read(size)
+
+        status, out, _ = run(server, 'upper', stdin=Reader())
+    assert status == 0
+    assert out == 'PIPED\n' * 50000
+    assert len(sizes) > 1 and all(x == client.CHUNK_SIZE for x in sizes)
+
+
+def test_context(server, tmp_path):
+    '''Test environment and working directory are forwarded.'''
+    status, out, _ = run(
+        server,
+        'context',
+        env={'ARGUFY_TEST': 'forwarded'},
+        cwd=str(tmp_path),
+    )
+    assert status == 0
+    assert literal_eval(out) == [str(tmp_path), 'forwarded']
+
+
+def test_errors(server):
+    '''Test failures are isolated to their invocation.'''
+    status, _, err = run(server, 'missing')
+    assert status == 2
+    assert 'invalid choice' in err
+    status, _, err = run(server, 'fail')
+    assert status == 1
+    assert 'RuntimeError: boom' in err
+    assert run(server, 'echo', 'c')[0] == 0
+
+
+def test_idle_timeout(tmp_path):
+    '''Test server stops and removes socket once idle.'''
+    from argufy import Parser
+
+    import server_parser
+
+    socket = str(tmp_path / 'idle.sock')
+    parser = Parser(prog='server')
+    parser.add_commands(server_parser)
+    start = time.perf_counter()
+    parser.serve(socket, idle_timeout=0.1)
+    assert time.perf_counter() - start < 5
+    assert not os.path.exists(socket)
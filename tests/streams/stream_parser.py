@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+# type: ignore
+'''Test stream parser.'''
+
+from typing import Iterator
+
+from argufy import NulStream, Stream
+
+
+def count(ids: Stream):
+    '''Mock command consuming values lazily.
+
+    Parameters
+    ----------
+    ids: Stream
+        values to be counted
+
+    '''
+    assert not isinstance(ids, list)
+    total = 0
+    for total, _ in enumerate(ids, 1):
+        pass
+    print(total)
+
+
+def first(ids: Iterator[str] = '-'):
+    '''Mock command reading stdin by default.
+
+    Parameters
+    ----------
+    ids: Iterator[str]
+        values read from stdin
+
+    '''
+    print(repr(next(iter(ids))))
+
+
+def records(ids: NulStream):
+    '''Mock command reading NUL delimited values.
+
+    Parameters
+    ----------
+    ids: NulStream
+        values to be printed
+
+    '''
+    print(list(ids))
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+# type: ignore
+'''Test streaming arguments.'''
+
+import io
+import sys
+from ast import literal_eval
+
+from argufy import Parser, Stream
+
+sys.path.append('.')
+import stream_parser  # noqa: E402
+
+
+def get_parser():
+    '''Get parser with streaming commands.'''
+    parser = Parser(prog='streams')
+    parser.add_commands(stream_parser)
+    return parser
+
+
+def test_stream_file(capsys, tmp_path):
+    '''Test values are streamed from a file.'''
+    path = tmp_path / 'ids.txt'
+    path.write_text(''.join(f"{x}\n" for x in range(10000)))
+    get_parser().dispatch(['count', str(path)])
+    assert literal_eval(capsys.readouterr().out) == 10000
+
+
+def test_stream_stdin(capsys, monkeypatch):
+    '''Test values are streamed from stdin by default.'''
+    monkeypatch.setattr(sys, 'stdin', io.StringIO('a b\nc\n'))
+    get_parser().dispatch(['first'])
+    assert literal_eval(capsys.readouterr().out) == 'a b'
+
+
+def test_stream_nul(capsys, tmp_path):
+    '''Test NUL delimited values may contain newlines.'''
+    path = tmp_path / 'ids.bin'
+    path.write_text('a\nb\0c\0')
+    get_parser().dispatch(['records', str(path)])
+    assert literal_eval(capsys.readouterr().out) == ['a\nb', 'c']
+
+
+def test_stream_lazy(tmp_path):
+    '''Test stream only opens its file once values are consumed.'''
+    stream = Stream(str(tmp_path / 'ids.txt'))
+    (tmp_path / 'ids.txt').write_text('a\r\nb\n\nc')
+    values = iter(stream)
+    assert next(values) == 'a'
+    assert list(values) == ['b', '', 'c']
+    # NOTE: files can be iterated again
+    assert list(stream) == ['a', 'b', '', 'c']
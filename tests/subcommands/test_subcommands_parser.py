@@ -78,3 +78,25 @@ def test_choice(capsys):
     )
     capture = capsys.readouterr()
     assert literal_eval(capture.out) is True
+
+
+def test_lazy_subcommands(capsys):
+    """Do build subcommand parsers only when selected."""
+    parser = Parser(command_type='subcommand', lazy_commands=True)
+    parser.add_commands(subcommands_parser, exclude_prefixes=['test_'])
+    command = parser._subparsers._group_actions[0]
+    assert command._name_parser_map == {'subcommands-parser': None}
+    parser.dispatch(
+        [
+            'subcommands-parser',
+            'example-choice',
+            '--choice-check',
+            'B',
+        ]
+    )
+    capture = capsys.readouterr()
+    assert literal_eval(capture.out) is True
+
+    with pytest.raises(SystemExit) as err:
+        parser.dispatch(['subcommands-parser', 'example-bool', '--help'])
+    assert err.value.code == 0
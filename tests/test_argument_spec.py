@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+# type: ignore
+'''Test immutable argument specs.'''
+
+import copy
+import pickle
+from argparse import ArgumentParser
+from inspect import signature
+
+import pytest
+
+from argufy import Argument, ArgumentSpec
+
+
+def argument_spec_example(
+    path: str, count: int = 1, force: bool = False, *rest: str
+) -> None:
+    '''Example of arguments.'''
+    pass
+
+
+def get_specs():
+    '''Get specs of example arguments.'''
+    parameters = signature(argument_spec_example).parameters.values()
+    return [Argument(parameters=x).spec for x in parameters]
+
+
+def test_argument_spec_kwargs():
+    '''Test spec exports argparse parameters that were set.'''
+    path, count, force, rest = get_specs()
+    assert path.name == ('path',)
+    assert path.kwargs == {'type': str}
+    assert count.kwargs == {'action': 'append', 'default': 1, 'type': int}
+    assert force.kwargs == {'action': 'store_true', 'default': False}
+    assert rest.kwargs == {'nargs': '*', 'type': str}
+
+    names, kwargs = force
+    parser = ArgumentParser()
+    parser.add_argument(*names, **kwargs)
+    assert parser.parse_args(names[:1]).force is True
+
+
+def test_argument_spec_immutable():
+    '''Test spec cannot be changed.'''
+    spec = get_specs()[0]
+    with pytest.raises(AttributeError):
+        spec.type = int
+    with pytest.raises(AttributeError):
+        spec.other = True
+    with pytest.raises(AttributeError):
+        del spec.type
+    assert not hasattr(spec, '__dict__')
+
+    changed = spec.replace(name=('--path',), default='.')
+    assert changed.kwargs == {'default': '.', 'type': str}
+    assert spec.kwargs == {'type': str}
+
+
+def test_argument_spec_hash():
+    '''Test specs can be compared, hashed and serialized.'''
+    specs = get_specs()
+    assert specs == get_specs()
+    assert len(set(specs + get_specs())) == len(specs)
+    spec = ArgumentSpec(('--items',), default=[1], choices=[1, 2])
+    assert hash(spec) == hash(copy.deepcopy(spec))
+    for x in specs + [spec]:
+        assert pickle.loads(pickle.dumps(x)) == x
+    assert spec != spec.replace(default=[2])
+
+    with pytest.raises(TypeError):
+        ArgumentSpec(('--items',), dest='other')
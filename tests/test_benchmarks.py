@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+# type: ignore
+'''Test benchmark suite.'''
+
+import json
+import sys
+
+import pytest
+
+sys.path.append('.')
+
+from benchmarks import core, package  # noqa: E402, F401
+from benchmarks.suite import Config, run  # noqa: E402
+
+
+@pytest.mark.parametrize('style', ['numpy', 'google', 'rest'])
+def test_benchmarks(style, tmp_path):
+    '''Test benchmarks report machine-readable results.'''
+    config = Config(
+        functions=3, params=6, style=style, repeat=1, path=str(tmp_path)
+    )
+    results = json.loads(
+        json.dumps(run(config, ['add_commands', 'dispatch', 'help']))
+    )
+    assert results['config']['style'] == style
+    assert results['results']['dispatch']['seconds']['min'] > 0
+    assert set(results['results']['help']) == {
+        'seconds_help',
+        'seconds_usage',
+        'seconds_command_help',
+        'seconds_help_uncached',
+        'seconds_source_help',
+    }
+
+
+def test_package_benchmark(tmp_path):
+    '''Test package benchmark covers trees of thousands of modules.'''
+    config = Config(params=2, repeat=1, path=str(tmp_path))
+    results = run(config, ['package'])['results']['package']
+    assert set(results) == {
+        f"seconds{x}_{y}" for x in ('', '_indexed') for y in (1000, 5000)
+    }
+
+
+def test_unknown_benchmark():
+    '''Test unknown benchmarks are rejected.'''
+    with pytest.raises(KeyError):
+        run(Config(), ['missing'])
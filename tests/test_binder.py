@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+'''Test precompiled command binders.'''
+
+from typing import Any
+
+from argufy.binder import Binder
+
+
+def binder_example(check: int, *values: str, **kwargs: Any) -> None:
+    '''Example binder.
+
+    Parameters
+    ----------
+    check: int
+        Check value.
+    extra: str
+        Keyword only documented in docstring.
+
+    '''
+    pass
+
+
+def test_binder_docstring() -> None:
+    '''Test values are separated using docstring keywords.'''
+    binder = Binder(binder_example)
+    splat, kwargs, extras = binder.bind(
+        {'check': 1, 'values': ['a', 'b'], 'extra': 'x', 'debug': True}
+    )
+    assert splat == ['a', 'b']
+    assert kwargs == {'check': 1, 'extra': 'x'}
+    assert extras == {'debug': True}
+
+
+def test_binder_keywords() -> None:
+    '''Test values are separated using command parser arguments.'''
+    binder = Binder(binder_example, ['check', 'values', 'other'])
+    splat, kwargs, extras = binder.bind(
+        {'check': 1, 'values': None, 'extra': 'x', 'other': 2}
+    )
+    assert splat == ()
+    assert kwargs == {'check': 1, 'other': 2}
+    assert extras == {'extra': 'x'}
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+# type: ignore
+'''Test compiled parse engine against argparse.'''
+
+import os
+import sys
+from argparse import ArgumentParser, Namespace
+
+import pytest
+
+from argufy import Parser, engine
+
+for name in ('chains', 'commands', 'subcommands', 'variadic'):
+    sys.path.append(os.path.join(os.path.dirname(__file__), name))
+import chain_parser  # noqa: E402
+import command_parser  # noqa: E402
+import subcommands_parser  # noqa: E402
+import variadic_parser  # noqa: E402
+
+FIXTURES = {
+    'commands': (command_parser, {}),
+    'subcommands': (subcommands_parser, {'command_type': 'subcommand'}),
+    'chains': (chain_parser, {}),
+    'variadic': (variadic_parser, {}),
+}
+
+ARGUMENTS = {
+    'commands': [
+        [],
+        ['example-bool'],
+        ['example-bool', '--bool-check'],
+        ['example-bool', '--bool'],
+        ['example-bool', '--bool-check=1'],
+        ['example-choice', '--choice-check', 'B'],
+        ['example-choice', '--choice-check=C'],
+        ['example-choice', '--ch', 'B'],
+        ['example-choice', '--choice-check'],
+        ['example-choice', '--choice-check', '--bool-check'],
+        ['example-choice', '--choice-check', '-1'],
+        ['example-bool', '--unknown', 'value'],
+        ['example-bool', 'extra', '--bool-check'],
+        ['example-bool', '--', '--bool-check'],
+        ['example-bool', '--help'],
+        ['example'],
+        ['missing'],
+        ['--version'],
+    ],
+    'subcommands': [
+        ['subcommands-parser', 'example-bool', '--bool-check'],
+        ['subcommands-parser', 'example-choice', '--choice-check', 'C'],
+        ['subcommands-parser', 'missing'],
+        ['subcommands-parser'],
+        ['example-bool'],
+    ],
+    'chains': [
+        ['work', 'a', 'work', 'b'],
+        ['tag', 'a', '--label', 'x', 'work', 'b'],
+        ['tag', 'a', '--label=x', '--', 'work'],
+        ['tag', '--label', 'x'],
+        ['tag'],
+    ],
+    'variadic': [
+        ['files'],
+        ['files', 'a', 'b', 'c'],
+        ['files', 'a', '--verbose', 'b'],
+        ['files', '-v', '--label', 'y', 'a', 'b'],
+        ['files', '-vl', 'y', 'a'],
+        ['files', '--lab', 'y', 'a'],
+        ['files', '--label', '-a', 'b'],
+        ['files', '--label'],
+        ['files', '', 'a', '-'],
+        ['copy', 'd'],
+        ['copy', 'd', 's1', 's2', '--force'],
+        ['copy', '--force'],
+        ['copy'],
+    ],
+}
+
+CASES = [(k, v) for k, args in ARGUMENTS.items() for v in args]
+
+
+def get_parser(name, **kwargs):
+    '''Get parser of fixture module.'''
+    module, settings = FIXTURES[name]
+    parser = Parser(prog=name, version='0.0.0', **settings, **kwargs)
+    parser.add_commands(module, exclude_prefixes=['test_'])
+    return parser
+
+
+def get_result(parser, args, capsys):
+    '''Get parsed namespace, or exit status and messages.'''
+    try:
+        namespace, extras = parser.parse_known_args(args)
+    except SystemExit as err:
+        captured = capsys.readouterr()
+        return err.code, captured.out, captured.err
+    return vars(namespace), extras
+
+
+@pytest.mark.parametrize('name,args', CASES)
+def test_engine_matches_argparse(name, args, capsys):
+    '''Test compiled engine parses the same as argparse.'''
+    parser = get_parser(name)
+    expected = get_result(parser, args, capsys)
+    parser.parse_engine = 'compiled'
+    assert get_result(parser, args, capsys) == expected
+    # NOTE: parsers are compiled once then tables are reused
+    assert get_result(parser, args, capsys) == expected
+
+
+@pytest.mark.skipif(
+    not engine.SUPPORTED, reason='engine not supported by this python'
+)
+@pytest.mark.parametrize(
+    'name,args',
+    [
+        ('commands', ['example-bool', '--bool-check']),
+        ('commands', ['example-choice', '--ch=B', 'extra']),
+        ('subcommands', ['subcommands-parser', 'example-bool']),
+        ('chains', ['tag', 'a', '--label', 'x', 'work', 'b']),
+        ('variadic', ['files', '-v', 'a', 'b']),
+        ('variadic', ['copy', 'd', 's1', 's2']),
+    ],
+)
+def test_engine_parses(name, args):
+    '''Test compiled engine parses generated commands without argparse.'''
+    parser = get_parser(name)
+    assert engine.parse(parser, args) == parser.parse_known_args(args)
+
+
+@pytest.mark.skipif(
+    not engine.SUPPORTED, reason='engine not supported by this python'
+)
+@pytest.mark.parametrize('size', [3, 4])
+def test_engine_option_tuples(size, monkeypatch):
+    '''Test compiled engine reads every shape of argparse option tuples.'''
+    parser = get_parser('commands')
+    args = ['example-choice', '--ch=B', 'extra']
+    expected = parser.parse_known_args(args)
+    parse_optional = ArgumentParser._parse_optional
+
+    def wrap(self, arg_string):
+        option = parse_optional(self, arg_string)
+        if option is None:
+            return None
+        option = tuple(option[:2]) + (None,) * (size - 3) + (option[-1],)
+        return [option]
+
+    monkeypatch.setattr(ArgumentParser, '_parse_optional', wrap)
+    assert engine.parse(parser, args) == expected
+
+
+@pytest.mark.skipif(engine.SUPPORTED, reason='engine supported')
+def test_engine_unsupported():
+    '''Test unsupported pythons leave every command line to argparse.'''
+    parser = get_parser('commands', parse_engine='compiled')
+    args = ['example-choice', '--choice-check', 'C']
+    assert engine.parse(parser, args) is None
+    assert vars(parser.parse_known_args(args)[0])['choice_check'] == 'C'
+
+
+def test_engine_fallback():
+    '''Test compiled engine leaves unsupported arguments to argparse.'''
+    parser = get_parser('commands')
+    assert engine.parse(parser, ['--help']) is None
+    assert engine.parse(parser, ['example-bool', '--']) is None
+    assert engine.parse(parser, ['missing']) is None
+
+
+def test_engine_namespace():
+    '''Test compiled engine only updates namespace when parsed.'''
+    parser = get_parser('commands', parse_engine='compiled')
+    namespace = Namespace(other=True)
+    result, extras = parser.parse_known_args(
+        ['example-choice', '--choice-check', 'C'], namespace
+    )
+    assert result is namespace
+    assert namespace.other is True
+    assert namespace.choice_check == 'C'
+    assert extras == []
+
+    namespace = Namespace()
+    assert engine.parse(parser, ['missing'], namespace) is None
+    assert vars(namespace) == {}
+
+
+def test_engine_unknown():
+    '''Test unknown parse engine is rejected.'''
+    with pytest.raises(ValueError):
+        Parser(parse_engine='other')
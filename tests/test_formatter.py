@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+# type: ignore
+'''Test help formatter colors.'''
+
+import io
+import subprocess
+import sys
+
+import pytest
+
+from argufy import Parser, cli
+from argufy.formatter import ArgufyHelpFormatter, supports_color
+
+
+class Terminal(io.StringIO):
+    '''Provide stream that reports being a terminal.'''
+
+    def isatty(self):
+        return True
+
+
+def get_parser():
+    '''Get parser with a command.'''
+    parser = Parser(prog='example', description='Example.')
+    parser.add_commands(cli)
+    return parser
+
+
+def test_stream_untouched():
+    '''Test importing argufy does not replace standard streams.'''
+    script = (
+        'import sys; streams = (sys.stdout, sys.stderr); import argufy; '
+        'print(streams == (sys.stdout, sys.stderr))'
+    )
+    output = subprocess.run(
+        [sys.executable, '-c', script],
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    ).stdout
+    assert output.strip() == 'True'
+
+
+def test_supports_color(monkeypatch):
+    '''Test color is only used on terminals without NO_COLOR.'''
+    monkeypatch.delenv('NO_COLOR', raising=False)
+    assert supports_color(Terminal()) is True
+    assert supports_color(io.StringIO()) is False
+    monkeypatch.setenv('NO_COLOR', '1')
+    assert supports_color(Terminal()) is False
+
+
+def test_help_without_color(monkeypatch):
+    '''Test help piped to another process has no escape codes.'''
+    monkeypatch.setattr(sys, 'stdout', io.StringIO())
+    assert '\x1b[' not in get_parser().format_help()
+
+
+def test_help_with_color(monkeypatch):
+    '''Test help rendered with color keeps column alignment.'''
+    parser = get_parser()
+    plain = parser.format_help()
+    monkeypatch.setattr(ArgufyHelpFormatter, 'color', True)
+    colored = parser.format_help()
+    assert '\x1b[' in colored
+    for code in ('\x1b[0m', '\x1b[1m', '\x1b[33m', '\x1b[36m'):
+        colored = colored.replace(code, '')
+    assert colored == plain
+
+
+def test_help_cached(monkeypatch):
+    '''Test help is rendered once until the parser layout changes.'''
+    monkeypatch.setenv('COLUMNS', '80')
+    parser = get_parser()
+    usage = parser.format_usage()
+    assert parser.format_usage() is usage
+    assert parser.format_help() is parser.format_help()
+
+    parser.add_argument('--extra', help='added later')
+    assert '--extra' in parser.format_usage()
+    assert '--extra' in parser.format_help()
+
+    monkeypatch.setenv('COLUMNS', '120')
+    assert parser.format_usage() is not usage
+    assert len(parser.help_cache) == 3
+
+    monkeypatch.setattr(ArgufyHelpFormatter, 'color', True)
+    assert '\x1b[' in parser.format_help()
+
+
+def test_help_cache_invalidated(monkeypatch):
+    '''Test help is rendered again when parser text changes.'''
+    monkeypatch.setenv('COLUMNS', '80')
+    parser = get_parser()
+    parser.format_help()
+
+    parser.description = 'Changed description.'
+    parser.epilog = 'Changed epilog.'
+    parser.prog = 'changed'
+    parser._actions[-1]._choices_actions[0].help = 'changed command help'
+    message = parser.format_help()
+    assert 'Changed description.' in message
+    assert 'Changed epilog.' in message
+    assert message.startswith('usage: changed')
+    assert 'changed command help' in message
+
+    action = parser.add_argument('--extra', help='added later')
+    assert '--extra' in parser.format_help()
+    action.help = 'changed later'
+    assert 'changed later' in parser.format_help()
+    parser._remove_action(action)
+    assert parser.help_cache == {}
+
+
+def test_color_stream(monkeypatch):
+    '''Test color is detected from the stream messages are printed to.'''
+    monkeypatch.delenv('NO_COLOR', raising=False)
+    terminal, piped = Terminal(), io.StringIO()
+    monkeypatch.setattr(sys, 'stdout', terminal)
+    monkeypatch.setattr(sys, 'stderr', piped)
+    parser = get_parser()
+    with pytest.raises(SystemExit):
+        parser.error('failed')
+    assert 'usage:' in piped.getvalue()
+    assert '\x1b[' not in piped.getvalue()
+    parser.print_help()
+    assert '\x1b[' in terminal.getvalue()
+
+    terminal, piped = Terminal(), io.StringIO()
+    monkeypatch.setattr(sys, 'stdout', piped)
+    monkeypatch.setattr(sys, 'stderr', terminal)
+    with pytest.raises(SystemExit):
+        parser.error('failed')
+    assert '\x1b[' in terminal.getvalue()
+    parser.print_help()
+    assert '\x1b[' not in piped.getvalue()
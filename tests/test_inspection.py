@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+'''Test shared introspection records.'''
+
+from docstring_parser import parse as docparse
+
+from argufy import Parser
+from argufy.inspection import CACHE_SIZE, get_inspection
+
+
+def inspection_example(
+    check: int, *values: str, verbose: bool = False
+) -> None:
+    '''Example inspection.
+
+    Parameters
+    ----------
+    check: int
+        Check value.
+    verbose: bool
+        Show output.
+    extra: str
+        Keyword only documented in docstring.
+
+    '''
+    pass
+
+
+def test_inspection_record() -> None:
+    '''Test introspection record is indexed and shared.'''
+    inspection = get_inspection(inspection_example)
+    assert get_inspection(inspection_example) is inspection
+    assert inspection.summary == 'Example inspection.'
+    assert inspection.params['verbose'].description == 'Show output.'
+    assert inspection.keywords == ['extra']
+    assert inspection.splat == 'values'
+
+
+def test_inspection_eviction() -> None:
+    '''Test introspection records are bounded.'''
+    assert get_inspection.cache_info().maxsize == CACHE_SIZE
+    get_inspection.cache_clear()
+    assert get_inspection.cache_info().currsize == 0
+
+
+def test_inspection_reused(monkeypatch) -> None:
+    '''Test docstring is parsed once across parser methods.'''
+    calls = []
+
+    def parse(text, style='auto'):
+        calls.append(text)
+        return docparse(text)
+
+    get_inspection.cache_clear()
+    monkeypatch.setattr('argufy.inspection.docparse', parse)
+    parser = Parser()
+    parser.add_arguments(inspection_example)
+    parser.add_arguments(inspection_example, Parser())
+    assert get_inspection(inspection_example).keywords == ['extra']
+    assert calls == [inspection_example.__doc__]
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+# type: ignore
+'''Test indexed matching of option strings.'''
+
+from argparse import ArgumentError, ArgumentParser
+
+import pytest
+
+from argufy import Parser
+
+ARGUMENTS = [
+    '--verb',
+    '--verbose',
+    '--ver',
+    '--v',
+    '--name=x',
+    '--na=x',
+    '--n',
+    '--',
+    '-v',
+    '-vv',
+    '-nx',
+    '-n=x',
+    '-1',
+    '-1.5',
+    '--unknown',
+    '-q',
+]
+
+
+def get_parser(**kwargs):
+    '''Get parser with options sharing prefixes.'''
+    parser = Parser(prog='options', **kwargs)
+    parser.add_argument('-v', '--verbose', action='store_true')
+    parser.add_argument('--version-file')
+    group = parser.add_argument_group('naming')
+    group.add_argument('-n', '--name')
+    group.add_argument('--names', nargs='*')
+    for index in range(100):
+        parser.add_argument(f"--option{index}")
+    return parser
+
+
+@pytest.mark.parametrize('allow_abbrev', [True, False])
+@pytest.mark.parametrize('arg', ARGUMENTS)
+def test_option_tuples(arg, allow_abbrev, capsys):
+    '''Test indexed option tuples are the same as argparse.'''
+    parser = get_parser(allow_abbrev=allow_abbrev)
+
+    def parse(method):
+        try:
+            return method(parser, arg)
+        except SystemExit as err:
+            return err.code, capsys.readouterr().err
+        except ArgumentError as err:
+            # NOTE: python 3.13 raises ambiguous prefixes instead of exiting
+            return str(err)
+
+    if len(arg) > 1:
+        assert parse(Parser._get_option_tuples) == parse(
+            ArgumentParser._get_option_tuples
+        )
+    assert parse(Parser._parse_optional) == parse(
+        ArgumentParser._parse_optional
+    )
+
+
+def test_option_ambiguous(capsys):
+    '''Test ambiguous abbreviations list matches in the order added.'''
+    parser = get_parser()
+    with pytest.raises(SystemExit):
+        parser.parse_args(['--option'])
+    assert (
+        'could match --option0, --option1, --option2'
+        in capsys.readouterr().err
+    )
+
+
+def test_option_added():
+    '''Test options added after parsing are indexed.'''
+    parser = get_parser()
+    assert parser.parse_args(['--verb']).verbose is True
+    parser.add_argument('--verbatim', action='store_true')
+    with pytest.raises(SystemExit):
+        parser.parse_args(['--verb'])
+    assert parser.parse_args(['--verba']).verbatim is True
+
+
+def test_option_indexed(monkeypatch):
+    '''Test option tuples are matched by the index on every python.'''
+    parser = get_parser()
+    expected = [
+        ArgumentParser._get_option_tuples(parser, x)
+        for x in ('--verb', '--na=x', '-nx', '-vv')
+    ]
+
+    def scan(*args):
+        raise AssertionError('options scanned by argparse')
+
+    monkeypatch.setattr(ArgumentParser, '_get_option_tuples', scan)
+    assert [
+        parser._get_option_tuples(x)
+        for x in ('--verb', '--na=x', '-nx', '-vv')
+    ] == expected
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+# type: ignore
+'''Test allocation of short flags.'''
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from argufy import Parser
+from argufy.argument import ShortFlags
+
+
+def short_flags_example(
+    host: str = 'localhost',
+    hops: int = 1,
+    hidden: bool = False,
+    verbose: bool = False,
+    dry_run: bool = False,
+) -> None:
+    '''Example of options sharing initials.'''
+    pass
+
+
+def get_flags(**kwargs):
+    '''Get option strings of parser built from example.'''
+    parser = Parser(prog='flags', **kwargs)
+    parser.add_arguments(short_flags_example)
+    return [x.option_strings for x in parser._actions]
+
+
+def test_short_flags_case():
+    '''Test first letter then its uppercase is allocated.'''
+    assert get_flags() == [
+        ['-h', '--help'],
+        ['-H', '--host'],
+        ['--hops'],
+        ['--hidden'],
+        ['-v', '--verbose'],
+        ['--dry-run'],
+    ]
+
+
+def test_short_flags_letters():
+    '''Test letters of the name are allocated in turn.'''
+    assert get_flags(short_flags='letters') == [
+        ['-h', '--help'],
+        ['-H', '--host'],
+        ['-o', '--hops'],
+        ['-i', '--hidden'],
+        ['-v', '--verbose'],
+        ['--dry-run'],
+    ]
+
+
+def test_short_flags_none():
+    '''Test short flags are not allocated.'''
+    assert get_flags(short_flags='none')[1:] == [
+        ['--host'],
+        ['--hops'],
+        ['--hidden'],
+        ['--verbose'],
+        ['--dry-run'],
+    ]
+
+
+def test_short_flags_deterministic():
+    '''Test parsers allocate the same flags regardless of build order.'''
+    expected = get_flags()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: get_flags(), range(32)))
+    assert all(x == expected for x in results)
+
+
+def test_short_flags_parser():
+    '''Test flags already used by the parser are not added again.'''
+    parser = Parser(prog='flags')
+    parser.add_argument('-v', '--version', action='store_true')
+    parser.add_arguments(short_flags_example)
+    assert parser.parse_args(['-v', '--verbose']).version is True
+
+
+def test_short_flags_allocator():
+    '''Test allocator resolves collisions in a set.'''
+    flags = ShortFlags(reserved=())
+    assert flags.allocate('name') == '-n'
+    assert flags.allocate('number') == '-N'
+    assert flags.allocate('nested') is None
+    assert flags.taken == {'n', 'N'}
+    with pytest.raises(ValueError):
+        ShortFlags('other')
+    with pytest.raises(ValueError):
+        Parser(short_flags='other')
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+# type: ignore
+'''Test variadic arguments of very long command lines.'''
+
+import sys
+from argparse import ArgumentParser
+from ast import literal_eval
+
+import pytest
+
+from argufy import Parser
+
+sys.path.append('.')
+import variadic_parser  # noqa: E402
+
+ARGUMENTS = [
+    [],
+    ['a'],
+    ['a', 'b', 'c'],
+    ['--verbose', 'a', 'b'],
+    ['-v', '--label', 'y', 'a', 'b'],
+    ['--label=y', 'a'],
+    ['--lab', 'y', 'a'],
+    ['a', '--verbose', 'b'],
+    ['--verbose', '--', '-a', 'b'],
+    ['--label', '-a', 'b'],
+    ['--label'],
+    ['--verbose', '-1', 'a'],
+    ['--unknown', 'a'],
+    ['', 'a', '-'],
+]
+
+
+def get_parser():
+    '''Get parser with variadic commands.'''
+    parser = Parser(prog='variadic')
+    parser.add_commands(variadic_parser)
+    return parser
+
+
+def get_command(parser, name):
+    '''Get parser of command.'''
+    return parser._subparsers._group_actions[0].choices[name]
+
+
+def parse(method, parser, args, capsys):
+    '''Get parsed values or error of parse method.'''
+    try:
+        namespace, extras = method(parser, args)
+        return vars(namespace), extras
+    except SystemExit as err:
+        return err.code, capsys.readouterr().err
+
+
+@pytest.mark.parametrize('args', ARGUMENTS)
+def test_variadic_differential(args, capsys):
+    '''Test variadic tail is parsed the same as argparse.'''
+    command = get_command(get_parser(), 'files')
+    expected = parse(ArgumentParser.parse_known_args, command, args, capsys)
+    assert parse(Parser.parse_known_args, command, args, capsys) == expected
+
+
+@pytest.mark.parametrize('args', ARGUMENTS)
+def test_command_differential(args, capsys):
+    '''Test command line is routed the same as argparse.'''
+    parser = get_parser()
+    args = ['copy', *args]
+    expected = parse(ArgumentParser.parse_known_args, parser, args, capsys)
+    assert parse(Parser.parse_known_args, parser, args, capsys) == expected
+
+
+def test_variadic_large(capsys):
+    '''Test variadic tail of a million values is passed to command.'''
+    paths = [f"file{x}" for x in range(1000000)]
+    get_parser().dispatch(['files', '--label', 'y', *paths])
+    assert literal_eval(capsys.readouterr().out) == {
+        'count': 1000000,
+        'last': ('file999999',),
+        'label': 'y',
+    }
+
+
+def test_variadic_fixed():
+    '''Test positionals before variadic tail are parsed.'''
+    namespace, extras = get_parser().parse_known_args(
+        ['copy', '--force', 'dest', 'a', 'b', 'c']
+    )
+    assert extras == []
+    assert namespace.dest == 'dest'
+    assert namespace.sources == ['a', 'b', 'c']
+    assert namespace.force is True
+
+
+def test_variadic_append(capsys):
+    '''Test variadic tail of an append action is only added once.'''
+    args = ['total', '1', '2', '3']
+    parser = get_parser()
+    expected = parse(ArgumentParser.parse_known_args, parser, args, capsys)
+    assert parse(Parser.parse_known_args, parser, args, capsys) == expected
+    parser.dispatch(args)
+    assert literal_eval(capsys.readouterr().out) == [[1, 2, 3]]
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+# :copyright: (c) 2020 by Jesse Johnson.
+# :license: Apache 2.0, see LICENSE for more details.
+# type: ignore
+'''Test variadic parser.'''
+
+
+def files(*paths, verbose: bool = False, label: str = 'x'):
+    '''Mock command taking any number of paths.
+
+    Parameters
+    ----------
+    paths: str
+        paths to be processed
+    verbose: bool
+        print every path
+    label: str
+        label of the paths
+
+    '''
+    print({'count': len(paths), 'last': paths[-1:], 'label': label})
+
+
+def copy(dest, *sources, force: bool = False):
+    '''Mock command with positional before variadic.
+
+    Parameters
+    ----------
+    dest: str
+        destination of the sources
+    sources: str
+        sources to be copied
+    force: bool
+        overwrite destination
+
+    '''
+    print({'dest': dest, 'count': len(sources), 'force': force})
+
+
+def total(*values: int):
+    '''Mock command appending its variadic values.
+
+    Parameters
+    ----------
+    values: int
+        values to be summed
+
+    '''
+    print(list(values))